@@ -0,0 +1,321 @@
+"""Attention scoring policies, batch and cached scoring.
+
+A ScoringPolicy is a weight per feature. The features are declared once,
+in FEATURES, and a policy compiles them into fused per-process functions
+with its weights inlined. AttentionBatch computes the features for a whole
+ready queue in one pass, as NumPy arrays when NumPy is installed (plain
+lists otherwise), and can score it under many policies at once.
+AttentionCache keeps per-process terms between ticks so only processes
+whose state changed are rescored. Both hand out the same read interface,
+shared by selection, the selection history and every panel that renders
+scores.
+"""
+
+import heapq
+
+# NumPy is optional and only imported by the first batch (see load_numpy), so
+# importing the engine stays cheap; without it batches use plain Python lists
+np = None
+
+# name, per-process expression (of p at time t), whole-batch NumPy expression
+# (of the columns c). Recency must come first: it is the only feature that
+# depends on time, which keeps the attention order of queued processes
+# time-invariant.
+FEATURES = [
+    ("recency", "t - (p.arrival if p.last_executed == -1 else p.last_executed)",
+     "t - np.where(c.last_executed == -1, c.arrival, c.last_executed)"),
+    ("burst", "1 / p.remaining", "1 / c.remaining"),
+    ("fairness", "1 / (1 + p.executed_slices)", "1 / (1 + c.executed_slices)"),
+    ("priority", "1 / (1 + p.priority)", "1 / (1 + c.priority)"),
+]
+FEATURE_NAMES = [name for name, _, _ in FEATURES]
+REFERENCE = "(p.arrival if p.last_executed == -1 else p.last_executed)"
+
+SCALAR_FEATURES = {name: eval(f"lambda p, t: {expr}") for name, expr, _ in FEATURES}
+VECTOR_FEATURES = {}
+_numpy_loaded = False
+
+
+def load_numpy():
+    """Import NumPy on first use; returns it, or None when it is not installed"""
+    global np, _numpy_loaded
+    if not _numpy_loaded:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        if numpy is not None:
+            VECTOR_FEATURES.update(
+                (name, eval(f"lambda c, t: {expr}", {'np': numpy})) for name, _, expr in FEATURES
+            )
+        np = numpy
+        _numpy_loaded = True
+    return np
+
+
+class ScoringPolicy:
+    """Feature weights compiled into fused scoring functions.
+
+    score(p, t), offset(p), static_terms(p) and components(p, t) are built
+    from FEATURES with the weights as constants. Terms with a zero weight
+    are left out, which does not change any score.
+    """
+
+    def __init__(self, name="custom", recency=0.4, burst=0.3, fairness=0.2, priority=0.1):
+        self.name = name
+        self.weights = {'recency': recency, 'burst': burst, 'fairness': fairness, 'priority': priority}
+        self.vector = tuple(self.weights[name] for name in FEATURE_NAMES)
+        self._compile()
+
+    def __repr__(self):
+        weights = ", ".join(f"{name}={weight}" for name, weight in self.weights.items())
+        return f"ScoringPolicy({self.name!r}, {weights})"
+
+    def _compile(self):
+        w = self.weights
+        static = [f"{w[name]!r} * ({expr})" for name, expr, _ in FEATURES[1:] if w[name]]
+        recency = f"{w['recency']!r} * ({FEATURES[0][1]})"
+        reference = f"{-w['recency']!r} * {REFERENCE}"
+        cached = [f"terms[{i}]" for i in range(len(static))]
+        source = "\n".join([
+            "def score(p, t):",
+            f"    return {' + '.join([recency] + static)}",
+            "def offset(p):",
+            f"    return {' + '.join([reference] + static)}",
+            "def static_terms(p):",
+            f"    return ({''.join(term + ', ' for term in static)})",
+            # Same operation order as score(), so cached scores match it exactly
+            "def from_terms(reference, terms, t):",
+            f"    return {' + '.join([repr(w['recency']) + ' * (t - reference)'] + cached)}",
+        ])
+        namespace = {}
+        exec(source, namespace)
+        self.score = namespace['score']
+        self.offset = namespace['offset']
+        self.static_terms = namespace['static_terms']
+        self.from_terms = namespace['from_terms']
+
+    def components(self, p, current_time):
+        """Raw and weighted value of every feature, for display"""
+        result = {}
+        for name, feature in SCALAR_FEATURES.items():
+            value = feature(p, current_time)
+            result[name] = value
+            result[f'{name}_weighted'] = self.weights[name] * value
+        return result
+
+
+DEFAULT_POLICY = ScoringPolicy("default", 0.4, 0.3, 0.2, 0.1)
+
+# Policies selectable by name
+POLICIES = {
+    policy.name: policy for policy in [
+        DEFAULT_POLICY,
+        ScoringPolicy("short-jobs", 0.2, 0.6, 0.1, 0.1),
+        ScoringPolicy("fair", 0.3, 0.1, 0.5, 0.1),
+    ]
+}
+
+
+def get_policy(spec):
+    """A policy from its name or from four comma-separated weights
+    (recency, burst, fairness, priority)"""
+    if isinstance(spec, ScoringPolicy):
+        return spec
+    if spec in POLICIES:
+        return POLICIES[spec]
+    try:
+        weights = [float(w) for w in spec.split(",")]
+    except ValueError:
+        weights = []
+    if len(weights) != len(FEATURES):
+        raise ValueError(f"unknown scoring policy '{spec}'")
+    return ScoringPolicy(spec, *weights)
+
+
+class _Columns:
+    """Process fields as NumPy columns, for the batch feature expressions"""
+
+    def __init__(self, procs):
+        n = len(procs)
+        for field in ('arrival', 'last_executed', 'remaining', 'executed_slices', 'priority'):
+            setattr(self, field, np.fromiter((getattr(p, field) for p in procs), dtype=np.int64, count=n))
+
+
+class AttentionBatch:
+    def __init__(self, procs, current_time, policy=DEFAULT_POLICY):
+        self.procs = list(procs)
+        self.current_time = current_time
+        self.policy = policy
+        self.index = {p.pid: i for i, p in enumerate(self.procs)}
+
+        # Features are computed once, whatever the number of policies scored
+        if load_numpy() is not None:
+            columns = _Columns(self.procs)
+            self.features = {name: feature(columns, current_time) for name, feature in VECTOR_FEATURES.items()}
+        else:
+            self.features = {
+                name: [feature(p, current_time) for p in self.procs]
+                for name, feature in SCALAR_FEATURES.items()
+            }
+        self.scores = self.weighted(policy)
+
+    def weighted(self, policy):
+        """Scores of the batch under policy, in the fused function's operation order"""
+        terms = [(policy.weights[name], self.features[name]) for name in FEATURE_NAMES
+                 if policy.weights[name] or name == FEATURE_NAMES[0]]
+        if np is not None:
+            scores = terms[0][0] * terms[0][1]
+            for weight, feature in terms[1:]:
+                scores = scores + weight * feature
+            return scores
+        scores = [terms[0][0] * v for v in terms[0][1]]
+        for weight, feature in terms[1:]:
+            scores = [s + weight * v for s, v in zip(scores, feature)]
+        return scores
+
+    def sweep(self, policies):
+        """One row of scores per policy (a matrix with NumPy), without recomputing features"""
+        rows = [self.weighted(policy) for policy in policies]
+        return np.vstack(rows) if np is not None and rows else rows
+
+    def __len__(self):
+        return len(self.procs)
+
+    def __contains__(self, p):
+        return p.pid in self.index
+
+    def score(self, p):
+        return float(self.scores[self.index[p.pid]])
+
+    def components(self, p):
+        """Same dict as Process.get_attention_components, read from the batch"""
+        i = self.index[p.pid]
+        result = {}
+        for name in FEATURE_NAMES:
+            value = float(self.features[name][i])
+            result[name] = value
+            result[f'{name}_weighted'] = self.policy.weights[name] * value
+        return result
+
+    def as_dict(self):
+        """pid -> score for every process in the batch"""
+        scores = self.scores.tolist() if np is not None else self.scores
+        return dict(zip((p.pid for p in self.procs), scores))
+
+    def ranked(self):
+        """Processes by descending score, ties kept in batch order"""
+        if np is not None:
+            order = np.argsort(-self.scores, kind='stable').tolist()
+        else:
+            order = sorted(range(len(self.procs)), key=lambda i: self.scores[i], reverse=True)
+        return [self.procs[i] for i in order]
+
+    def top(self, k):
+        """ranked()[:k], by partial selection instead of a full sort"""
+        n = len(self.procs)
+        if k >= n:
+            return self.ranked()
+        if k <= 0:
+            return []
+        scores = self.scores
+        if np is not None:
+            kth = np.partition(scores, n - k)[n - k]
+            above = np.flatnonzero(scores > kth)
+            tied = np.flatnonzero(scores == kth)[:k - len(above)]
+            chosen = np.sort(np.concatenate([above, tied]))
+            order = chosen[np.argsort(-scores[chosen], kind='stable')].tolist()
+        else:
+            order = heapq.nlargest(k, range(n), key=scores.__getitem__)
+        return [self.procs[i] for i in order]
+
+
+def score_batch(procs, current_time, policy=DEFAULT_POLICY):
+    """Score every process in procs at current_time"""
+    return AttentionBatch(procs, current_time, policy)
+
+
+class AttentionCache:
+    """Memoized attention scores with dirty tracking.
+
+    Only the running process changes between ticks, so every other process
+    keeps its cached terms and its score is a linear function of time:
+    recency grows by one unit per tick. Call invalidate() whenever a
+    process's remaining/executed_slices/last_executed change.
+    """
+
+    def __init__(self, policy=DEFAULT_POLICY):
+        self.policy = policy
+        self.terms = {}   # pid -> (reference time, *weighted static terms)
+        self.time = None
+        self.memo = {}    # pid -> score at self.time
+
+    def invalidate(self, p):
+        self.terms.pop(p.pid, None)
+        self.memo.pop(p.pid, None)
+
+    def _terms(self, p):
+        terms = self.terms.get(p.pid)
+        if terms is None:
+            reference = p.arrival if p.last_executed == -1 else p.last_executed
+            terms = (reference, self.policy.static_terms(p))
+            self.terms[p.pid] = terms
+        return terms
+
+    def score(self, p, current_time):
+        if current_time != self.time:
+            self.time = current_time
+            self.memo.clear()
+        score = self.memo.get(p.pid)
+        if score is None:
+            reference, terms = self._terms(p)
+            score = self.policy.from_terms(reference, terms, current_time)
+            self.memo[p.pid] = score
+        return score
+
+    def components(self, p, current_time):
+        return self.policy.components(p, current_time)
+
+    def scores(self, procs, current_time):
+        """Read-only view over procs with the same interface as AttentionBatch"""
+        return CachedScores(self, procs, current_time)
+
+
+class CachedScores:
+    def __init__(self, cache, procs, current_time):
+        self.cache = cache
+        self.current_time = current_time
+        # procs is only copied once something needs the whole set, so a
+        # decision that scores a handful of leaders stays O(1) in queue size
+        self._source = procs
+        self._procs = None
+        self._pids = None
+
+    @property
+    def procs(self):
+        if self._procs is None:
+            self._procs = list(self._source)
+        return self._procs
+
+    def __len__(self):
+        return len(self._source) if self._procs is None else len(self._procs)
+
+    def __contains__(self, p):
+        if self._pids is None:
+            self._pids = {q.pid for q in self.procs}
+        return p.pid in self._pids
+
+    def score(self, p):
+        return self.cache.score(p, self.current_time)
+
+    def components(self, p):
+        return self.cache.components(p, self.current_time)
+
+    def as_dict(self):
+        return {p.pid: self.score(p) for p in self.procs}
+
+    def ranked(self):
+        return sorted(self.procs, key=self.score, reverse=True)
+
+    def top(self, k):
+        return heapq.nlargest(k, self.procs, key=self.score)
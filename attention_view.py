@@ -0,0 +1,190 @@
+"""Attention panel rendering.
+
+Shows the TOP_K best-scored candidates as bars, a count of the others, and
+the score components of the selected process, as recorded in the
+comparison record of the decision that dispatched it. The top K come from a
+partial selection over the scores, so the other candidates are never
+sorted. Canvas items are created once and then moved, restyled or hidden
+on each update instead of being deleted and recreated, and the bar layout
+for each number of visible rows is computed only once.
+"""
+
+TOP_K = 4            # bars that fit above the legend
+ROW_SPACING = 33
+BAR_HEIGHT = 25
+BARS_TOP = 30        # rows are centered between here and BARS_BOTTOM
+BARS_BOTTOM = 162
+LEFT_MARGIN = 50
+BAR_MAX_WIDTH = 220
+RIGHT_START = 380
+COMPONENT_TOP = 40
+COMPONENT_SPACING = 35
+COMPONENT_BAR_HEIGHT = 20
+COMPONENT_MAX_WIDTH = 180
+LEGEND_Y = 185
+
+SELECTED_COLOR = "#E74C3C"
+TRADITIONAL_COLOR = "#F39C12"
+OTHER_COLOR = "#95A5A6"
+COMPONENTS = [
+    # name, key, color
+    ("Recency", "recency", "#3498DB"),
+    ("Burst", "burst", "#2ECC71"),
+    ("Fairness", "fairness", "#F39C12"),
+    ("Priority", "priority", "#9B59B6"),
+]
+
+
+class AttentionChart:
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.items = None
+        self.layouts = {}  # visible rows -> y of each row
+
+    def reset(self):
+        self.canvas.delete("all")
+        self.items = None
+
+    def _create(self):
+        canvas = self.canvas
+        text = canvas.create_text
+        self.items = {
+            'empty': text(400, 100, text="No processes in ready queue", font=("Segoe UI", 13), fill="#95A5A6"),
+            'title': text(LEFT_MARGIN + 110, 15, text="Process Attention Scores",
+                          font=("Segoe UI", 11, "bold"), fill="#8E44AD"),
+            'bars': [
+                (
+                    canvas.create_rectangle(0, 0, 0, 0, outline="#2C3E50", width=2),
+                    text(0, 0, font=("Segoe UI", 10, "bold"), fill="white", anchor="w"),
+                    text(0, 0, font=("Segoe UI", 9, "bold")),
+                )
+                for _ in range(TOP_K)
+            ],
+            'more': text(LEFT_MARGIN, 0, font=("Segoe UI", 9, "italic"), fill="#7F8C8D", anchor="w"),
+            'breakdown': text(RIGHT_START + 110, 15, font=("Segoe UI", 11, "bold"), fill=SELECTED_COLOR),
+            'components': [
+                (
+                    text(RIGHT_START, COMPONENT_TOP + i * COMPONENT_SPACING + COMPONENT_BAR_HEIGHT / 2,
+                         text=f"{name}:", font=("Segoe UI", 9, "bold"), fill="#2C3E50", anchor="w"),
+                    canvas.create_rectangle(0, 0, 0, 0, fill=color, outline="#2C3E50", width=1),
+                    text(0, 0, font=("Segoe UI", 8, "bold"), fill=color),
+                    text(0, 0, font=("Segoe UI", 8), fill="#7F8C8D", anchor="w"),
+                )
+                for i, (name, _, color) in enumerate(COMPONENTS)
+            ],
+            'legend_selected': text(80, LEGEND_Y, text="✓ Attention Choice",
+                                    font=("Segoe UI", 9, "bold"), fill=SELECTED_COLOR, anchor="w"),
+            'legend_traditional': text(240, LEGEND_Y, font=("Segoe UI", 9, "bold"),
+                                       fill=TRADITIONAL_COLOR, anchor="w"),
+        }
+
+    def layout(self, rows):
+        """y of each of rows bars, centered in the bar area"""
+        if rows not in self.layouts:
+            start = BARS_TOP + max(BARS_BOTTOM - BARS_TOP - rows * ROW_SPACING, 0) / 2
+            self.layouts[rows] = [start + i * ROW_SPACING for i in range(rows)]
+        return self.layouts[rows]
+
+    def _show(self, item, visible):
+        self.canvas.itemconfig(item, state="normal" if visible else "hidden")
+
+    def _show_all(self, visible):
+        items = self.items
+        for key in ('title', 'more', 'breakdown', 'legend_selected', 'legend_traditional'):
+            self._show(items[key], visible)
+        for group in items['bars'] + items['components']:
+            for item in group:
+                self._show(item, visible)
+
+    def update(self, scores, selected, comparison, algorithm, total=None):
+        """Draw the top bars of scores (an AttentionBatch or CachedScores).
+
+        selected is the running process and comparison the record of the
+        decision that dispatched it (either may be None); total is the number
+        of candidates the scores stand for, when only some of them were scored.
+        """
+        if self.items is None:
+            self._create()
+        canvas = self.canvas
+        items = self.items
+        if not len(scores):
+            self._show_all(False)
+            self._show(items['empty'], True)
+            return
+        self._show(items['empty'], False)
+        self._show(items['title'], True)
+
+        selected_pid = selected.pid if selected is not None else None
+        if comparison is not None and comparison['selected'] != selected_pid:
+            comparison = None
+        traditional_pid = comparison['traditional'] if comparison is not None else None
+        top = scores.top(TOP_K)
+        top_scores = [scores.score(p) for p in top]
+        max_score = max(top_scores)
+        for (bar, label, value), y, proc, score in zip(items['bars'], self.layout(len(top)), top, top_scores):
+            bar_width = (score / max_score) * BAR_MAX_WIDTH if max_score > 0 else 0
+            if proc.pid == selected_pid:
+                color, prefix = SELECTED_COLOR, "✓ "
+            elif proc.pid == traditional_pid:
+                color, prefix = TRADITIONAL_COLOR, "⚠ "
+            else:
+                color, prefix = OTHER_COLOR, ""
+            canvas.coords(bar, LEFT_MARGIN, y, LEFT_MARGIN + bar_width, y + BAR_HEIGHT)
+            canvas.itemconfig(bar, fill=color, state="normal")
+            canvas.coords(label, LEFT_MARGIN + 10, y + BAR_HEIGHT / 2)
+            canvas.itemconfig(label, text=f"{prefix}P{proc.pid}", state="normal")
+            canvas.coords(value, LEFT_MARGIN + bar_width + 40, y + BAR_HEIGHT / 2)
+            canvas.itemconfig(value, text=f"{score:.3f}", fill=color, state="normal")
+        for group in items['bars'][len(top):]:
+            for item in group:
+                self._show(item, False)
+
+        hidden = (len(scores) if total is None else total) - len(top)
+        if hidden > 0:
+            y = self.layout(len(top))[-1] + BAR_HEIGHT + 4
+            canvas.coords(items['more'], LEFT_MARGIN, y)
+            canvas.itemconfig(items['more'], text=f"+ {hidden} more", state="normal")
+        else:
+            self._show(items['more'], False)
+
+        self.update_breakdown(selected, comparison)
+
+        self._show(items['legend_selected'], True)
+        if comparison is not None and comparison['override']:
+            canvas.itemconfig(items['legend_traditional'], text=f"⚠ Traditional {algorithm} Choice",
+                              state="normal")
+        else:
+            self._show(items['legend_traditional'], False)
+
+    def update_breakdown(self, selected, comparison):
+        """Score components of the selected process when it was picked"""
+        canvas = self.canvas
+        items = self.items
+        visible = comparison is not None
+        self._show(items['breakdown'], visible)
+        for group in items['components']:
+            for item in group:
+                self._show(item, visible)
+        if not visible:
+            return
+
+        components = comparison['components']
+        canvas.itemconfig(items['breakdown'], text=f"P{selected.pid} Component Breakdown")
+        details = {
+            "recency": f"Wait: {components['recency']:.1f}",
+            "burst": f"Rem: {selected.remaining}",
+            "fairness": f"Exec: {selected.executed_slices}",
+            "priority": f"Pri: {selected.priority}",
+        }
+        values = [components[f"{key}_weighted"] for _, key, _ in COMPONENTS]
+        max_component = max(values)
+        for i, ((_, bar, value, detail), (_, key, _), weighted) in enumerate(
+                zip(items['components'], COMPONENTS, values)):
+            y = COMPONENT_TOP + i * COMPONENT_SPACING
+            bar_width = (weighted / max_component) * COMPONENT_MAX_WIDTH if max_component > 0 else 0
+            x = RIGHT_START + 70 + bar_width
+            canvas.coords(bar, RIGHT_START + 70, y, x, y + COMPONENT_BAR_HEIGHT)
+            canvas.coords(value, x + 30, y + COMPONENT_BAR_HEIGHT / 2)
+            canvas.itemconfig(value, text=f"{weighted:.3f}")
+            canvas.coords(detail, x + 75, y + COMPONENT_BAR_HEIGHT / 2)
+            canvas.itemconfig(detail, text=details[key])
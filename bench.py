@@ -0,0 +1,237 @@
+"""Benchmark suite.
+
+Times the scheduling hot paths on synthetic workloads: the engine for each
+base algorithm, attention scoring, and the GUI render functions. The sizes
+default to 10, 1k, 100k and 1M processes. Each case runs in a fresh
+interpreter, so its peak memory is its own. Results are written as JSON.
+A baseline file from an earlier version can be passed with --compare, to
+flag cases that got slower.
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # not available on Windows; peak memory is then omitted
+    resource = None
+
+from attention import DEFAULT_POLICY, load_numpy, score_batch
+from comparison import compare_choices
+from ready_queue import ReadyQueue, attention_key
+from scheduler import ALGORITHMS, SchedulerEngine
+from workload import SYNTHETIC_KINDS, synthetic_workload
+
+SIZES = [10, 1000, 100000, 1000000]
+BENCHMARKS = ["engine", "attention_score", "score_batch",
+              "draw_gantt_chart", "update_queues", "draw_attention_visualization"]
+RENDER_BENCHMARKS = BENCHMARKS[3:]
+CASE_TIMEOUT = 600  # seconds before a case is abandoned
+
+
+def peak_memory_mb():
+    """Peak resident memory of this process so far"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+# -----------------------------
+# Cases
+# -----------------------------
+def bench_engine(kind, n, algorithm, event_driven, seed):
+    engine = SchedulerEngine(algorithm, synthetic_workload(kind, n, seed), keep_details=False)
+    step = engine.advance if event_driven else engine.step
+    start = time.perf_counter()
+    while not engine.finished:
+        step()
+    seconds = time.perf_counter() - start
+    return {
+        "seconds": seconds,
+        "ticks": engine.makespan,
+        "decisions": engine.decisions,
+        "ticks_per_sec": engine.makespan / seconds if seconds else None,
+        "decisions_per_sec": engine.decisions / seconds if seconds else None,
+    }
+
+
+def bench_scoring(benchmark, kind, n, seed):
+    procs = list(synthetic_workload(kind, n, seed))
+    current_time = procs[-1].arrival if procs else 0
+    # Each case runs in a fresh interpreter; keep the one-time NumPy import out of the timing
+    load_numpy()
+    start = time.perf_counter()
+    if benchmark == "attention_score":
+        for p in procs:
+            p.attention_score(current_time)
+    else:
+        score_batch(procs, current_time).ranked()
+    seconds = time.perf_counter() - start
+    return {"seconds": seconds, "ops_per_sec": n / seconds if seconds else None}
+
+
+def bench_render(benchmark, kind, n, seed):
+    # Importing the GUI module builds its (never shown) window
+    import priorities as gui
+
+    procs = list(synthetic_workload(kind, n, seed))
+    current_time = procs[-1].arrival if procs else 0
+    # One back-to-back Gantt segment per process
+    history = []
+    end = 0
+    for p in procs:
+        history.append([p.pid, end, end + p.burst])
+        end += p.burst
+
+    if benchmark == "update_queues":
+        # The panels read their rows off the engine's attention heap
+        ready = ReadyQueue({'attention': attention_key("FCFS")})
+        ready.extend(procs)
+    elif benchmark == "draw_attention_visualization" and procs:
+        # As if FCFS had been overridden in favour of the first process
+        comparison = compare_choices("FCFS", DEFAULT_POLICY, current_time, procs[0], procs[-1],
+                                     procs[0].attention_score(current_time))
+    load_numpy()
+
+    start = time.perf_counter()
+    if benchmark == "draw_gantt_chart":
+        gui.draw_gantt_chart(history, end)
+    elif benchmark == "update_queues":
+        rows = tuple(ready.smallest(gui.ready_view.rows(), 'attention'))
+        gui.update_queues({
+            'ready': rows, 'ready_scores': score_batch(rows, current_time), 'ready_count': len(ready),
+            'ready_offset': 0, 'waiting': (), 'waiting_count': 0, 'waiting_offset': 0, 'completed': 0,
+        })
+    else:
+        gui.draw_attention_visualization(procs, current_time, procs[0] if procs else None, "FCFS",
+                                         comparison=comparison if procs else None)
+    gui.root.update_idletasks()
+    seconds = time.perf_counter() - start
+    return {"seconds": seconds, "ops_per_sec": n / seconds if seconds else None}
+
+
+def run_case(case):
+    """Run one benchmark case and return its result row"""
+    benchmark, kind, n, algorithm, event_driven, seed = case
+    if benchmark == "engine":
+        result = bench_engine(kind, n, algorithm, event_driven, seed)
+    elif benchmark in RENDER_BENCHMARKS:
+        result = bench_render(benchmark, kind, n, seed)
+    else:
+        result = bench_scoring(benchmark, kind, n, seed)
+    result["peak_memory_mb"] = peak_memory_mb()
+    return result
+
+
+def case_key(row):
+    """What makes two result rows the same case (stepped and event-driven runs differ)"""
+    return (row["benchmark"], row["workload"], row["processes"], row["algorithm"], row["event_driven"])
+
+
+def benchmark_cases(benchmarks, kinds, sizes, algorithms, event_driven=True, seed=0):
+    cases = []
+    for benchmark in benchmarks:
+        for kind in kinds:
+            for n in sizes:
+                for algorithm in (algorithms if benchmark == "engine" else [""]):
+                    cases.append((benchmark, kind, n, algorithm, event_driven, seed))
+    return cases
+
+
+def run_suite(cases, timeout=CASE_TIMEOUT, progress=None):
+    """Run each case in its own fresh interpreter; failures and timeouts are recorded, not raised"""
+    context = multiprocessing.get_context("spawn")
+    rows = []
+    for case in cases:
+        benchmark, kind, n, algorithm, event_driven, seed = case
+        row = {"benchmark": benchmark, "workload": kind, "processes": n, "algorithm": algorithm,
+               "event_driven": event_driven, "status": "ok"}
+        pool = context.Pool(1)
+        try:
+            row.update(pool.apply_async(run_case, (case,)).get(timeout))
+        except multiprocessing.TimeoutError:
+            row["status"] = "timeout"
+        except Exception as e:
+            row["status"] = f"error: {e}"
+        finally:
+            pool.terminate()
+            pool.join()
+        rows.append(row)
+        if progress:
+            progress(row)
+    return rows
+
+
+def compare(rows, baseline, tolerance=0.2):
+    """(row, baseline seconds, ratio) for cases at least tolerance slower than the baseline"""
+    previous = {case_key(row): row for row in baseline if row.get("status") == "ok"}
+    slower = []
+    for row in rows:
+        old = previous.get(case_key(row))
+        if row["status"] != "ok" or old is None or not old["seconds"]:
+            continue
+        ratio = row["seconds"] / old["seconds"]
+        if ratio > 1 + tolerance:
+            slower.append((row, old["seconds"], ratio))
+    return slower
+
+
+def environment():
+    numpy = load_numpy()
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": numpy.__version__ if numpy is not None else None,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scheduler's hot paths")
+    parser.add_argument("--benchmarks", nargs="+", default=BENCHMARKS, choices=BENCHMARKS)
+    parser.add_argument("--workloads", nargs="+", default=SYNTHETIC_KINDS, choices=SYNTHETIC_KINDS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--algorithms", nargs="+", default=ALGORITHMS, choices=ALGORITHMS)
+    parser.add_argument("--tick", action="store_true", help="time step() per unit instead of event-driven advance()")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=CASE_TIMEOUT, help="seconds per case")
+    parser.add_argument("--output", help="results JSON (default: stdout)")
+    parser.add_argument("--compare", help="baseline results JSON to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    def progress(row):
+        print(f"{row['benchmark']:<30} {row['workload']:<15} {row['processes']:>8} {row['algorithm']:<12} "
+              f"{row.get('seconds', 0):>9.3f}s {row['status']}", file=sys.stderr)
+
+    cases = benchmark_cases(args.benchmarks, args.workloads, args.sizes, args.algorithms,
+                            not args.tick, args.seed)
+    rows = run_suite(cases, args.timeout, progress)
+    report = {"environment": environment(), "results": rows}
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        slower = compare(rows, baseline, args.tolerance)
+        for row, old_seconds, ratio in slower:
+            print(f"REGRESSION {row['benchmark']} {row['workload']} n={row['processes']} {row['algorithm']}: "
+                  f"{old_seconds:.3f}s -> {row['seconds']:.3f}s ({ratio:.2f}x)", file=sys.stderr)
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""Per-decision comparison records.
+
+Every dispatch produces one record comparing the attention pick with the
+pick of the base algorithm alone: both PIDs, whether attention overrode the
+base algorithm, the reason for the traditional pick and the score
+components of the attention pick. The engine builds it once, stores it in
+the selection log and hands it to the GUI, so the comparison panel, the
+attention chart and the override statistics all read the same record.
+"""
+
+from attention import FEATURE_NAMES
+from ready_queue import TRADITIONAL_INDEX
+
+# What the base algorithm picks by; 'fifo' is the head of the queue (Round Robin)
+CRITERIA = ['fifo', 'arrival', 'remaining', 'priority']
+REASON_TEXT = {
+    'fifo': "first in queue",
+    'arrival': "earliest arrival time ({})",
+    'remaining': "shortest remaining time ({})",
+    'priority': "highest priority ({})",
+}
+
+# Keys of a record's components, raw and weighted per feature
+COMPONENT_KEYS = [key for name in FEATURE_NAMES for key in (name, f'{name}_weighted')]
+
+
+def compare_choices(algorithm, policy, current_time, selected, traditional, attention_score):
+    """Comparison record of one decision (selected and traditional as they were when it was made)"""
+    criterion = TRADITIONAL_INDEX.get(algorithm, 'fifo')
+    return {
+        'time': current_time,
+        'selected': selected.pid,
+        'attention_score': attention_score,
+        'traditional': traditional.pid,
+        'override': selected.pid != traditional.pid,
+        'reason': (criterion, getattr(traditional, criterion) if criterion != 'fifo' else 0),
+        'components': policy.components(selected, current_time),
+    }
+
+
+def describe_reason(reason):
+    """Readable reason for the traditional pick, e.g. "earliest arrival time (3)" """
+    criterion, value = reason
+    return REASON_TEXT[criterion].format(value)
@@ -0,0 +1,364 @@
+"""Gantt chart rendering.
+
+Short runs are drawn incrementally: the canvas item IDs of every segment are
+kept, so each tick only extends the last segment and adds items for new ones,
+and a growing time axis is handled with a single canvas transform.
+
+Long runs, and any zoomed or panned view, switch to level-of-detail
+rendering: only segments intersecting the viewport are materialized (found
+through SegmentIndex in O(log n + k)), and pixel columns covered by more than
+one segment are drawn as density bands shaded by how busy the CPU was.
+"""
+
+from bisect import bisect_left, bisect_right
+
+CANVAS_HEIGHT = 150
+MARGIN = 60
+BAR_HEIGHT = 50
+SHADOW_OFFSET = 2
+COLORS = ["#52B788", "#74C69D", "#95D5B2", "#40916C", "#2D6A4F", "#1B4332", "#52796F", "#6A994E"]
+DENSITY_COLORS = ["#D8F3DC", "#95D5B2", "#52B788", "#2D6A4F"]
+
+# Beyond this many segments (or once a segment is narrower than a pixel) the
+# full-history view is drawn with level of detail instead of item per segment
+MAX_DETAILED_SEGMENTS = 300
+MIN_LABEL_WIDTH = 28   # px needed to label a segment with its PID
+MIN_TIMES_WIDTH = 40   # px needed to label a segment's start and end times
+ZOOM_STEP = 1.25
+
+
+class SegmentIndex:
+    """Interval index over gantt segments.
+
+    Segments on one CPU never overlap and are appended in time order, so the
+    start and end columns are both sorted and a viewport query is two
+    bisections. prefix[i] is the total duration of segments [0, i), used to
+    measure how busy any time range is without visiting its segments.
+    """
+
+    def __init__(self):
+        self.pids = []
+        self.starts = []
+        self.ends = []
+        self.prefix = [0]
+        self.min_duration = None  # shortest segment that can no longer grow
+
+    def __len__(self):
+        return len(self.starts)
+
+    def sync(self, history):
+        """Catch up with a growing history of [pid, start, end] segments"""
+        n = len(self.starts)
+        if n:
+            self.ends[-1] = history[n - 1][2]
+        for pid, start, end in history[n:]:
+            if self.starts:
+                duration = self.ends[-1] - self.starts[-1]
+                self.prefix.append(self.prefix[-1] + duration)
+                if self.min_duration is None or duration < self.min_duration:
+                    self.min_duration = duration
+            self.pids.append(pid)
+            self.starts.append(start)
+            self.ends.append(end)
+
+    def span(self, t0, t1):
+        """Index range [lo, hi) of the segments intersecting [t0, t1)"""
+        lo = bisect_right(self.ends, t0)
+        hi = bisect_left(self.starts, t1)
+        return lo, max(lo, hi)
+
+    def busy(self, t0, t1):
+        """Total time in [t0, t1) covered by segments"""
+        lo, hi = self.span(t0, t1)
+        if hi == lo:
+            return 0
+        total = 0
+        if hi - lo > 2:
+            total += self.prefix[hi - 1] - self.prefix[lo + 1]
+        for i in {lo, hi - 1}:
+            total += min(self.ends[i], t1) - max(self.starts[i], t0)
+        return total
+
+
+class GanttChart:
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.reset()
+
+    def reset(self):
+        """Forget everything drawn so far and clear the canvas"""
+        self.canvas.delete("all")
+        self.items = []        # per segment: (shadow, bar, label, start line, start text, end line, end text)
+        self.ends = []         # end time each drawn segment was last laid out with
+        self.pid_colors = {}
+        self.scale = None
+        self.placeholder = None
+        self.index = SegmentIndex()
+        self.history = []
+        self.current_time = 0
+        self.view = None       # (t0, t1) when zoomed or panned, None to fit the whole run
+        self.detailed = True   # whether items currently hold one set per segment
+        self.drag_x = None
+
+    def width(self):
+        return self.canvas.winfo_width() if self.canvas.winfo_width() > 1 else 950
+
+    def show_placeholder(self):
+        if self.placeholder is None:
+            self.reset()
+            self.placeholder = self.canvas.create_text(
+                self.width() / 2, CANVAS_HEIGHT / 2,
+                text="Gantt Chart - Waiting for processes...",
+                font=("Segoe UI", 13), fill="#95A5A6"
+            )
+
+    def max_time(self):
+        return max(self.current_time, self.history[-1][2] if self.history else 1)
+
+    def update(self, gantt_history, current_time):
+        """Bring the chart up to date with gantt_history (a growing list of [pid, start, end])"""
+        if not gantt_history:
+            self.show_placeholder()
+            return
+        if len(gantt_history) < len(self.index):
+            # History shrank: a new run started without reset()
+            self.reset()
+        if self.placeholder is not None:
+            self.canvas.delete(self.placeholder)
+            self.placeholder = None
+
+        changed_from = self.index.starts[-1] if len(self.index) else 0
+        self.index.sync(gantt_history)
+        self.history = gantt_history
+        self.current_time = current_time
+
+        if self.view is not None:
+            # Only redraw when the part of the run that changed is on screen
+            if changed_from < self.view[1]:
+                self.render_viewport()
+            return
+
+        max_time = self.max_time()
+        scale = (self.width() - 2 * MARGIN) / max(max_time, 1)
+        min_duration = self.index.min_duration
+        if len(self.index) > MAX_DETAILED_SEGMENTS or (min_duration is not None and min_duration * scale < 1):
+            self.render_viewport()
+            return
+
+        if not self.detailed:
+            self.clear_items()
+        if self.scale is not None and scale != self.scale:
+            self.rescale(scale / self.scale)
+        self.scale = scale
+
+        # The last drawn segment may have grown since the previous update
+        if self.items:
+            idx = len(self.items) - 1
+            _, _, end = gantt_history[idx]
+            if end != self.ends[idx]:
+                self.extend_segment(idx, end)
+
+        for pid, start, end in gantt_history[len(self.items):]:
+            self.add_segment(pid, start, end)
+
+    def clear_items(self):
+        self.canvas.delete("gantt")
+        self.items = []
+        self.ends = []
+        self.scale = None
+        self.detailed = True
+
+    def rescale(self, factor):
+        """Stretch every item horizontally around the chart's left margin"""
+        self.canvas.scale("gantt", MARGIN, 0, factor, 1)
+        # Shadows are offset by a fixed number of pixels, not time units
+        self.canvas.move("shadow", SHADOW_OFFSET * (1 - factor), 0)
+
+    def x(self, t):
+        return MARGIN + t * self.scale
+
+    def y_pos(self):
+        # Centered with room for time labels
+        return (CANVAS_HEIGHT - BAR_HEIGHT) / 2 - 10
+
+    def color(self, pid):
+        if pid not in self.pid_colors:
+            self.pid_colors[pid] = COLORS[len(self.pid_colors) % len(COLORS)]
+        return self.pid_colors[pid]
+
+    def add_segment(self, pid, start, end):
+        canvas = self.canvas
+        color = self.color(pid)
+
+        x1 = self.x(start)
+        x2 = self.x(end)
+        y_pos = self.y_pos()
+
+        items = (
+            # Shadow
+            canvas.create_rectangle(
+                x1 + SHADOW_OFFSET, y_pos + SHADOW_OFFSET, x2 + SHADOW_OFFSET, y_pos + BAR_HEIGHT + SHADOW_OFFSET,
+                fill="#BDC3C7", outline="", tags=("gantt", "shadow")
+            ),
+            # Main rectangle
+            canvas.create_rectangle(
+                x1, y_pos, x2, y_pos + BAR_HEIGHT,
+                fill=color, outline="#2C3E50", width=2, tags=("gantt",)
+            ),
+            # Process label
+            canvas.create_text(
+                (x1 + x2) / 2, y_pos + BAR_HEIGHT / 2,
+                text=f"P{pid}", font=("Segoe UI", 11, "bold"), fill="white", tags=("gantt",)
+            ),
+            # Start time line and label
+            canvas.create_line(x1, y_pos + BAR_HEIGHT, x1, y_pos + BAR_HEIGHT + 15, width=2, fill="#34495E", tags=("gantt",)),
+            canvas.create_text(x1, y_pos + BAR_HEIGHT + 28, text=str(start), font=("Segoe UI", 10, "bold"), fill="#2C3E50", tags=("gantt",)),
+            # End time line and label
+            canvas.create_line(x2, y_pos + BAR_HEIGHT, x2, y_pos + BAR_HEIGHT + 15, width=2, fill="#34495E", tags=("gantt",)),
+            canvas.create_text(x2, y_pos + BAR_HEIGHT + 28, text=str(end), font=("Segoe UI", 10, "bold"), fill="#2C3E50", tags=("gantt",)),
+        )
+        self.items.append(items)
+        self.ends.append(end)
+
+    def extend_segment(self, idx, end):
+        canvas = self.canvas
+        shadow, bar, label, _, _, end_line, end_text = self.items[idx]
+        x1 = canvas.coords(bar)[0]
+        x2 = self.x(end)
+        y_pos = self.y_pos()
+
+        canvas.coords(shadow, x1 + SHADOW_OFFSET, y_pos + SHADOW_OFFSET, x2 + SHADOW_OFFSET, y_pos + BAR_HEIGHT + SHADOW_OFFSET)
+        canvas.coords(bar, x1, y_pos, x2, y_pos + BAR_HEIGHT)
+        canvas.coords(label, (x1 + x2) / 2, y_pos + BAR_HEIGHT / 2)
+        canvas.coords(end_line, x2, y_pos + BAR_HEIGHT, x2, y_pos + BAR_HEIGHT + 15)
+        canvas.coords(end_text, x2, y_pos + BAR_HEIGHT + 28)
+        canvas.itemconfig(end_text, text=str(end))
+        self.ends[idx] = end
+
+    # -----------------------------
+    # Level of detail
+    # -----------------------------
+    def viewport(self):
+        return self.view if self.view is not None else (0, self.max_time())
+
+    def render_viewport(self):
+        """Redraw only what intersects the viewport, aggregating sub-pixel segments"""
+        canvas = self.canvas
+        self.canvas.delete("gantt")
+        self.items = []
+        self.ends = []
+        self.scale = None
+        self.detailed = False
+
+        t0, t1 = self.viewport()
+        width_px = self.width() - 2 * MARGIN
+        px = width_px / (t1 - t0)
+        y_pos = self.y_pos()
+        index = self.index
+
+        def x(t):
+            return MARGIN + (min(max(t, t0), t1) - t0) * px
+
+        # Walk pixel columns: a column touched by one segment belongs to that
+        # segment, a column touched by several becomes part of a density band
+        whole = []
+        bands = []   # [first column, last column, level]
+        for col in range(int(width_px)):
+            a = t0 + col / px
+            b = t0 + (col + 1) / px
+            lo, hi = index.span(a, b)
+            if hi - lo == 1:
+                if not whole or whole[-1] != lo:
+                    whole.append(lo)
+            elif hi - lo > 1:
+                busy = index.busy(a, b) * px
+                level = min(int(busy * len(DENSITY_COLORS)), len(DENSITY_COLORS) - 1)
+                if bands and bands[-1][1] == col - 1 and bands[-1][2] == level:
+                    bands[-1][1] = col
+                else:
+                    bands.append([col, col, level])
+
+        for i in whole:
+            pid, start, end = index.pids[i], index.starts[i], index.ends[i]
+            x1 = x(start)
+            x2 = max(x(end), x1 + 1)
+            canvas.create_rectangle(
+                x1, y_pos, x2, y_pos + BAR_HEIGHT,
+                fill=self.color(pid), outline="#2C3E50" if x2 - x1 >= 3 else "", tags=("gantt",)
+            )
+            if x2 - x1 >= MIN_LABEL_WIDTH:
+                canvas.create_text(
+                    (x1 + x2) / 2, y_pos + BAR_HEIGHT / 2,
+                    text=f"P{pid}", font=("Segoe UI", 11, "bold"), fill="white", tags=("gantt",)
+                )
+            if x2 - x1 >= MIN_TIMES_WIDTH:
+                for t in (start, end):
+                    if t0 <= t <= t1:
+                        canvas.create_line(x(t), y_pos + BAR_HEIGHT, x(t), y_pos + BAR_HEIGHT + 15, width=2, fill="#34495E", tags=("gantt",))
+                        canvas.create_text(x(t), y_pos + BAR_HEIGHT + 28, text=str(t), font=("Segoe UI", 10, "bold"), fill="#2C3E50", tags=("gantt",))
+
+        for first, last, level in bands:
+            canvas.create_rectangle(
+                MARGIN + first, y_pos, MARGIN + last + 1, y_pos + BAR_HEIGHT,
+                fill=DENSITY_COLORS[level], outline="", tags=("gantt",)
+            )
+
+        # Viewport bounds
+        for t, anchor in ((t0, "w"), (t1, "e")):
+            canvas.create_text(
+                x(t), y_pos - 12, text=f"{t:g}", anchor=anchor,
+                font=("Segoe UI", 9), fill="#7F8C8D", tags=("gantt",)
+            )
+
+    # -----------------------------
+    # Zoom / pan
+    # -----------------------------
+    def bind(self):
+        canvas = self.canvas
+        canvas.bind("<MouseWheel>", lambda e: self.zoom(ZOOM_STEP if e.delta > 0 else 1 / ZOOM_STEP, e.x))
+        canvas.bind("<Button-4>", lambda e: self.zoom(ZOOM_STEP, e.x))
+        canvas.bind("<Button-5>", lambda e: self.zoom(1 / ZOOM_STEP, e.x))
+        canvas.bind("<ButtonPress-1>", self.start_drag)
+        canvas.bind("<B1-Motion>", self.drag)
+        canvas.bind("<Double-Button-1>", lambda e: self.fit())
+
+    def time_at(self, x_px):
+        t0, t1 = self.viewport()
+        return t0 + (x_px - MARGIN) * (t1 - t0) / (self.width() - 2 * MARGIN)
+
+    def zoom(self, factor, x_px):
+        """Zoom in (factor > 1) or out around the time under x_px"""
+        if not self.history:
+            return
+        t0, t1 = self.viewport()
+        pivot = min(max(self.time_at(x_px), t0), t1)
+        span = min(max((t1 - t0) / factor, 1), self.max_time())
+        start = pivot - (pivot - t0) * span / (t1 - t0)
+        self.set_view(start, start + span)
+
+    def start_drag(self, event):
+        self.drag_x = event.x
+
+    def drag(self, event):
+        if not self.history or self.drag_x is None:
+            return
+        t0, t1 = self.viewport()
+        shift = (self.drag_x - event.x) * (t1 - t0) / (self.width() - 2 * MARGIN)
+        self.drag_x = event.x
+        self.set_view(t0 + shift, t1 + shift)
+
+    def set_view(self, t0, t1):
+        span = t1 - t0
+        t0 = min(max(t0, 0), max(self.max_time() - span, 0))
+        self.view = (t0, t0 + span)
+        if t0 <= 0 and span >= self.max_time():
+            self.fit()
+        else:
+            self.render_viewport()
+
+    def fit(self):
+        """Go back to showing the whole run"""
+        self.view = None
+        if self.history:
+            self.clear_items()
+            self.update(self.history, self.current_time)
@@ -0,0 +1,142 @@
+"""Command-line entry point.
+
+    python main.py                       open the GUI
+    python main.py simulate --algo SJF --input trace.csv
+    python main.py batch|tune|bench ...  the experiment, tuning and benchmark tools
+
+Only the GUI command imports Tk (through priorities), so the headless
+commands start quickly and run without a display.
+"""
+
+import argparse
+import importlib
+import json
+import sys
+
+from scheduler import ALGORITHMS, simulate
+from workload import WorkloadError, load_workload, stream_workload
+
+# Subcommands handled by another module's main(argv)
+TOOLS = {
+    "batch": "Run every algorithm over many workload files in parallel",
+    "tune": "Tune the attention weights on a workload corpus",
+    "bench": "Benchmark the engine, scoring and render functions",
+}
+
+
+def positive_int(text):
+    """argparse type for counts that must be at least 1"""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def run_gui():
+    try:
+        import tkinter
+    except ImportError as e:
+        print(f"cannot open the GUI: {e}", file=sys.stderr)
+        return 2
+    try:
+        import priorities
+    except tkinter.TclError as e:
+        print(f"cannot open the GUI: {e}", file=sys.stderr)
+        return 2
+    priorities.root.mainloop()
+    return 0
+
+
+def summary(result):
+    lines = [
+        f"Algorithm:       {result['algorithm']}",
+        f"Processes:       {result['processes']}",
+        f"Makespan:        {result['makespan']}",
+        f"Avg waiting:     {result['avg_waiting']:.2f}",
+        f"Avg turnaround:  {result['avg_turnaround']:.2f}",
+        f"Decisions:       {result['decisions']}",
+        f"Overrides:       {result['overrides']}",
+        f"Preemptions:     {result['preemptions']}",
+    ]
+    if 'utilization' in result:
+        lines.append(f"CPUs:            {result['cpus']} ({result['steals']} steals)")
+        lines.append("Utilization:     " + " ".join(f"{u:.0%}" for u in result['utilization']))
+    return "\n".join(lines)
+
+
+def to_json(result, history):
+    result = dict(result)
+    selection_history = result.pop('selection_history')
+    if history:
+        result['selection_history'] = list(selection_history)
+    return json.dumps(result, indent=2)
+
+
+def run_simulate(args):
+    try:
+        if args.stream:
+            procs = stream_workload(args.input)
+        else:
+            procs = load_workload(args.input)
+        trace = None
+        if args.trace:
+            from sim_trace import TraceWriter
+            trace = TraceWriter(args.trace)
+        result = simulate(args.algo, procs, args.quantum, event_driven=not args.tick,
+                          keep_details=not args.stream, trace=trace, policy=args.policy,
+                          cpus=args.cpus, per_cpu_queues=args.per_cpu_queues,
+                          work_stealing=not args.no_stealing, preempt_threshold=args.preempt_threshold)
+    except (OSError, WorkloadError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    text = to_json(result, args.history) if args.format == "json" else summary(result)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in TOOLS:
+        return importlib.import_module(argv[0]).main(argv[1:])
+
+    parser = argparse.ArgumentParser(description="CPU scheduling visualizer with an attention layer")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("gui", help="Open the visualizer (the default)")
+
+    sim = commands.add_parser("simulate", help="Run one workload headlessly and print its results")
+    sim.add_argument("--algo", required=True, choices=ALGORITHMS)
+    sim.add_argument("--input", required=True, help="CSV or JSONL workload file")
+    sim.add_argument("--quantum", type=positive_int, default=2, help="Round Robin quantum")
+    sim.add_argument("--policy", help="attention weights: a policy name or recency,burst,fairness,priority")
+    sim.add_argument("--preempt-threshold", type=float,
+                     help="preempt the running process when an arrival leaves a queued score this much higher")
+    sim.add_argument("--cpus", type=positive_int, default=1)
+    sim.add_argument("--per-cpu-queues", action="store_true", help="one run queue per CPU")
+    sim.add_argument("--no-stealing", action="store_true", help="idle CPUs do not steal from other queues")
+    sim.add_argument("--tick", action="store_true", help="step one time unit at a time")
+    sim.add_argument("--stream", action="store_true",
+                     help="read the (arrival-sorted) workload lazily and keep running totals only")
+    sim.add_argument("--trace", help="record the run to this trace file")
+    sim.add_argument("--format", choices=["summary", "json"], default="summary")
+    sim.add_argument("--history", action="store_true", help="include the selection history in JSON output")
+    sim.add_argument("--output", help="write the results here instead of stdout")
+
+    for name, help_text in TOOLS.items():
+        commands.add_parser(name, help=help_text, add_help=False)
+
+    args = parser.parse_args(argv)
+    if args.command == "simulate":
+        return run_simulate(args)
+    return run_gui()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
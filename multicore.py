@@ -0,0 +1,256 @@
+"""Multi-CPU scheduling engine.
+
+MultiCoreEngine runs the same decide()/execute() cycle as SchedulerEngine
+on K CPUs. Every idle CPU gets a process at each decision: with one shared
+ready queue, the idle CPUs (lowest numbered first) take the top attention
+picks in order. With per-CPU run queues, arrivals are spread round-robin
+over the queues, a Round Robin slice returns to the queue of the CPU it ran
+on, and an idle CPU with an empty queue steals the best process from the
+longest queue (unless work stealing is off).
+
+Slices are never interrupted, so a running process is only updated when its
+slice ends. Slice ends sit in a heap, as do idle CPUs and queue lengths, so
+a decision point costs O(log K) per CPU involved rather than O(K).
+"""
+
+import heapq
+
+from comparison import compare_choices
+from ready_queue import ReadyQueue, TRADITIONAL_INDEX
+from scheduler import SchedulerEngine
+
+
+class MultiCoreEngine(SchedulerEngine):
+    def __init__(self, algorithm, procs, cpus=2, quantum=2, per_cpu_queues=False, work_stealing=True,
+                 selection_history=None, keep_details=True, profiler=None, policy=None, preempt_threshold=None):
+        if cpus < 1:
+            raise ValueError("at least one CPU is needed")
+        super().__init__(algorithm, procs, quantum, selection_history, keep_details,
+                         profiler=profiler, policy=policy, preempt_threshold=preempt_threshold)
+        if self.preempts:
+            raise ValueError("preemptive scheduling runs on a single CPU only")
+        self.cpus = cpus
+        self.per_cpu_queues = per_cpu_queues
+        self.work_stealing = work_stealing
+        self.queues = [ReadyQueue(self.indexes, self.ties) for _ in range(cpus)] if per_cpu_queues else None
+        self.queued = 0             # processes across the per-CPU queues
+        self.next_queue = 0         # round-robin cursor for arrivals
+        self.lengths = []           # heap of (-queue length, cpu), stale entries skipped
+        self.dirty = set()          # CPUs to look at in the next decision (no work stealing)
+        self.running = [None] * cpus
+        self.slice_start = [0] * cpus
+        self.ends = []              # heap of (slice end, cpu) for busy CPUs
+        # Idle CPUs, lowest first; without work stealing an idle CPU only
+        # runs work from its own queue, so only the count is needed
+        self.idle = list(range(cpus)) if self.shared_idle else []
+        self.idle_count = cpus
+        self.lanes = [[] for _ in range(cpus)]
+        self.busy = [0] * cpus
+        self.steals = 0
+
+    @property
+    def shared_idle(self):
+        return not self.per_cpu_queues or self.work_stealing
+
+    def has_queued(self):
+        return self.queued > 0 if self.per_cpu_queues else bool(self.ready)
+
+    # -----------------------------
+    # Run queues
+    # -----------------------------
+    def admit(self, current_time):
+        arrived = self.take_arrivals(current_time)
+        if self.per_cpu_queues:
+            for p in arrived:
+                self.enqueue(self.next_queue, p)
+                self.next_queue = (self.next_queue + 1) % self.cpus
+        else:
+            self.ready.extend(arrived)
+        return arrived
+
+    def enqueue(self, cpu, p):
+        self.queues[cpu].push(p)
+        self.queued += 1
+        self._note_length(cpu)
+        self.dirty.add(cpu)
+
+    def _note_length(self, cpu):
+        heapq.heappush(self.lengths, (-len(self.queues[cpu]), cpu))
+        if len(self.lengths) > 4 * self.cpus + 64:
+            self.lengths = [(-len(queue), i) for i, queue in enumerate(self.queues) if queue]
+            heapq.heapify(self.lengths)
+
+    def longest_queue(self):
+        """CPU whose run queue is longest (lowest numbered on ties), or None if all are empty"""
+        lengths = self.lengths
+        while lengths:
+            length, cpu = lengths[0]
+            if length and -length == len(self.queues[cpu]):
+                return cpu
+            heapq.heappop(lengths)
+        return None
+
+    # -----------------------------
+    # Decisions
+    # -----------------------------
+    def dispatch(self, cpu, queue, event, stolen_from=None):
+        """Give cpu the attention pick of queue"""
+        current_time = event['time']
+        leaders = queue.near_top('attention')
+        traditional = queue.peek(TRADITIONAL_INDEX.get(self.algorithm))
+        scores = self.attention.scores(queue, current_time)
+        selected = max(leaders, key=scores.score)
+        candidates = self.top_candidates(scores, selected, queue)
+        queue.remove(selected)
+        if self.per_cpu_queues:
+            self.queued -= 1
+            self._note_length(cpu if stolen_from is None else stolen_from)
+
+        selection_record = compare_choices(self.algorithm, self.policy, current_time, selected,
+                                           traditional, scores.score(selected))
+        selection_record['cpu'] = cpu
+        selection_record['candidates'] = candidates
+        if stolen_from is not None:
+            selection_record['stolen_from'] = stolen_from
+        self.comparison = selection_record
+        self.decisions += 1
+        if selection_record['override']:
+            self.overrides += 1
+        if self.keep_details:
+            self.selection_history.append(selection_record)
+
+        self.running[cpu] = selected
+        self.idle_count -= 1
+        self.slice_start[cpu] = current_time
+        slice_length = min(self.quantum if self.algorithm == "Round Robin" else selected.remaining,
+                           selected.remaining)
+        heapq.heappush(self.ends, (current_time + slice_length, cpu))
+        if selected.start is None:
+            selected.start = current_time
+        event['dispatched'].append((cpu, selected))
+        event['records'].append(selection_record)
+
+    def decide(self):
+        """Admit arrivals and give every idle CPU a process, if there is one"""
+        current_time = self.time
+        event = {
+            'time': current_time,
+            'arrived': self.admit(current_time),
+            'dispatched': [],   # (cpu, process)
+            'records': [],
+            'running': self.running,
+            'finished': [],
+            'preempted': [],
+        }
+
+        if not self.per_cpu_queues:
+            while self.idle and self.ready:
+                self.dispatch(heapq.heappop(self.idle), self.ready, event)
+        elif self.work_stealing:
+            while self.idle and self.queued:
+                cpu = heapq.heappop(self.idle)
+                if self.queues[cpu]:
+                    self.dispatch(cpu, self.queues[cpu], event)
+                else:
+                    victim = self.longest_queue()
+                    self.steals += 1
+                    self.dispatch(cpu, self.queues[victim], event, stolen_from=victim)
+        else:
+            for cpu in sorted(self.dirty):
+                if self.running[cpu] is None and self.queues[cpu]:
+                    self.dispatch(cpu, self.queues[cpu], event)
+        self.dirty.clear()
+        return event
+
+    def next_event_span(self, event):
+        """Time units until the next slice ends or, while a CPU is idle, the next arrival"""
+        span = self.ends[0][0] - event['time'] if self.ends else None
+        if self.idle_count and self.has_waiting():
+            until_arrival = max(self.arrivals[self.next_arrival].arrival - event['time'], 1)
+            span = until_arrival if span is None else min(span, until_arrival)
+        return span or 1
+
+    def execute(self, event, span=1):
+        """Advance the clock by span and settle every slice that ends by then"""
+        current_time = event['time']
+        end_time = current_time + span
+        event['span'] = span
+
+        preempted = []
+        while self.ends and self.ends[0][0] <= end_time:
+            _, cpu = heapq.heappop(self.ends)
+            p = self.running[cpu]
+            start = self.slice_start[cpu]
+            length = end_time - start
+            p.executed_slices += length
+            p.last_executed = end_time - 1
+            p.remaining -= length
+            self.attention.invalidate(p)
+
+            lane = self.lanes[cpu]
+            if not lane or lane[-1][0] != p.pid or lane[-1][2] != start:
+                if not self.keep_details:
+                    lane.clear()
+                lane.append([p.pid, start, end_time])
+            else:
+                lane[-1][2] = end_time
+            self.busy[cpu] += length
+            self.makespan = end_time
+
+            if p.remaining == 0:
+                p.finish = end_time
+                p.turnaround_time = p.finish - p.arrival
+                p.waiting_time = p.turnaround_time - p.burst
+                self.completed_count += 1
+                self.total_waiting += p.waiting_time
+                self.total_turnaround += p.turnaround_time
+                if self.keep_details:
+                    self.completed.append(p)
+                event['finished'].append(p)
+            else:
+                preempted.append((cpu, p))
+            self.running[cpu] = None
+            self.idle_count += 1
+            self.dirty.add(cpu)
+            if self.shared_idle:
+                heapq.heappush(self.idle, cpu)
+
+        if preempted:
+            # As on one CPU, processes arriving by the end of the slice queue up first
+            event['arrived'] = event['arrived'] + self.admit(end_time)
+            for cpu, p in preempted:
+                if self.per_cpu_queues:
+                    self.enqueue(cpu, p)
+                else:
+                    self.ready.append(p)
+            event['preempted'] = [p for _, p in preempted]
+
+        if not self.has_waiting() and not self.has_queued() and self.idle_count == self.cpus:
+            self.finished = True
+            self.time = end_time - 1
+        else:
+            self.time = end_time
+        return event
+
+    # -----------------------------
+    # Results
+    # -----------------------------
+    def utilization(self):
+        """Fraction of the run each CPU spent executing"""
+        return [busy / self.makespan if self.makespan else 0.0 for busy in self.busy]
+
+    def results(self):
+        """SchedulerEngine.results() plus one Gantt lane and utilization figure per CPU.
+
+        'gantt' holds every lane's segments merged in start order.
+        """
+        result = super().results()
+        lanes = [[(pid, start, end) for pid, start, end in lane] for lane in self.lanes]
+        result.update({
+            'gantt': sorted((segment for lane in lanes for segment in lane), key=lambda s: (s[1], s[2])),
+            'cpus': self.cpus,
+            'lanes': lanes,
+            'utilization': self.utilization(),
+            'steals': self.steals,
+        })
+        return result
@@ -1,77 +1,34 @@
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
-import copy
-
-# -----------------------------
-# Data Model
-# -----------------------------
-class Process:
-    def __init__(self, pid, arrival, burst, priority):
-        self.pid = pid
-        self.arrival = arrival
-        self.burst = burst
-        self.priority = priority
-        self.remaining = burst
-        self.start = None
-        self.finish = None
-        self.waiting_time = 0
-        self.turnaround_time = 0
-        self.executed_slices = 0
-        self.last_executed = -1
-
-    def attention_score(self, current_time, history_length):
-        # How long it has been waiting since last execution
-        if self.last_executed == -1:
-            recency = current_time - self.arrival
-        else:
-            recency = current_time - self.last_executed
-
-        # Penalize CPU hogs
-        fairness = 1 / (1 + self.executed_slices)
-
-        # Prefer shorter remaining jobs
-        burst_factor = 1 / self.remaining
-
-        # Priority still matters, but less
-        priority_factor = 1 / (1 + self.priority)
-
-        # Attention-style weighted context
-        return (
-            0.4 * recency +
-            0.3 * burst_factor +
-            0.2 * fairness +
-            0.1 * priority_factor
-        )
-    
-    def get_attention_components(self, current_time):
-        """Get individual components of attention score for visualization"""
-        if self.last_executed == -1:
-            recency = current_time - self.arrival
-        else:
-            recency = current_time - self.last_executed
-        
-        fairness = 1 / (1 + self.executed_slices)
-        burst_factor = 1 / self.remaining
-        priority_factor = 1 / (1 + self.priority)
-        
-        return {
-            'recency': recency,
-            'recency_weighted': 0.4 * recency,
-            'burst': burst_factor,
-            'burst_weighted': 0.3 * burst_factor,
-            'fairness': fairness,
-            'fairness_weighted': 0.2 * fairness,
-            'priority': priority_factor,
-            'priority_weighted': 0.1 * priority_factor
-        }
-
-
-processes = []
+from tkinter import filedialog
+from time import perf_counter
+
+from process import ProcessTable
+from scheduler import ALGORITHMS, SchedulerEngine
+from attention import POLICIES, score_batch
+from workload import parse_process
+from gantt_view import GanttChart
+from attention_view import AttentionChart
+from comparison import describe_reason
+from queue_view import QueueView
+from sim_worker import SimulationWorker, SPEEDS, FRAME_MS
+from selection_log import SelectionLog
+from sim_trace import TraceWriter, TraceReplay
+from profiling import PhaseProfiler
+
+
+# Attention preemption thresholds offered in the toolbar
+PREEMPT_THRESHOLDS = {"Off": None, "0.05": 0.05, "0.1": 0.1, "0.2": 0.2}
+
+processes = ProcessTable()
 animation_running = False
 animation_id = None
-selection_history = []
+selection_history = SelectionLog()
 resume_callback = None
+simulation_worker = None
+replay = None
+profiler = None
 
 # -----------------------------
 # UI State Management
@@ -91,6 +48,7 @@ def update_button_states():
         add_button.config(state="normal")
         run_button.config(state="normal" if processes else "disabled")
         stop_button.config(text="⏸ Pause", state="disabled")
+    replay_button.config(state="disabled" if animation_running else "normal")
 
 # -----------------------------
 # UI Functions
@@ -105,8 +63,8 @@ def open_add_process():
     processes.clear()
     selection_history.clear()
     paused = False
-    gantt_canvas.delete("all")
-    attention_canvas.delete("all")
+    gantt_chart.reset()
+    attention_chart.reset()
     comparison_text.config(state="normal")
     comparison_text.delete("1.0", tk.END)
     comparison_text.config(state="disabled")
@@ -231,17 +189,14 @@ def open_add_process():
                 return
 
             try:
-                arr = int(arrival)
-                bur = int(burst)
-                pri = int(priority)
-                if arr < 0 or bur <= 0 or pri < 0:
-                    raise ValueError
-            except ValueError:
-                messagebox.showerror("Error", f"Invalid values for PID '{pid}'!")
+                proc = parse_process(pid, arrival, burst, priority)
+            except ValueError as e:
+                detail = f"\n\n{e}" if str(e) else ""
+                messagebox.showerror("Error", f"Invalid values for PID '{pid}'!{detail}")
                 return
 
             new_pids.add(pid)
-            batch.append(Process(pid, arr, bur, pri))
+            batch.append(proc)
 
         if not batch:
             messagebox.showwarning("Warning", "No valid processes to add!")
@@ -285,276 +240,36 @@ def open_add_process():
     delete_btn.pack(side="left", padx=8)
 
 
-def draw_attention_visualization(ready_queue, current_time, selected_process, algorithm):
-    """Draw comprehensive attention score visualization"""
-    attention_canvas.delete("all")
-    
-    if not ready_queue:
-        attention_canvas.create_text(
-            400, 100,
-            text="No processes in ready queue",
-            font=("Segoe UI", 13), fill="#95A5A6"
-        )
-        return
-    
-    canvas_width = 800
-    canvas_height = 220
-    
-    # Calculate scores for all processes
-    process_scores = []
-    for p in ready_queue:
-        score = p.attention_score(current_time, 0)
-        components = p.get_attention_components(current_time)
-        process_scores.append((p, score, components))
-    
-    # Sort by attention score (descending)
-    process_scores.sort(key=lambda x: x[1], reverse=True)
-    
-    # Find traditional algorithm choice for comparison
-    traditional_choice = None
-    if algorithm == "FCFS":
-        traditional_choice = min(ready_queue, key=lambda p: p.arrival)
-    elif algorithm == "SJF":
-        traditional_choice = min(ready_queue, key=lambda p: p.remaining)
-    elif algorithm == "Priority":
-        traditional_choice = min(ready_queue, key=lambda p: p.priority)
-    elif algorithm == "Round Robin":
-        traditional_choice = ready_queue[0]
-    
-    # Calculate centering offset for left section
-    num_processes = len(process_scores)
-    total_left_height = num_processes * 33  # bar_height + spacing
-    left_start_y = max(40, (canvas_height - total_left_height) / 2 + 20)
-    
-    # === LEFT SIDE: Attention Scores Bar Chart (CENTERED) ===
-    left_margin = 50
-    bar_height = 25
-    max_score = max(score for _, score, _ in process_scores) if process_scores else 1
-    bar_max_width = 220
-    
-    # Title
-    attention_canvas.create_text(
-        left_margin + 110, 15,
-        text="Process Attention Scores",
-        font=("Segoe UI", 11, "bold"),
-        fill="#8E44AD"
-    )
-    
-    for idx, (proc, score, components) in enumerate(process_scores):
-        y = left_start_y + idx * 33
-        bar_width = (score / max_score) * bar_max_width if max_score > 0 else 0
-        
-        # Determine color
-        if proc == selected_process:
-            color = "#E74C3C"  # Red for SELECTED
-            text_color = "white"
-            prefix = "✓ "
-        elif proc == traditional_choice and proc != selected_process:
-            color = "#F39C12"  # Orange for what traditional would pick
-            text_color = "white"
-            prefix = "⚠ "
-        else:
-            color = "#95A5A6"  # Gray for others
-            text_color = "white"
-            prefix = ""
-        
-        # Draw bar
-        attention_canvas.create_rectangle(
-            left_margin, y, left_margin + bar_width, y + bar_height,
-            fill=color, outline="#2C3E50", width=2
-        )
-        
-        # Process label inside bar
-        attention_canvas.create_text(
-            left_margin + 10, y + bar_height/2,
-            text=f"{prefix}P{proc.pid}",
-            font=("Segoe UI", 10, "bold"),
-            fill=text_color,
-            anchor="w"
-        )
-        
-        # Score value at end of bar
-        attention_canvas.create_text(
-            left_margin + bar_width + 40, y + bar_height/2,
-            text=f"{score:.3f}",
-            font=("Segoe UI", 9, "bold"),
-            fill=color
-        )
-    
-    # === RIGHT SIDE: Component Breakdown for Selected Process ===
-    if selected_process:
-        selected_components = selected_process.get_attention_components(current_time)
-        
-        right_start = 380
-        component_start_y = 40
-        component_bar_height = 20
-        component_max_width = 180
-        
-        # Title
-        attention_canvas.create_text(
-            right_start + 110, 15,
-            text=f"P{selected_process.pid} Component Breakdown",
-            font=("Segoe UI", 11, "bold"),
-            fill="#E74C3C"
-        )
-        
-        components_display = [
-            ("Recency", selected_components['recency_weighted'], "#3498DB", 
-             f"Wait: {selected_components['recency']:.1f}"),
-            ("Burst", selected_components['burst_weighted'], "#2ECC71",
-             f"Rem: {selected_process.remaining}"),
-            ("Fairness", selected_components['fairness_weighted'], "#F39C12",
-             f"Exec: {selected_process.executed_slices}"),
-            ("Priority", selected_components['priority_weighted'], "#9B59B6",
-             f"Pri: {selected_process.priority}")
-        ]
-        
-        max_component = max(c[1] for c in components_display)
-        
-        for idx, (name, value, color, detail) in enumerate(components_display):
-            y = component_start_y + idx * 35
-            bar_width = (value / max_component) * component_max_width if max_component > 0 else 0
-            
-            # Label
-            attention_canvas.create_text(
-                right_start, y + component_bar_height/2,
-                text=f"{name}:",
-                font=("Segoe UI", 9, "bold"),
-                fill="#2C3E50",
-                anchor="w"
-            )
-            
-            # Bar
-            attention_canvas.create_rectangle(
-                right_start + 70, y, right_start + 70 + bar_width, y + component_bar_height,
-                fill=color, outline="#2C3E50", width=1
-            )
-            
-            # Value
-            attention_canvas.create_text(
-                right_start + 70 + bar_width + 30, y + component_bar_height/2,
-                text=f"{value:.3f}",
-                font=("Segoe UI", 8, "bold"),
-                fill=color
-            )
-            
-            # Detail
-            attention_canvas.create_text(
-                right_start + 70 + bar_width + 75, y + component_bar_height/2,
-                text=detail,
-                font=("Segoe UI", 8),
-                fill="#7F8C8D",
-                anchor="w"
-            )
-    
-    # === BOTTOM: Legend ===
-    legend_y = 185
-    attention_canvas.create_text(
-        80, legend_y,
-        text="✓ Attention Choice",
-        font=("Segoe UI", 9, "bold"),
-        fill="#E74C3C",
-        anchor="w"
-    )
-    
-    if traditional_choice and traditional_choice != selected_process:
-        attention_canvas.create_text(
-            240, legend_y,
-            text=f"⚠ Traditional {algorithm} Choice",
-            font=("Segoe UI", 9, "bold"),
-            fill="#F39C12",
-            anchor="w"
-        )
+def draw_attention_visualization(candidates, current_time, selected_process, algorithm, scores=None,
+                                 comparison=None, total=None):
+    """Draw the top attention scores and the selected process's score components.
+
+    comparison is the record of the decision that dispatched the selected
+    process; total is the number of candidates when candidates only holds
+    the best few (plus the selected process).
+    """
+    if scores is None:
+        scores = score_batch(candidates, current_time)
+    attention_chart.update(scores, selected_process, comparison, algorithm, total)
 
 
 def draw_gantt_chart(gantt_history, current_time):
     """Draw Gantt chart up to current time with all start and end times"""
-    gantt_canvas.delete("all")
-    
-    canvas_width = gantt_canvas.winfo_width() if gantt_canvas.winfo_width() > 1 else 950
-    canvas_height = 150
-    
-    if not gantt_history:
-        gantt_canvas.create_text(
-            canvas_width / 2, canvas_height / 2, 
-            text="Gantt Chart - Waiting for processes...", 
-            font=("Segoe UI", 13), fill="#95A5A6"
-        )
-        return
-
-    max_time = max(current_time, max([end for _, _, end in gantt_history]) if gantt_history else 1)
-    margin = 60
-    scale = (canvas_width - 2 * margin) / max(max_time, 1)
-
-    colors = ["#52B788", "#74C69D", "#95D5B2", "#40916C", "#2D6A4F", "#1B4332", "#52796F", "#6A994E"]
-    
-    # Center the gantt chart vertically
-    height = 50
-    y_pos = (canvas_height - height) / 2 - 10  # Centered with room for time labels
-
-    pid_color_map = {}
-    color_idx = 0
-    
-    for idx, (pid, start, end) in enumerate(gantt_history):
-        if pid not in pid_color_map:
-            pid_color_map[pid] = colors[color_idx % len(colors)]
-            color_idx += 1
-        
-        x1 = margin + start * scale
-        x2 = margin + end * scale
-        color = pid_color_map[pid]
-        
-        # Draw shadow
-        gantt_canvas.create_rectangle(
-            x1 + 2, y_pos + 2, x2 + 2, y_pos + height + 2, 
-            fill="#BDC3C7", outline=""
-        )
-        # Draw main rectangle
-        gantt_canvas.create_rectangle(
-            x1, y_pos, x2, y_pos + height, 
-            fill=color, outline="#2C3E50", width=2
-        )
-        
-        # Draw process label
-        gantt_canvas.create_text(
-            (x1 + x2) / 2, y_pos + height / 2, 
-            text=f"P{pid}", font=("Segoe UI", 11, "bold"), fill="white"
-        )
-        
-        # Always draw start time line and label for each segment
-        gantt_canvas.create_line(x1, y_pos + height, x1, y_pos + height + 15, width=2, fill="#34495E")
-        gantt_canvas.create_text(x1, y_pos + height + 28, text=str(start), font=("Segoe UI", 10, "bold"), fill="#2C3E50")
-        
-        # Always draw end time line and label for each segment
-        gantt_canvas.create_line(x2, y_pos + height, x2, y_pos + height + 15, width=2, fill="#34495E")
-        gantt_canvas.create_text(x2, y_pos + height + 28, text=str(end), font=("Segoe UI", 10, "bold"), fill="#2C3E50")
+    gantt_chart.update(gantt_history, current_time)
 
 
-def update_comparison_text(algorithm, selected_process, ready_queue, current_time):
+def update_comparison_text(algorithm, selected_process, comparison):
     """Update the comparison text showing why attention made a different choice"""
     comparison_text.config(state="normal")
     comparison_text.delete("1.0", tk.END)
     
-    if not selected_process or not ready_queue:
+    if not selected_process or not comparison:
         comparison_text.config(state="disabled")
         return
     
-    # Determine what traditional algorithm would pick
-    traditional_choice = None
-    traditional_reason = ""
-    
-    if algorithm == "FCFS":
-        traditional_choice = min(ready_queue, key=lambda p: p.arrival)
-        traditional_reason = f"earliest arrival time ({traditional_choice.arrival})"
-    elif algorithm == "SJF":
-        traditional_choice = min(ready_queue, key=lambda p: p.remaining)
-        traditional_reason = f"shortest remaining time ({traditional_choice.remaining})"
-    elif algorithm == "Priority":
-        traditional_choice = min(ready_queue, key=lambda p: p.priority)
-        traditional_reason = f"highest priority ({traditional_choice.priority})"
-    elif algorithm == "Round Robin":
-        traditional_choice = ready_queue[0]
-        traditional_reason = "first in queue"
+    traditional_pid = comparison['traditional']
+    traditional_reason = describe_reason(comparison['reason'])
+    selected_score = comparison['attention_score']
     
     comparison_text.tag_config("header", foreground="#8E44AD", font=("Segoe UI", 11, "bold"))
     comparison_text.tag_config("attention", foreground="#E74C3C", font=("Segoe UI", 10, "bold"))
@@ -562,25 +277,25 @@ def update_comparison_text(algorithm, selected_process, ready_queue, current_tim
     comparison_text.tag_config("same", foreground="#27AE60", font=("Segoe UI", 10, "bold"))
     comparison_text.tag_config("detail", foreground="#34495E", font=("Segoe UI", 9))
     
-    if traditional_choice == selected_process:
+    if not comparison['override']:
         comparison_text.insert("end", "⚖️ AGREEMENT\n", "header")
         comparison_text.insert("end", f"\nBoth Attention and {algorithm} selected ", "detail")
         comparison_text.insert("end", f"P{selected_process.pid}\n", "same")
         comparison_text.insert("end", f"\n• {algorithm}: {traditional_reason}\n", "detail")
-        comparison_text.insert("end", f"• Attention: Score {selected_process.attention_score(current_time, 0):.3f}\n", "detail")
+        comparison_text.insert("end", f"• Attention: Score {selected_score:.3f}\n", "detail")
     else:
         comparison_text.insert("end", "⚡ ATTENTION OVERRIDE!\n", "header")
         comparison_text.insert("end", f"\nAttention chose ", "detail")
         comparison_text.insert("end", f"P{selected_process.pid}", "attention")
         comparison_text.insert("end", f" over traditional {algorithm} choice ", "detail")
-        comparison_text.insert("end", f"P{traditional_choice.pid}\n", "traditional")
+        comparison_text.insert("end", f"P{traditional_pid}\n", "traditional")
         
-        comparison_text.insert("end", f"\n{algorithm} would pick P{traditional_choice.pid}:\n", "traditional")
+        comparison_text.insert("end", f"\n{algorithm} would pick P{traditional_pid}:\n", "traditional")
         comparison_text.insert("end", f"  └─ Reason: {traditional_reason}\n", "detail")
         
-        sel_comps = selected_process.get_attention_components(current_time)
+        sel_comps = comparison['components']
         comparison_text.insert("end", f"\nAttention picked P{selected_process.pid}:\n", "attention")
-        comparison_text.insert("end", f"  └─ Total Score: {selected_process.attention_score(current_time, 0):.3f}\n", "detail")
+        comparison_text.insert("end", f"  └─ Total Score: {selected_score:.3f}\n", "detail")
         comparison_text.insert("end", f"  └─ Waited {sel_comps['recency']:.1f} units\n", "detail")
         comparison_text.insert("end", f"  └─ Only {selected_process.remaining} burst left\n", "detail")
         comparison_text.insert("end", f"  └─ Executed {selected_process.executed_slices} times\n", "detail")
@@ -588,38 +303,33 @@ def update_comparison_text(algorithm, selected_process, ready_queue, current_tim
     comparison_text.config(state="disabled")
 
 
-def update_queues(ready_queue, waiting_queue, completed, current_time):
-    """Update the ready and waiting queue displays"""
-    ready_box.config(state="normal")
-    waiting_box.config(state="normal")
-    
-    ready_box.delete("1.0", tk.END)
-    waiting_box.delete("1.0", tk.END)
-    
-    if ready_queue:
-        sorted_ready = sorted(ready_queue, key=lambda p: p.attention_score(current_time, 0), reverse=True)
-        
-        ready_text = "Ready Queue (by attention):\n\n"
-        for idx, p in enumerate(sorted_ready):
-            attn = p.attention_score(current_time, 0)
-            indicator = "→ " if idx == 0 else "   "
-            ready_text += f"{indicator}P{p.pid}: {attn:.3f}\n"
-        ready_box.insert("1.0", ready_text)
-    else:
-        ready_box.insert("1.0", "Ready Queue:\n\n  Empty")
-    
-    if waiting_queue:
-        waiting_text = "Waiting Queue:\n\n"
-        for p in waiting_queue:
-            waiting_text += f"  P{p.pid}  —  Arrives: {p.arrival}\n"
-        waiting_box.insert("1.0", waiting_text)
-    elif completed:
-        waiting_box.insert("1.0", f"✓ All Completed!\n\nTotal: {len(completed)}")
+def update_queues(snapshot):
+    """Update the ready and waiting queue panels from a snapshot's visible rows"""
+    scores = snapshot['ready_scores']
+    ready_rows = []
+    for idx, p in enumerate(snapshot['ready'], snapshot['ready_offset']):
+        indicator = "→ " if idx == 0 else "   "
+        ready_rows.append(f"{indicator}P{p.pid}: {scores.score(p):.3f}")
+    ready_count = snapshot['ready_count']
+    ready_view.show("Ready Queue (by attention):" if ready_count else "Ready Queue:",
+                    ready_rows, ready_count, snapshot['ready_offset'])
+    
+    waiting_count = snapshot['waiting_count']
+    if waiting_count or not snapshot['completed']:
+        waiting_rows = [f"  P{p.pid}  —  Arrives: {p.arrival}" for p in snapshot['waiting']]
+        waiting_view.show("Waiting Queue:", waiting_rows, waiting_count, snapshot['waiting_offset'])
     else:
-        waiting_box.insert("1.0", "Waiting Queue:\n\n  Empty")
-    
-    ready_box.config(state="disabled")
-    waiting_box.config(state="disabled")
+        waiting_view.show("✓ All Completed!", [], 0, empty=(f"Total: {snapshot['completed']}",))
+
+
+def refresh_queues():
+    """Fetch the rows the queue panels now show, after one of them scrolled"""
+    if replay is not None:
+        update_queues(replay.snapshot(int(replay_scale.get()), ready_view.window(), waiting_view.window()))
+    elif simulation_worker is not None:
+        simulation_worker.ready_window = ready_view.window()
+        simulation_worker.waiting_window = waiting_view.window()
+        update_queues(simulation_worker.queue_snapshot())
 
 
 def toggle_pause_resume():
@@ -639,26 +349,70 @@ def toggle_pause_resume():
     else:
         # Pause
         paused = True
+        if simulation_worker:
+            simulation_worker.pause()
         if animation_id:
             root.after_cancel(animation_id)
             animation_id = None
         update_button_states()
 
 
-def animate_scheduler(algorithm, procs, quantum=2):
-    global animation_running, animation_id, selection_history, paused, resume_callback
+def timed(phase, fn, *args):
+    """Call fn, timing it under phase when profiling is on"""
+    if profiler is None:
+        return fn(*args)
+    started = perf_counter()
+    result = fn(*args)
+    profiler.lap(phase, started)
+    return result
+
+
+def render_snapshot(snapshot, gantt, algorithm):
+    """Draw a simulation snapshot (from the worker thread or a trace replay)"""
+    decision = snapshot['decision']
+    if decision:
+        if decision['dispatched']:
+            # Update comparison
+            timed("update_comparison_text", update_comparison_text, algorithm, decision['running'],
+                  decision['comparison'])
+        timed("draw_attention_visualization", draw_attention_visualization, decision['candidates'],
+              decision['time'], decision['running'], algorithm, decision['scores'],
+              decision['comparison'], decision.get('candidate_count'))
+    
+    current_time = snapshot['time']
+    p = snapshot['running']
+    if p:
+        running_label.config(text=f"Running: P{p.pid}  ({p.burst - p.remaining}/{p.burst})")
+    else:
+        running_label.config(text="Running: —")
     
-    time = [0]
-    gantt = []
-    ready = []
-    waiting = list(procs)
-    completed = []
-    current_process = [None]
-    remaining_burst = [0]
+    gantt[snapshot['gantt_start']:] = [list(segment) for segment in snapshot['gantt_tail']]
+    
+    time_label.config(text=f"Time: {current_time+1}")
+    timed("draw_gantt_chart", draw_gantt_chart, gantt, current_time)
+    timed("update_queues", update_queues, snapshot)
+    if profiler is not None:
+        profile_label.config(text=profiler.breakdown())
+    
+    if snapshot['finished'] and snapshot['completed']:
+        avg_waiting_label.config(text=f"Avg Waiting: {snapshot['avg_waiting']:.2f}")
+        avg_turnaround_label.config(text=f"Avg Turnaround: {snapshot['avg_turnaround']:.2f}")
+    else:
+        avg_waiting_label.config(text="Avg Waiting: —")
+        avg_turnaround_label.config(text="Avg Turnaround: —")
+
+
+def animate_scheduler(algorithm, procs, quantum=2, trace=None, policy=None, preempt_threshold=None):
+    global animation_running, animation_id, selection_history, paused, resume_callback, simulation_worker
     
-    waiting.sort(key=lambda p: p.arrival)
+    engine = SchedulerEngine(algorithm, procs, quantum, selection_history=selection_history, trace=trace,
+                             profiler=profiler, policy=policy, preempt_threshold=preempt_threshold)
+    worker = SimulationWorker(engine, SPEEDS.get(speed_var.get(), 1))
+    simulation_worker = worker
+    gantt = []
     
-    def step():
+    def poll():
+        """Render the newest snapshot published by the simulation thread"""
         global animation_running, animation_id, paused
         
         if not animation_running:
@@ -666,121 +420,62 @@ def animate_scheduler(algorithm, procs, quantum=2):
         
         # Check if paused
         if paused:
-            # Don't schedule next step, wait for resume
+            # Don't schedule next poll, wait for resume
             return
         
-        current_time = time[0]
-        
-        arrived = [p for p in waiting if p.arrival <= current_time]
-        for p in arrived:
-            waiting.remove(p)
-            ready.append(p)
-        
-        if current_process[0] is None and ready:
-            if algorithm == "FCFS":
-                candidate_list = ready
-            elif algorithm == "SJF":
-                candidate_list = sorted(ready, key=lambda p: p.remaining)
-            elif algorithm == "Priority":
-                candidate_list = sorted(ready, key=lambda p: p.priority)
-            elif algorithm == "Round Robin":
-                candidate_list = ready
-            else:
-                candidate_list = ready
-
-            selected = max(
-                candidate_list,
-                key=lambda p: p.attention_score(current_time, len(gantt))
-            )
-            
-            selection_record = {
-                'time': current_time,
-                'selected': selected.pid,
-                'attention_score': selected.attention_score(current_time, len(gantt)),
-                'candidates': {p.pid: p.attention_score(current_time, len(gantt)) for p in candidate_list}
-            }
-            selection_history.append(selection_record)
-            
-            current_process[0] = selected
-            ready.remove(current_process[0])
-
-            remaining_burst[0] = min(
-                quantum if algorithm == "Round Robin" else current_process[0].remaining,
-                current_process[0].remaining
-            )
-
-            if current_process[0].start is None:
-                current_process[0].start = current_time
-            
-            # Update comparison
-            ready_for_comparison = [p for p in ready] + [current_process[0]]
-            update_comparison_text(algorithm, current_process[0], ready_for_comparison, current_time)
-        
-        draw_attention_visualization(ready + ([current_process[0]] if current_process[0] else []), 
-                                    current_time, current_process[0], algorithm)
-        
-        if current_process[0]:
-            p = current_process[0]
-            p.executed_slices += 1
-            p.last_executed = current_time
-            
-            if not gantt or gantt[-1][0] != p.pid:
-                gantt.append([p.pid, current_time, current_time + 1])
-            else:
-                gantt[-1][2] = current_time + 1
-            
-            p.remaining -= 1
-            remaining_burst[0] -= 1
-            
-            running_label.config(text=f"Running: P{p.pid}  ({p.burst - p.remaining}/{p.burst})")
-            
-            if p.remaining == 0:
-                p.finish = current_time + 1
-                p.turnaround_time = p.finish - p.arrival
-                p.waiting_time = p.turnaround_time - p.burst
-                completed.append(p)
-                current_process[0] = None
-                remaining_burst[0] = 0
-            elif algorithm == "Round Robin" and remaining_burst[0] == 0:
-                arrived = [proc for proc in waiting if proc.arrival <= current_time + 1]
-                for proc in arrived:
-                    waiting.remove(proc)
-                    ready.append(proc)
-                
-                ready.append(p)
-                current_process[0] = None
-                remaining_burst[0] = 0
-        else:
-            running_label.config(text="Running: —")
+        worker.multiplier = SPEEDS.get(speed_var.get(), 1)
+        worker.ready_window = ready_view.window()
+        worker.waiting_window = waiting_view.window()
+        snapshot = worker.latest()
+        if snapshot is None:
+            animation_id = root.after(FRAME_MS, poll)
+            return
         
-        time_label.config(text=f"Time: {current_time+1}")
-        draw_gantt_chart([(g[0], g[1], g[2]) for g in gantt], current_time)
-        update_queues(ready, waiting, completed, current_time)
+        render_snapshot(snapshot, gantt, algorithm)
+        worker.consumed_segments = len(gantt)
         
-        if not waiting and not ready and current_process[0] is None:
+        if snapshot['finished']:
             animation_running = False
             paused = False
             update_button_states()
-            
-            if completed:
-                avg_wt = sum(p.waiting_time for p in completed) / len(completed)
-                avg_tat = sum(p.turnaround_time for p in completed) / len(completed)
-                avg_waiting_label.config(text=f"Avg Waiting: {avg_wt:.2f}")
-                avg_turnaround_label.config(text=f"Avg Turnaround: {avg_tat:.2f}")
-            
-            messagebox.showinfo("Complete", f"Done! Attention made {len(selection_history)} decisions")
+            messagebox.showinfo("Complete", f"Done! Attention made {len(selection_history)} decisions "
+                                            f"({selection_history.overrides} overrides)")
+            if profiler is not None:
+                save_profile()
             return
         
-        time[0] += 1
-        animation_id = root.after(600, step)
+        animation_id = root.after(FRAME_MS, poll)
     
-    # Store the step function so it can be called on resume
-    resume_callback = step
-    step()
+    def resume():
+        worker.resume()
+        poll()
+    
+    # Store the resume function so it can be called on resume
+    resume_callback = resume
+    worker.start()
+    poll()
+
+
+def stop_simulation():
+    """Stop the simulation thread and wait for it to exit (the GUI must outlive it)"""
+    global animation_running, animation_id, simulation_worker
+    worker = simulation_worker
+    if worker is None:
+        return
+    simulation_worker = None
+    animation_running = False
+    if animation_id:
+        root.after_cancel(animation_id)
+        animation_id = None
+    worker.stop()
+    worker.join()
+    # A run cut short still leaves a readable trace
+    if worker.engine.trace is not None:
+        worker.engine.trace.close()
 
 
 def run_scheduler():
-    global animation_running, animation_id, selection_history, paused
+    global animation_running, animation_id, selection_history, paused, profiler
     
     if not processes:
         messagebox.showwarning("Warning", "Please add processes first!")
@@ -790,31 +485,104 @@ def run_scheduler():
         messagebox.showwarning("Warning", "Animation already running!")
         return
     
+    trace = None
+    if record_var.get():
+        path = filedialog.asksaveasfilename(
+            title="Record trace to", defaultextension=".trace",
+            filetypes=[("Scheduler traces", "*.trace"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        trace = TraceWriter(path)
+    
+    profiler = PhaseProfiler(cprofile=True) if profile_var.get() else None
+    profile_label.config(text="")
+    
+    stop_simulation()
+    close_replay()
     paused = False
     selection_history.clear()
-    gantt_canvas.delete("all")
-    attention_canvas.delete("all")
+    clear_display()
+    
+    procs = processes.snapshot()
+    
+    algorithm = algorithm_var.get()
+    animation_running = True
+    update_button_states()
+    
+    animate_scheduler(algorithm, procs, quantum=2, trace=trace, policy=POLICIES[policy_var.get()],
+                      preempt_threshold=PREEMPT_THRESHOLDS[preempt_var.get()])
+
+
+def clear_display():
+    gantt_chart.reset()
+    attention_chart.reset()
     comparison_text.config(state="normal")
     comparison_text.delete("1.0", tk.END)
     comparison_text.config(state="disabled")
-    ready_box.config(state="normal")
-    waiting_box.config(state="normal")
-    ready_box.delete("1.0", tk.END)
-    waiting_box.delete("1.0", tk.END)
-    ready_box.config(state="disabled")
-    waiting_box.config(state="disabled")
+    ready_view.clear()
+    waiting_view.clear()
     time_label.config(text="Time: 0")
     running_label.config(text="Running: —")
     avg_waiting_label.config(text="Avg Waiting: —")
     avg_turnaround_label.config(text="Avg Turnaround: —")
+
+
+def save_profile():
+    """Offer to save the cProfile stats and phase stacks of the finished run"""
+    path = filedialog.asksaveasfilename(
+        title="Save profile", defaultextension=".prof",
+        filetypes=[("cProfile stats", "*.prof"), ("All files", "*.*")]
+    )
+    if path:
+        profiler.dump(path)
+
+
+# -----------------------------
+# Trace Replay
+# -----------------------------
+def open_replay():
+    """Load a recorded trace and show its state at any time via the slider"""
+    global replay
     
-    procs = [copy.deepcopy(p) for p in processes]
-    
-    algorithm = algorithm_var.get()
-    animation_running = True
-    update_button_states()
+    if animation_running:
+        return
+    path = filedialog.askopenfilename(
+        title="Replay trace", filetypes=[("Scheduler traces", "*.trace"), ("All files", "*.*")]
+    )
+    if not path:
+        return
+    try:
+        loaded = TraceReplay(path)
+    except (OSError, ValueError) as e:
+        messagebox.showerror("Error", f"Cannot open trace: {e}")
+        return
     
-    animate_scheduler(algorithm, procs, quantum=2)
+    close_replay()
+    replay = loaded
+    clear_display()
+    replay_label.config(text=f"Replay: {replay.algorithm}")
+    replay_scale.config(to=replay.final_time)
+    replay_frame.pack(fill="x", padx=30, pady=(0, 10), after=control_frame)
+    replay_scale.set(0)
+    seek_replay(0)
+
+
+def seek_replay(value):
+    if replay is None:
+        return
+    snapshot = replay.snapshot(int(float(value)), ready_view.window(), waiting_view.window())
+    # The seek can go backwards, so the chart is redrawn from scratch
+    gantt_chart.reset()
+    render_snapshot(snapshot, [], replay.algorithm)
+
+
+def close_replay():
+    global replay
+    if replay is not None:
+        replay.close()
+        replay = None
+        replay_frame.pack_forget()
 
 
 # -----------------------------
@@ -856,13 +624,68 @@ algorithm_var = tk.StringVar(value="FCFS")
 algorithm_menu = ttk.Combobox(
     left_control,
     textvariable=algorithm_var,
-    values=["FCFS", "SJF", "Priority", "Round Robin"],
+    values=ALGORITHMS,
     state="readonly",
-    width=16,
+    width=18,
     font=("Segoe UI", 10)
 )
 algorithm_menu.pack(side="left")
 
+speed_label = tk.Label(
+    left_control, text="Speed:",
+    bg="#ECF0F1", fg="#2C3E50",
+    font=("Segoe UI", 11, "bold")
+)
+speed_label.pack(side="left", padx=(20, 10))
+
+speed_var = tk.StringVar(value="1x")
+speed_menu = ttk.Combobox(
+    left_control,
+    textvariable=speed_var,
+    values=list(SPEEDS),
+    state="readonly",
+    width=7,
+    font=("Segoe UI", 10)
+)
+speed_menu.pack(side="left")
+
+policy_label = tk.Label(
+    left_control, text="Weights:",
+    bg="#ECF0F1", fg="#2C3E50",
+    font=("Segoe UI", 11, "bold")
+)
+policy_label.pack(side="left", padx=(20, 10))
+
+policy_var = tk.StringVar(value="default")
+policy_menu = ttk.Combobox(
+    left_control,
+    textvariable=policy_var,
+    values=list(POLICIES),
+    state="readonly",
+    width=10,
+    font=("Segoe UI", 10)
+)
+policy_menu.pack(side="left")
+
+preempt_label = tk.Label(
+    left_control, text="Preempt:",
+    bg="#ECF0F1", fg="#2C3E50",
+    font=("Segoe UI", 11, "bold")
+)
+preempt_label.pack(side="left", padx=(20, 10))
+
+# Attention preemption threshold: how far the best queued score must beat the running process's
+preempt_var = tk.StringVar(value="Off")
+preempt_menu = ttk.Combobox(
+    left_control,
+    textvariable=preempt_var,
+    values=list(PREEMPT_THRESHOLDS),
+    state="readonly",
+    width=6,
+    font=("Segoe UI", 10)
+)
+preempt_menu.pack(side="left")
+
 right_control = tk.Frame(control_frame, bg="#ECF0F1")
 right_control.pack(side="right")
 
@@ -910,6 +733,60 @@ stop_button = tk.Button(
 )
 stop_button.pack(side="left", padx=5)
 
+replay_button = tk.Button(
+    right_control,
+    text="⏮ Replay",
+    bg="#34495E",
+    fg="white",
+    font=("Segoe UI", 11, "bold"),
+    width=10,
+    height=2,
+    relief="flat",
+    cursor="hand2",
+    command=open_replay
+)
+replay_button.pack(side="left", padx=5)
+
+record_var = tk.BooleanVar(value=False)
+record_check = tk.Checkbutton(
+    left_control, text="Record trace",
+    variable=record_var,
+    bg="#ECF0F1", fg="#2C3E50",
+    font=("Segoe UI", 10)
+)
+record_check.pack(side="left", padx=(20, 0))
+
+profile_var = tk.BooleanVar(value=False)
+profile_check = tk.Checkbutton(
+    left_control, text="Profile",
+    variable=profile_var,
+    bg="#ECF0F1", fg="#2C3E50",
+    font=("Segoe UI", 10)
+)
+profile_check.pack(side="left", padx=(10, 0))
+
+# Replay slider (shown while a trace is loaded)
+replay_frame = tk.Frame(root, bg="#ECF0F1")
+
+replay_label = tk.Label(
+    replay_frame, text="Replay:",
+    bg="#ECF0F1", fg="#2C3E50",
+    font=("Segoe UI", 11, "bold")
+)
+replay_label.pack(side="left", padx=(0, 10))
+
+replay_scale = tk.Scale(
+    replay_frame, from_=0, to=0, orient="horizontal",
+    bg="#ECF0F1", highlightthickness=0,
+    command=seek_replay
+)
+replay_scale.pack(side="left", fill="x", expand=True)
+
+tk.Button(
+    replay_frame, text="✕", bg="#ECF0F1", relief="flat",
+    command=close_replay
+).pack(side="left", padx=(10, 0))
+
 # Attention Visualization
 attention_container = tk.Frame(root, bg="#ECF0F1")
 attention_container.pack(fill="x", padx=30, pady=(0, 10))
@@ -929,6 +806,7 @@ tk.Label(
 
 attention_canvas = tk.Canvas(attention_frame, bg="#FAFAFA", height=200, highlightthickness=0)
 attention_canvas.pack(fill="x")
+attention_chart = AttentionChart(attention_canvas)
 
 # Comparison Panel
 comparison_container = tk.Frame(root, bg="#ECF0F1")
@@ -972,8 +850,16 @@ tk.Label(
     font=("Segoe UI", 11, "bold")
 ).pack(side="left", padx=15)
 
+tk.Label(
+    gantt_header, text="Scroll to zoom · Drag to pan · Double-click to fit",
+    bg="#34495E", fg="#BDC3C7",
+    font=("Segoe UI", 9)
+).pack(side="right", padx=15)
+
 gantt_canvas = tk.Canvas(gantt_frame, bg="#FAFAFA", height=150, highlightthickness=0)
 gantt_canvas.pack(fill="both", expand=True)
+gantt_chart = GanttChart(gantt_canvas)
+gantt_chart.bind()
 
 # Bottom Panels
 bottom_container = tk.Frame(root, bg="#ECF0F1")
@@ -999,6 +885,8 @@ ready_box = tk.Text(
     padx=12, pady=8, state="disabled"
 )
 ready_box.pack(fill="both", expand=True)
+ready_view = QueueView(ready_box, on_scroll=refresh_queues)
+ready_view.bind()
 
 waiting_frame = tk.Frame(bottom_container, bg="white")
 waiting_frame.pack(side="left", expand=True, fill="both", padx=(10, 0))
@@ -1020,6 +908,8 @@ waiting_box = tk.Text(
     padx=12, pady=8, state="disabled"
 )
 waiting_box.pack(fill="both", expand=True)
+waiting_view = QueueView(waiting_box, on_scroll=refresh_queues)
+waiting_view.bind()
 
 # Metrics Footer
 metrics_container = tk.Frame(root, bg="#34495E", height=55)
@@ -1049,6 +939,14 @@ avg_turnaround_label.pack(anchor="w", pady=1)
 right_metrics = tk.Frame(metrics_frame, bg="#34495E")
 right_metrics.pack(side="right", padx=30)
 
+# Per-phase timing breakdown (only filled in while profiling)
+profile_label = tk.Label(
+    metrics_frame, text="",
+    fg="#BDC3C7", font=("Consolas", 9),
+    bg="#34495E", wraplength=420, justify="left"
+)
+profile_label.pack(side="right", padx=10)
+
 time_label = tk.Label(
     right_metrics, text="Time: 0",
     fg="#3498DB", font=("Segoe UI", 11, "bold"),
@@ -1063,5 +961,13 @@ running_label = tk.Label(
 )
 running_label.pack(anchor="e", pady=1)
 
+def close_window():
+    stop_simulation()
+    close_replay()
+    root.destroy()
+
+
+root.protocol("WM_DELETE_WINDOW", close_window)
 update_button_states()
-root.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    root.mainloop()
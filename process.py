@@ -0,0 +1,109 @@
+from array import array
+from collections import namedtuple
+
+from attention import DEFAULT_POLICY
+
+
+# -----------------------------
+# Data Model
+# -----------------------------
+class Process:
+    __slots__ = (
+        'pid', 'arrival', 'burst', 'priority', 'remaining', 'start', 'finish',
+        'waiting_time', 'turnaround_time', 'executed_slices', 'last_executed',
+    )
+
+    def __init__(self, pid, arrival, burst, priority):
+        self.pid = pid
+        self.arrival = arrival
+        self.burst = burst
+        self.priority = priority
+        self.reset()
+
+    def reset(self):
+        """Clear the simulation state so the process can be run again"""
+        self.remaining = self.burst
+        self.start = None
+        self.finish = None
+        self.waiting_time = 0
+        self.turnaround_time = 0
+        self.executed_slices = 0
+        self.last_executed = -1
+
+    def state(self):
+        """Immutable copy of every field, safe to hand to another thread"""
+        return ProcessState(*(getattr(self, name) for name in Process.__slots__))
+
+    def attention_score(self, current_time, history_length=None, *, policy=None):
+        """Attention score under policy (the default weights when None).
+
+        history_length is unused and kept so older positional callers work.
+        """
+        return (policy or DEFAULT_POLICY).score(self, current_time)
+
+    def attention_offset(self, *, policy=None):
+        """Time-independent part of the attention score.
+
+        attention_score(t) == w * t + attention_offset() while the process
+        is not running, where w is the recency weight, so ordering by the
+        offset orders by score at any time.
+        """
+        return (policy or DEFAULT_POLICY).offset(self)
+
+    def get_attention_components(self, current_time, *, policy=None):
+        """Get individual components of attention score for visualization"""
+        return (policy or DEFAULT_POLICY).components(self, current_time)
+
+
+ProcessState = namedtuple('ProcessState', Process.__slots__)
+
+
+class ProcessTable:
+    """Columnar storage for a workload's static process fields.
+
+    Keeps pid, arrival, burst and priority in compact typed columns and hands
+    out fresh Process records per run, so repeated runs need no deepcopy.
+    """
+
+    def __init__(self, procs=()):
+        self.pids = []
+        self.arrival = array('q')
+        self.burst = array('q')
+        self.priority = array('q')
+        self.extend(procs)
+
+    def __len__(self):
+        return len(self.pids)
+
+    def __bool__(self):
+        return bool(self.pids)
+
+    def __getitem__(self, i):
+        return Process(self.pids[i], self.arrival[i], self.burst[i], self.priority[i])
+
+    def __iter__(self):
+        for i in range(len(self.pids)):
+            yield self[i]
+
+    def add(self, pid, arrival, burst, priority):
+        self.pids.append(pid)
+        self.arrival.append(arrival)
+        self.burst.append(burst)
+        self.priority.append(priority)
+
+    def append(self, p):
+        self.add(p.pid, p.arrival, p.burst, p.priority)
+
+    def extend(self, procs):
+        for p in procs:
+            self.append(p)
+
+    def clear(self):
+        del self.pids[:]
+        del self.arrival[:]
+        del self.burst[:]
+        del self.priority[:]
+
+    def snapshot(self):
+        """Fresh, unrun Process records for one simulation"""
+        return list(self)
@@ -0,0 +1,87 @@
+"""Opt-in hot-path profiling.
+
+PhaseProfiler keeps a running total, a call count and a rolling average
+for each named phase. Hot paths time themselves with perf_counter() and
+lap(), so a disabled profiler (None) costs one comparison per phase. On
+request it also runs cProfile over the thread that calls enable(). At the
+end of a run it can dump the pstats file and a folded-stack file of the
+phases that flamegraph tools read.
+"""
+
+import cProfile
+from time import perf_counter
+
+# Engine phases (simulation thread) then render phases (Tk thread)
+ENGINE_PHASES = ["admission", "candidates", "scoring"]
+RENDER_PHASES = ["update_comparison_text", "draw_attention_visualization", "draw_gantt_chart", "update_queues"]
+PHASES = ENGINE_PHASES + RENDER_PHASES
+
+SHORT_NAMES = {
+    "admission": "admit",
+    "candidates": "sort",
+    "scoring": "score",
+    "update_comparison_text": "compare",
+    "draw_attention_visualization": "attention",
+    "draw_gantt_chart": "gantt",
+    "update_queues": "queues",
+}
+SMOOTHING = 0.1  # weight of the newest sample in the rolling average
+
+
+class PhaseProfiler:
+    def __init__(self, cprofile=False):
+        self.totals = dict.fromkeys(PHASES, 0.0)
+        self.counts = dict.fromkeys(PHASES, 0)
+        self.recent = dict.fromkeys(PHASES, 0.0)
+        self.profile = cProfile.Profile() if cprofile else None
+
+    def add(self, phase, seconds):
+        # Each phase is only ever timed from one thread
+        self.totals[phase] = self.totals.get(phase, 0.0) + seconds
+        self.counts[phase] = self.counts.get(phase, 0) + 1
+        self.recent[phase] = self.recent.get(phase, seconds) * (1 - SMOOTHING) + seconds * SMOOTHING
+
+    def lap(self, phase, started):
+        """Record the time since started under phase and return the current time"""
+        now = perf_counter()
+        self.add(phase, now - started)
+        return now
+
+    def enable(self):
+        if self.profile is not None:
+            self.profile.enable()
+
+    def disable(self):
+        if self.profile is not None:
+            self.profile.disable()
+
+    def breakdown(self):
+        """One-line rolling average per call, in milliseconds"""
+        parts = [f"{SHORT_NAMES.get(phase, phase)} {self.recent[phase] * 1000:.2f}"
+                 for phase in self.recent if self.counts[phase]]
+        return " · ".join(parts) + " ms" if parts else ""
+
+    def report(self):
+        """phase -> total seconds, call count and mean seconds per call"""
+        return {
+            phase: {
+                "total": self.totals[phase],
+                "count": self.counts[phase],
+                "mean": self.totals[phase] / self.counts[phase] if self.counts[phase] else 0.0,
+            }
+            for phase in self.totals
+        }
+
+    def write_folded(self, path):
+        """Phase totals as folded stacks (microseconds), e.g. for flamegraph.pl"""
+        with open(path, "w") as f:
+            for phase, total in self.totals.items():
+                if self.counts[phase]:
+                    thread = "engine" if phase in ENGINE_PHASES else "render"
+                    f.write(f"run;{thread};{phase} {round(total * 1e6)}\n")
+
+    def dump(self, path):
+        """Write the cProfile stats (if collected) to path and the phase stacks to path.folded"""
+        if self.profile is not None:
+            self.profile.dump_stats(path)
+        self.write_folded(path + ".folded")
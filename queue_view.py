@@ -0,0 +1,98 @@
+"""Virtualized queue panels.
+
+A QueueView shows one window of an already-ordered queue: a title, as many
+rows as fit in its Text widget, and a count of the rows outside the window.
+The caller fetches only those rows (e.g. from the ready queue's attention
+heap), so the cost of a frame does not depend on the length of the queue.
+Updates are incremental: only lines whose text changed are rewritten.
+"""
+
+import tkinter.font as tkfont
+
+DEFAULT_ROWS = 20   # rows shown before the widget has been laid out
+CHROME_LINES = 3    # title, blank line and summary around the rows
+SCROLL_ROWS = 3     # rows moved per mouse wheel step
+
+
+class QueueView:
+    def __init__(self, text, on_scroll=None):
+        self.text = text
+        self.on_scroll = on_scroll  # called after the window moves, to fetch the new rows
+        self.lines = []             # lines currently in the widget
+        self.offset = 0             # index of the first row shown
+        self.total = 0              # length of the whole queue at the last update
+        self.line_height = None
+
+    def rows(self):
+        """Rows that fit in the widget"""
+        height = self.text.winfo_height()
+        if height <= 1:
+            return DEFAULT_ROWS
+        if self.line_height is None:
+            self.line_height = max(tkfont.Font(font=self.text.cget("font")).metrics("linespace"), 1)
+        return max(height // self.line_height - CHROME_LINES, 1)
+
+    def window(self):
+        """(offset, row count) the next update should cover"""
+        return self.offset, self.rows()
+
+    def show(self, title, rows, total, offset=0, empty=("  Empty",)):
+        """Display rows (the window starting at offset) out of total"""
+        self.total = total
+        # The requested offset stays put; a queue that shrank pulls it back
+        self.offset = min(self.offset, max(total - self.rows(), 0))
+        if not total:
+            self.set_lines([title, ""] + list(empty))
+            return
+        lines = [title if total <= len(rows) else f"{title} {offset + 1}–{offset + len(rows)} of {total}", ""]
+        lines.extend(rows)
+        hidden = total - len(rows)
+        if hidden > 0:
+            below = total - offset - len(rows)
+            lines.append(f"  … {offset} above, {below} below" if offset else f"  … {below} more")
+        self.set_lines(lines)
+
+    def set_lines(self, lines):
+        """Rewrite only the lines that differ from what is shown"""
+        text = self.text
+        old = self.lines
+        if lines == old:
+            return
+        text.config(state="normal")
+        common = min(len(old), len(lines))
+        for i in range(common):
+            if old[i] != lines[i]:
+                text.delete(f"{i + 1}.0", f"{i + 1}.end")
+                text.insert(f"{i + 1}.0", lines[i])
+        if len(lines) < len(old):
+            if lines:
+                text.delete(f"{len(lines)}.end", "end")
+            else:
+                text.delete("1.0", "end")
+        elif len(lines) > len(old):
+            text.insert("end-1c", ("\n" if old else "") + "\n".join(lines[common:]))
+        text.config(state="disabled")
+        self.lines = list(lines)
+
+    def clear(self):
+        self.offset = 0
+        self.total = 0
+        self.set_lines([])
+
+    # -----------------------------
+    # Scrolling
+    # -----------------------------
+    def bind(self):
+        text = self.text
+        text.bind("<MouseWheel>", lambda e: self.scroll(-SCROLL_ROWS if e.delta > 0 else SCROLL_ROWS))
+        text.bind("<Button-4>", lambda e: self.scroll(-SCROLL_ROWS))
+        text.bind("<Button-5>", lambda e: self.scroll(SCROLL_ROWS))
+
+    def scroll(self, rows):
+        offset = min(max(self.offset + rows, 0), max(self.total - self.rows(), 0))
+        if offset != self.offset:
+            self.offset = offset
+            if self.on_scroll is not None:
+                self.on_scroll()
+        # Keep Tk from scrolling the widget's own text
+        return "break"
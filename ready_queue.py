@@ -0,0 +1,238 @@
+"""Heap-indexed ready queue.
+
+Keeps the ready processes in arrival-to-queue (FIFO) order, like the plain
+list it replaces, plus one binary heap per index so the minimum by arrival,
+remaining time, priority or attention can be found in O(log n). Removed
+entries are left in the heaps and skipped lazily when they surface.
+
+An index can also be kept grouped by a tie key: one small heap per group of
+processes that always compare equal on the leading key (for attention, the
+ones whose score is the same at every time), plus a heap of the groups.
+near_top() only looks at the best entry of each group, so exact ties (e.g. a
+burst of equal processes) cost O(log n) rather than O(tie size).
+"""
+
+import heapq
+import itertools
+
+from attention import DEFAULT_POLICY
+
+INDEX_KEYS = {
+    'arrival': lambda p: p.arrival,
+    'remaining': lambda p: p.remaining,
+    'priority': lambda p: p.priority,
+}
+
+# Index holding the traditional choice of each base algorithm
+# (Round Robin uses the head of the FIFO order instead)
+TRADITIONAL_INDEX = {
+    "FCFS": 'arrival',
+    "SJF": 'remaining',
+    "Priority": 'priority',
+    "SRTF": 'remaining',
+    "Preemptive Priority": 'priority',
+}
+
+
+def attention_key(algorithm, policy=DEFAULT_POLICY):
+    """Heap key ordering processes by descending attention score under policy.
+
+    Recency grows at the same rate for every queued process, so the order
+    only depends on the time-independent part of the score. Ties fall back to
+    the base algorithm's order, matching max() over its sorted candidate list.
+    """
+    offset = policy.offset
+    if algorithm in ("SJF", "SRTF"):
+        return lambda p: (-offset(p), p.remaining)
+    elif algorithm in ("Priority", "Preemptive Priority"):
+        return lambda p: (-offset(p), p.priority)
+    return lambda p: (-offset(p), 0)
+
+
+def attention_tie_key(policy=DEFAULT_POLICY):
+    """What an attention score depends on besides time.
+
+    Processes equal on it score exactly the same at every time, so only the
+    first of them (in attention key order) can be the attention pick.
+    """
+    static_terms = policy.static_terms
+    return lambda p: (p.arrival if p.last_executed == -1 else p.last_executed, static_terms(p))
+
+
+class ReadyQueue:
+    def __init__(self, indexes=None, ties=None):
+        if indexes is None:
+            indexes = dict(INDEX_KEYS)
+        # 'fifo' orders by queue position, so the head is found the same way
+        self.keys = {'fifo': lambda p: 0}
+        self.keys.update(indexes)
+        self.heaps = {name: [] for name in self.keys}
+        # Grouped indexes (tuple keys only) -> tie key function. Each group,
+        # (leading key, tie key) -> heap of (rest of key, seq, stamp, process),
+        # is in the index's heap of groups exactly while it exists.
+        self.ties = dict(ties or {})
+        self.groups = {name: {} for name in self.ties}
+        self.leads = {name: [] for name in self.ties}
+        self._order = {}   # seq -> process, in FIFO order
+        self._seq = {}     # pid -> seq
+        self._stamp = {}   # seq -> stamp of its live heap entries
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._order)
+
+    def __bool__(self):
+        return bool(self._order)
+
+    def __iter__(self):
+        return iter(list(self._order.values()))
+
+    def __contains__(self, p):
+        return p.pid in self._seq
+
+    def _index(self, seq, p):
+        stamp = next(self._counter)
+        self._stamp[seq] = stamp
+        ties = self.ties
+        for name, key in self.keys.items():
+            value = key(p)
+            heapq.heappush(self.heaps[name], (value, seq, stamp, p))
+            if name in ties:
+                lead = (value[0], ties[name](p))
+                groups = self.groups[name]
+                group = groups.get(lead)
+                if group is None:
+                    group = groups[lead] = []
+                    heapq.heappush(self.leads[name], lead)
+                heapq.heappush(group, (value[1:], seq, stamp, p))
+
+    def _group_top(self, group):
+        """Best live entry of a group, or None once it only holds stale ones"""
+        while group:
+            entry = group[0]
+            if self._stamp.get(entry[1]) == entry[2]:
+                return entry
+            heapq.heappop(group)
+        return None
+
+    def push(self, p):
+        """Append a process to the back of the queue"""
+        seq = next(self._counter)
+        self._order[seq] = p
+        self._seq[p.pid] = seq
+        self._index(seq, p)
+        self._maybe_compact()
+
+    def append(self, p):
+        self.push(p)
+
+    def extend(self, procs):
+        for p in procs:
+            self.push(p)
+
+    def remove(self, p):
+        """Remove a process; its heap entries become stale"""
+        seq = self._seq.pop(p.pid)
+        del self._order[seq]
+        del self._stamp[seq]
+
+    def _top(self, name):
+        heap = self.heaps[name]
+        while heap:
+            _, seq, stamp, p = heap[0]
+            if self._stamp.get(seq) == stamp:
+                return p
+            heapq.heappop(heap)
+        return None
+
+    def peek(self, name=None):
+        """Smallest process by the named index, or the FIFO head when name is None"""
+        return self._top('fifo' if name is None else name)
+
+    def pop(self, name=None):
+        p = self.peek(name)
+        if p is not None:
+            self.remove(p)
+        return p
+
+    def near_top(self, name, tolerance=1e-9):
+        """Best process of each group whose leading key is within tolerance of the smallest.
+
+        name must be a grouped index. Exact ties are broken by the rest of
+        the key, then FIFO position; only groups with float-close but
+        distinct keys add candidates, so the cost is proportional to the
+        number of such groups, not to the size of the tie. The result is
+        ordered by the remaining key fields, then FIFO position.
+        """
+        leads = self.leads[name]
+        groups = self.groups[name]
+        while leads:
+            first = self._group_top(groups[leads[0]])
+            if first is not None:
+                break
+            del groups[heapq.heappop(leads)]
+        else:
+            return []
+        lead = leads[0][0]
+        limit = lead + tolerance * (1 + abs(lead))
+        if all(i >= len(leads) or leads[i][0] > limit for i in (1, 2)):
+            # The usual case: no other group is close
+            return [first[3]]
+        found = []
+        stack = [0]
+        while stack:
+            i = stack.pop()
+            if i < len(leads) and leads[i][0] <= limit:
+                entry = self._group_top(groups[leads[i]])
+                if entry is not None:
+                    found.append(entry)
+                stack.extend((2 * i + 1, 2 * i + 2))
+        found.sort(key=lambda entry: (entry[0], entry[1]))
+        return [entry[3] for entry in found]
+
+    def ordered(self, name):
+        """Queued processes sorted by the named index (for display)"""
+        return [entry[3] for entry in sorted(self._live(name))]
+
+    def smallest(self, k, name):
+        """The k smallest queued processes by the named index.
+
+        Best-first walk from the heap root: a node is only visited once its
+        parent has been, so the cost grows with k (plus any stale entries on
+        the way), not with the size of the queue.
+        """
+        self._top(name)  # drop stale entries from the root first
+        heap = self.heaps[name]
+        found = []
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier and len(found) < k:
+            entry, i = heapq.heappop(frontier)
+            if self._stamp.get(entry[1]) == entry[2]:
+                found.append(entry[3])
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return found
+
+    def _live(self, name):
+        return (entry for entry in self.heaps[name] if self._stamp.get(entry[1]) == entry[2])
+
+    def _maybe_compact(self):
+        # Drop stale entries once they outnumber live ones
+        live = len(self._order)
+        for name, heap in self.heaps.items():
+            if len(heap) > 2 * live + 64:
+                self.heaps[name] = list(self._live(name))
+                heapq.heapify(self.heaps[name])
+                if name in self.ties:
+                    self._regroup(name)
+
+    def _regroup(self, name):
+        tie = self.ties[name]
+        groups = self.groups[name] = {}
+        for value, seq, stamp, p in self.heaps[name]:
+            groups.setdefault((value[0], tie(p)), []).append((value[1:], seq, stamp, p))
+        for group in groups.values():
+            heapq.heapify(group)
+        self.leads[name] = list(groups)
+        heapq.heapify(self.leads[name])
@@ -0,0 +1,416 @@
+"""Headless scheduling engine.
+
+Runs the same ready/waiting/current_process state machine that drives the
+GUI animation, without any Tk dependency, so whole workloads can be simulated
+as fast as the CPU allows.
+"""
+
+import itertools
+from time import perf_counter
+
+from attention import AttentionCache, DEFAULT_POLICY, get_policy
+from comparison import compare_choices
+from selection_log import SelectionLog
+from ready_queue import ReadyQueue, INDEX_KEYS, TRADITIONAL_INDEX, attention_key, attention_tie_key
+
+ALGORITHMS = ["FCFS", "SJF", "Priority", "Round Robin", "SRTF", "Preemptive Priority"]
+
+# Preemptive algorithms: an arrival takes the CPU from the running process
+# when the best queued process beats it on this index
+PREEMPTIVE_INDEX = {
+    "SRTF": 'remaining',
+    "Preemptive Priority": 'priority',
+}
+
+
+# Processes buffered at a time from a streamed workload
+STREAM_CHUNK = 4096
+
+
+class SchedulerEngine:
+    def __init__(self, algorithm, procs, quantum=2, selection_history=None, keep_details=True, trace=None,
+                 profiler=None, policy=None, preempt_threshold=None):
+        if quantum < 1:
+            raise ValueError(f"the quantum must be at least 1 (got {quantum})")
+        self.algorithm = algorithm
+        # Attention scoring weights: a ScoringPolicy, a policy name or "w1,w2,w3,w4"
+        self.policy = DEFAULT_POLICY if policy is None else get_policy(policy)
+        self.quantum = quantum
+        # Attention preemption: an arrival takes the CPU when the best queued
+        # score beats the running process's by more than this (None = off)
+        self.preempt_threshold = preempt_threshold
+        self.preempts = algorithm in PREEMPTIVE_INDEX or preempt_threshold is not None
+        self.time = 0
+        self.gantt = []
+        indexes = {'attention': attention_key(algorithm, self.policy)}
+        if algorithm in TRADITIONAL_INDEX:
+            name = TRADITIONAL_INDEX[algorithm]
+            indexes[name] = INDEX_KEYS[name]
+        self.indexes = indexes
+        self.ties = {'attention': attention_tie_key(self.policy)}
+        self.ready = ReadyQueue(indexes, self.ties)
+        if iter(procs) is procs:
+            # An iterator is pulled lazily as simulated time reaches it and
+            # must already be in arrival order
+            self.source = procs
+            self.arrivals = []
+        else:
+            self.source = None
+            self.arrivals = sorted(procs, key=lambda p: p.arrival)
+        self.next_arrival = 0  # cursor: arrivals[next_arrival:] are still waiting
+        self.completed = []
+        self.current_process = None
+        self.remaining_burst = 0
+        if selection_history is None:
+            selection_history = SelectionLog() if keep_details else []
+        self.selection_history = selection_history
+        self.attention = AttentionCache(self.policy)
+        self.comparison = None  # comparison record of the latest decision
+        self.trace = trace  # optional sim_trace.TraceWriter, closed when the run finishes
+        self.profiler = profiler  # optional profiling.PhaseProfiler
+        self.finished = False
+
+        # Without details only running totals are kept, so memory stays
+        # bounded by the ready queue rather than the length of the workload
+        self.keep_details = keep_details
+        self.completed_count = 0
+        self.total_waiting = 0
+        self.total_turnaround = 0
+        self.decisions = 0
+        self.overrides = 0
+        self.preemptions = 0
+        self.makespan = 0
+        self._pull()
+
+    def _pull(self):
+        """Buffer the next chunk of a streamed workload once the cursor runs dry"""
+        if self.source is None or self.next_arrival < len(self.arrivals):
+            return False
+        self.arrivals = list(itertools.islice(self.source, STREAM_CHUNK))
+        self.next_arrival = 0
+        if not self.arrivals:
+            self.source = None
+        return bool(self.arrivals)
+
+    @property
+    def waiting(self):
+        """Processes that have not arrived yet, in arrival order (buffered ones only when streaming)"""
+        return self.arrivals[self.next_arrival:]
+
+    def waiting_window(self, offset, count):
+        """Up to count not yet arrived processes, starting offset into arrival order"""
+        start = self.next_arrival + offset
+        return self.arrivals[start:start + count]
+
+    def waiting_count(self):
+        """Processes still to arrive (buffered ones only when streaming)"""
+        return len(self.arrivals) - self.next_arrival
+
+    def has_waiting(self):
+        return self.next_arrival < len(self.arrivals)
+
+    def admit(self, current_time):
+        """Move every process that has arrived by current_time into the ready queue"""
+        arrived = self.take_arrivals(current_time)
+        self.ready.extend(arrived)
+        return arrived
+
+    def take_arrivals(self, current_time):
+        """Every not yet admitted process that has arrived by current_time.
+
+        Advances a cursor over the pre-sorted arrivals, so the cost is
+        proportional to the number of newly arrived processes.
+        """
+        arrived = []
+        while True:
+            arrivals = self.arrivals
+            start = end = self.next_arrival
+            while end < len(arrivals) and arrivals[end].arrival <= current_time:
+                end += 1
+            self.next_arrival = end
+            arrived.extend(arrivals[start:end])
+            if end < len(arrivals) or not self._pull():
+                break
+        return arrived
+
+    def next_arrival_time(self):
+        """Arrival time of the next process still to arrive (has_waiting() must be true)"""
+        return self.arrivals[self.next_arrival].arrival
+
+    def should_preempt(self, p, current_time):
+        """Whether the best queued process should take the CPU from p.
+
+        Only called when processes have just arrived, and only looks at the
+        top of the heaps: a queued process's remaining time and priority do
+        not change while it waits, so only an arrival can beat p on them.
+        """
+        index = PREEMPTIVE_INDEX.get(self.algorithm)
+        if index is not None:
+            key = INDEX_KEYS[index]
+            if key(self.ready.peek(index)) < key(p):
+                return True
+        if self.preempt_threshold is not None:
+            scores = self.attention.scores(self.ready, current_time)
+            best = max(scores.score(q) for q in self.ready.near_top('attention'))
+            return best - self.attention.score(p, current_time) > self.preempt_threshold
+        return False
+
+    def attention_pick(self, current_time):
+        """The ready process the attention layer dispatches at current_time, and the scores it used"""
+        # The heap narrows the choice to the (near-)tied leaders; their
+        # exact scores keep max()'s float tie-breaking
+        leaders = self.ready.near_top('attention')
+        scores = self.attention.scores(self.ready, current_time)
+        return max(leaders, key=scores.score), scores
+
+    def traditional_choice(self):
+        """What the base algorithm alone would dispatch next"""
+        return self.ready.peek(TRADITIONAL_INDEX.get(self.algorithm))
+
+    def top_candidates(self, scores, selected, queue=None):
+        """pid -> score of the candidates worth logging for this decision.
+
+        A selection log with a top_k only gets the k best-scored processes,
+        read off the attention heap of queue (the ready queue by default); a
+        plain list gets the whole queue.
+        """
+        top_k = getattr(self.selection_history, 'top_k', None)
+        if not self.keep_details or top_k is None:
+            return scores.as_dict() if self.keep_details else {}
+        top = (self.ready if queue is None else queue).smallest(top_k, 'attention')
+        if selected not in top:
+            top[-1:] = [selected]
+        return {p.pid: scores.score(p) for p in top}
+
+    def decide(self):
+        """Admit arrivals and dispatch a process if the CPU is idle.
+
+        Returns the tick event; the running process has not executed yet, so
+        observers see the same state the attention layer decided on.
+        """
+        current_time = self.time
+        profiler = self.profiler
+        if profiler is not None:
+            started = perf_counter()
+        arrived = self.admit(current_time)
+        if profiler is not None:
+            started = profiler.lap('admission', started)
+        event = {
+            'time': current_time,
+            'arrived': arrived,
+            'dispatched': None,
+            'traditional': None,
+            'record': None,
+            'running': None,
+            'finished': None,
+            'preempted': None,
+            'scores': None,
+        }
+
+        if self.current_process is None and self.ready:
+            if profiler is not None:
+                started = perf_counter()
+            traditional = self.traditional_choice()
+            if profiler is not None:
+                started = profiler.lap('candidates', started)
+            selected, scores = self.attention_pick(current_time)
+            candidates = self.top_candidates(scores, selected)
+            if profiler is not None:
+                profiler.lap('scoring', started)
+            self.ready.remove(selected)
+
+            selection_record = compare_choices(self.algorithm, self.policy, current_time, selected,
+                                               traditional, scores.score(selected))
+            selection_record['candidates'] = candidates
+            self.comparison = selection_record
+            self.decisions += 1
+            if selection_record['override']:
+                self.overrides += 1
+            if self.keep_details:
+                self.selection_history.append(selection_record)
+
+            self.current_process = selected
+
+            self.remaining_burst = min(
+                self.quantum if self.algorithm == "Round Robin" else selected.remaining,
+                selected.remaining
+            )
+
+            if selected.start is None:
+                selected.start = current_time
+
+            event['dispatched'] = selected
+            event['traditional'] = traditional
+            event['record'] = selection_record
+            # A lazy view over the ready queue (the selected process has left it)
+            event['scores'] = scores
+
+        event['running'] = self.current_process
+        if self.trace is not None:
+            self.trace.decided(self, event)
+        return event
+
+    def next_event_span(self, event):
+        """Time units until the next decision point after this event.
+
+        A dispatched process runs uninterrupted until its slice ends (process
+        completion or Round Robin quantum expiry) or, when preemption is on,
+        until the next arrival; an idle CPU waits for the next arrival.
+        """
+        if self.current_process:
+            if self.preempts and self.has_waiting():
+                return min(self.remaining_burst, max(self.next_arrival_time() - event['time'], 1))
+            return self.remaining_burst
+        if self.has_waiting():
+            return max(self.next_arrival_time() - event['time'], 1)
+        return 1
+
+    def execute(self, event, span=1):
+        """Run the current process for span time units and advance the clock"""
+        current_time = event['time']
+        end_time = current_time + span
+        p = self.current_process
+        event['span'] = span
+
+        if p:
+            p.executed_slices += span
+            p.last_executed = end_time - 1
+
+            if not self.gantt or self.gantt[-1][0] != p.pid:
+                if not self.keep_details:
+                    self.gantt.clear()
+                self.gantt.append([p.pid, current_time, end_time])
+            else:
+                self.gantt[-1][2] = end_time
+            self.makespan = end_time
+
+            p.remaining -= span
+            self.remaining_burst -= span
+            self.attention.invalidate(p)
+
+            if p.remaining == 0:
+                p.finish = end_time
+                p.turnaround_time = p.finish - p.arrival
+                p.waiting_time = p.turnaround_time - p.burst
+                self.completed_count += 1
+                self.total_waiting += p.waiting_time
+                self.total_turnaround += p.turnaround_time
+                if self.keep_details:
+                    self.completed.append(p)
+                self.current_process = None
+                self.remaining_burst = 0
+                event['finished'] = p
+            elif self.algorithm == "Round Robin" and self.remaining_burst == 0:
+                event['arrived'] = event['arrived'] + self.admit(end_time)
+                self.ready.append(p)
+                self.current_process = None
+                self.remaining_burst = 0
+                event['preempted'] = p
+            elif self.preempts and self.has_waiting() and self.next_arrival_time() <= end_time:
+                # Arrivals are the only preemption points; like a Round Robin
+                # slice, the preempted process queues up behind them
+                event['arrived'] = event['arrived'] + self.admit(end_time)
+                if self.should_preempt(p, end_time):
+                    # Only preempt if the next decision would give the CPU to
+                    # another process; it then dispatches that process
+                    self.ready.append(p)
+                    if self.attention_pick(end_time)[0] is p:
+                        self.ready.remove(p)
+                    else:
+                        self.current_process = None
+                        self.remaining_burst = 0
+                        self.preemptions += 1
+                        event['preempted'] = p
+
+        if not self.has_waiting() and not self.ready and self.current_process is None:
+            self.finished = True
+            self.time = end_time - 1
+        else:
+            self.time = end_time
+        if self.trace is not None:
+            self.trace.executed(self, event)
+        return event
+
+    def step(self):
+        """Simulate one time unit"""
+        return self.execute(self.decide())
+
+    def advance(self, max_span=None):
+        """Jump straight to the next decision point (discrete-event mode),
+        or at most max_span time units"""
+        event = self.decide()
+        span = self.next_event_span(event)
+        if max_span is not None:
+            span = max(1, min(span, max_span))
+        return self.execute(event, span)
+
+    def run(self, event_driven=True):
+        """Simulate until every process has completed.
+
+        In event-driven mode the cost scales with the number of scheduling
+        events rather than the total burst time; the gantt segments, metrics
+        and selection history are identical to unit-tick stepping.
+        """
+        advance = self.advance if event_driven else self.step
+        if self.profiler is not None:
+            self.profiler.enable()
+        try:
+            while not self.finished:
+                advance()
+        finally:
+            if self.profiler is not None:
+                self.profiler.disable()
+        return self.results()
+
+    def results(self):
+        """Gantt segments, per-process metrics and the selection history"""
+        completed = self.completed
+        count = self.completed_count
+        metrics = {
+            p.pid: {
+                'arrival': p.arrival,
+                'burst': p.burst,
+                'priority': p.priority,
+                'start': p.start,
+                'finish': p.finish,
+                'waiting_time': p.waiting_time,
+                'turnaround_time': p.turnaround_time,
+            }
+            for p in completed
+        }
+        return {
+            'algorithm': self.algorithm,
+            'gantt': [(pid, start, end) for pid, start, end in self.gantt],
+            'metrics': metrics,
+            'processes': count,
+            'makespan': self.makespan,
+            'avg_waiting': self.total_waiting / count if count else 0,
+            'avg_turnaround': self.total_turnaround / count if count else 0,
+            'decisions': self.decisions,
+            'overrides': self.overrides,
+            'preemptions': self.preemptions,
+            'selection_history': self.selection_history,
+            'profile': self.profiler.report() if self.profiler is not None else None,
+        }
+
+
+def simulate(algorithm, procs, quantum=2, event_driven=True, keep_details=True, trace=None, policy=None,
+             cpus=1, per_cpu_queues=False, work_stealing=True, preempt_threshold=None):
+    """Run a complete simulation headlessly and return its results.
+
+    procs may be a list, or an iterator in arrival order (e.g.
+    workload.stream_workload) that is consumed lazily. trace is an optional
+    sim_trace.TraceWriter that records the run. policy selects the attention
+    weights (see attention.get_policy); preempt_threshold turns on attention
+    preemption. With more than one CPU (or per-CPU run queues) the run goes
+    through multicore.MultiCoreEngine.
+    """
+    if cpus > 1 or per_cpu_queues:
+        if trace is not None:
+            raise ValueError("traces record single-CPU runs only")
+        from multicore import MultiCoreEngine
+        engine = MultiCoreEngine(algorithm, procs, cpus, quantum, per_cpu_queues, work_stealing,
+                                 keep_details=keep_details, policy=policy, preempt_threshold=preempt_threshold)
+        return engine.run(event_driven)
+    return SchedulerEngine(algorithm, procs, quantum, keep_details=keep_details, trace=trace,
+                           policy=policy, preempt_threshold=preempt_threshold).run(event_driven)
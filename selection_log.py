@@ -0,0 +1,223 @@
+"""Bounded selection log.
+
+Each attention decision is stored as one fixed-width row: the fields of
+its comparison record (time, selected PID, its score, the traditional PID,
+whether attention overrode it, the reason and the score components) and
+the top-k candidates with their scores. Rows live in preallocated columns
+used as a ring buffer. Once the ring is full, the oldest row is appended to
+a binary spill file (a temporary one unless a path is given) or, with
+spilling turned off, dropped, so memory stays constant however long the run
+is. read_log() memory-maps a spill file and yields its rows back as records.
+"""
+
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+import weakref
+from array import array
+
+from comparison import COMPONENT_KEYS, CRITERIA
+
+DEFAULT_CAPACITY = 10000
+DEFAULT_TOP_K = 5
+PID_WIDTH = 16  # bytes per PID; workloads reject longer ones
+
+MAGIC = b"SELLOG2\0"
+HEADER = struct.Struct("<8sHH")  # magic, pid width, top-k
+
+
+def row_struct(pid_width, top_k):
+    """Layout of one row: time, score, override, reason criterion and value, components,
+    selected, traditional, k candidate PIDs, k candidate scores"""
+    return struct.Struct(f"<qd?Bq{len(COMPONENT_KEYS)}d{pid_width}s{pid_width}s"
+                         + f"{pid_width}s" * top_k + "d" * top_k)
+
+
+def encode_pid(pid, width):
+    """PID as a fixed-width, NUL-padded UTF-8 field (shared with sim_trace).
+
+    Raises ValueError rather than truncating a PID that does not fit, which
+    would let two PIDs decode as the same one.
+    """
+    raw = str(pid).encode("utf-8")
+    if len(raw) > width:
+        raise ValueError(f"PID '{pid}' is longer than {width} bytes")
+    return raw.ljust(width, b"\0")
+
+
+def decode_pid(raw):
+    """Inverse of encode_pid"""
+    return raw.rstrip(b"\0").decode("utf-8", "replace")
+
+
+def _record(fields, top_k):
+    """Selection record (as built by the engine) from a row's field tuple"""
+    time, score, override, criterion, value = fields[:5]
+    end = 5 + len(COMPONENT_KEYS)
+    selected, traditional = fields[end:end + 2]
+    pids = [decode_pid(raw) for raw in fields[end + 2:end + 2 + top_k]]
+    return {
+        'time': time,
+        'selected': decode_pid(selected),
+        'attention_score': score,
+        'traditional': decode_pid(traditional),
+        'override': override,
+        'reason': (CRITERIA[criterion], value),
+        'components': dict(zip(COMPONENT_KEYS, fields[5:end])),
+        'candidates': {pid: score for pid, score in zip(pids, fields[end + 2 + top_k:]) if pid},
+    }
+
+
+class SelectionLog:
+    def __init__(self, capacity=DEFAULT_CAPACITY, top_k=DEFAULT_TOP_K, spill_path=None, pid_width=PID_WIDTH,
+                 spill=True):
+        self.capacity = capacity
+        self.top_k = top_k
+        self.pid_width = pid_width
+        self.spill = spill or spill_path is not None
+        self.spill_path = spill_path  # a temporary file is made on the first spill when None
+        self.row = row_struct(pid_width, top_k)
+
+        # Fixed-width columns; slot i holds one row
+        self.times = array('q', bytes(8 * capacity))
+        self.scores = array('d', bytes(8 * capacity))
+        self.override = bytearray(capacity)
+        self.criteria = bytearray(capacity)
+        self.reason_values = array('q', bytes(8 * capacity))
+        self.components = array('d', bytes(8 * capacity * len(COMPONENT_KEYS)))
+        self.selected = bytearray(capacity * pid_width)
+        self.traditional = bytearray(capacity * pid_width)
+        self.candidate_pids = bytearray(capacity * top_k * pid_width)
+        self.candidate_scores = array('d', bytes(8 * capacity * top_k))
+
+        self.start = 0      # slot of the oldest row in memory
+        self.size = 0       # rows in memory
+        self.total = 0      # rows ever appended
+        self.spilled = 0    # rows written to the spill file
+        self.dropped = 0    # rows lost because spilling is off
+        self.overrides = 0  # appended rows where attention overrode the base algorithm
+        self._spill = None
+
+    def __len__(self):
+        """Records retained (and yielded by iteration); total counts every append"""
+        return self.spilled + self.size
+
+    def append(self, record):
+        """Store a selection record; only its top_k highest-scoring candidates are kept"""
+        if self.size == self.capacity:
+            self._evict()
+        slot = (self.start + self.size) % self.capacity
+        self.size += 1
+        self.total += 1
+
+        width = self.pid_width
+        self.times[slot] = record['time']
+        self.scores[slot] = record['attention_score']
+        self.override[slot] = record['override']
+        self.overrides += record['override']
+        criterion, value = record['reason']
+        self.criteria[slot] = CRITERIA.index(criterion)
+        self.reason_values[slot] = value
+        components = record['components']
+        first = slot * len(COMPONENT_KEYS)
+        self.components[first:first + len(COMPONENT_KEYS)] = array('d', [components[key] for key in COMPONENT_KEYS])
+        self.selected[slot * width:(slot + 1) * width] = encode_pid(record['selected'], width)
+        self.traditional[slot * width:(slot + 1) * width] = encode_pid(record['traditional'], width)
+
+        candidates = heapq.nlargest(self.top_k, record['candidates'].items(), key=lambda item: item[1])
+        base = slot * self.top_k
+        for j in range(self.top_k):
+            if j < len(candidates):
+                pid, score = candidates[j]
+                raw = encode_pid(pid, width)
+            else:
+                raw, score = bytes(width), float('nan')
+            self.candidate_pids[(base + j) * width:(base + j + 1) * width] = raw
+            self.candidate_scores[base + j] = score
+
+    def _fields(self, slot):
+        """Raw field tuple of a slot, in row_struct order"""
+        width = self.pid_width
+        base = slot * self.top_k
+        pids = bytes(self.candidate_pids[base * width:(base + self.top_k) * width])
+        components = slot * len(COMPONENT_KEYS)
+        return (
+            self.times[slot],
+            self.scores[slot],
+            bool(self.override[slot]),
+            self.criteria[slot],
+            self.reason_values[slot],
+            *self.components[components:components + len(COMPONENT_KEYS)],
+            bytes(self.selected[slot * width:(slot + 1) * width]),
+            bytes(self.traditional[slot * width:(slot + 1) * width]),
+            *(pids[j * width:(j + 1) * width] for j in range(self.top_k)),
+            *self.candidate_scores[base:base + self.top_k],
+        )
+
+    def _evict(self):
+        # Make room by spilling (or dropping) the oldest row
+        if self.spill:
+            if self.spill_path is None:
+                fd, self.spill_path = tempfile.mkstemp(prefix="selection-", suffix=".log")
+                os.close(fd)
+                weakref.finalize(self, _remove, self.spill_path)
+            if self._spill is None:
+                self._spill = open(self.spill_path, "ab" if self.spilled else "wb")
+                if not self.spilled:
+                    self._spill.write(HEADER.pack(MAGIC, self.pid_width, self.top_k))
+            self._spill.write(self.row.pack(*self._fields(self.start)))
+            self.spilled += 1
+        else:
+            self.dropped += 1
+        self.start = (self.start + 1) % self.capacity
+        self.size -= 1
+
+    def __iter__(self):
+        """Every retained record, oldest first: spilled rows, then the ring"""
+        if self.spilled:
+            if self._spill is not None:
+                self._spill.flush()
+            yield from read_log(self.spill_path)
+        for i in range(self.size):
+            yield _record(self._fields((self.start + i) % self.capacity), self.top_k)
+
+    def recent(self, n):
+        """The last n records in memory, oldest first"""
+        n = min(n, self.size)
+        return [_record(self._fields((self.start + self.size - n + i) % self.capacity), self.top_k) for i in range(n)]
+
+    def close(self):
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def clear(self):
+        """Forget every record and truncate the spill file"""
+        self.close()
+        if self.spill_path is not None and self.spilled:
+            open(self.spill_path, "wb").close()
+        self.start = self.size = self.total = self.spilled = self.dropped = self.overrides = 0
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def read_log(path):
+    """Records from a spill file, oldest first; the file is memory-mapped, not read in"""
+    with open(path, "rb") as f:
+        if f.seek(0, 2) < HEADER.size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            magic, pid_width, top_k = HEADER.unpack_from(data)
+            if magic != MAGIC:
+                raise ValueError(f"{path}: not a selection log")
+            row = row_struct(pid_width, top_k)
+            end = HEADER.size + (len(data) - HEADER.size) // row.size * row.size
+            for offset in range(HEADER.size, end, row.size):
+                yield _record(row.unpack_from(data, offset), top_k)
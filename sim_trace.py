@@ -0,0 +1,364 @@
+"""Binary simulation traces.
+
+A trace is a header followed by fixed-size event records, written by the
+engine as it runs: arrivals, dispatches (with the top-k attention
+candidates), executed slices, preemptions and completions. Each record is
+stamped with the first time unit whose state it belongs to, so times never
+decrease through the file. Every so often
+the writer also stores a checkpoint: the counters plus every ready and
+running process. An index of checkpoint times goes at the end of the file.
+
+TraceReplay memory-maps a trace. To rebuild the scheduler state at any time,
+it starts from the nearest earlier checkpoint and applies only the records
+after it. Nothing is re-simulated.
+"""
+
+import bisect
+import mmap
+import struct
+
+from attention import ScoringPolicy, score_batch
+from comparison import compare_choices
+from process import ProcessState
+from ready_queue import attention_key
+from selection_log import PID_WIDTH, decode_pid, encode_pid
+
+MAGIC = b"SCHTRC1\0"
+INDEX_MAGIC = b"SCHTIDX\0"
+VERSION = 3
+TOP_K = 5               # attention candidates stored per dispatch
+CHECKPOINT_EVENTS = 1024  # records between checkpoints (at least CHECKPOINT_RATIO x the ready queue)
+CHECKPOINT_RATIO = 4
+WAITING_PREVIEW = 200   # queue rows in a replay snapshot unless asked otherwise
+
+HEADER = struct.Struct("<8sHHHq32s4d")  # magic, version, pid width, top-k, quantum, algorithm, attention weights
+INDEX_ENTRY = struct.Struct("<qq")      # checkpoint time, record offset
+TRAILER = struct.Struct("<8sqq")        # index magic, index offset, entry count
+
+# Record kinds
+ARRIVE, DISPATCH, CANDIDATE, RUN, PREEMPT, FINISH, CHECKPOINT, READY, RUNNING = range(1, 10)
+
+
+def record_struct(pid_width):
+    """kind, time, pid, ref pid, seven integer fields, score"""
+    return struct.Struct(f"<Bq{pid_width}s{pid_width}s7qd")
+
+
+def _state_fields(p):
+    return (p.arrival, p.burst, p.priority, p.remaining,
+            -1 if p.start is None else p.start, p.executed_slices, p.last_executed)
+
+
+def _arrival_fields(p):
+    # As queued on arrival, even if dispatched in the same decision
+    return (p.arrival, p.burst, p.priority, p.burst, -1, 0, -1)
+
+
+def _process_state(pid, fields):
+    arrival, burst, priority, remaining, start, executed_slices, last_executed = fields
+    return ProcessState(
+        pid, arrival, burst, priority, remaining, None if start == -1 else start,
+        None, 0, 0, executed_slices, last_executed,
+    )
+
+
+# -----------------------------
+# Recording
+# -----------------------------
+class TraceWriter:
+    """Append-only trace file fed by SchedulerEngine(trace=...)"""
+
+    def __init__(self, path, pid_width=PID_WIDTH, top_k=TOP_K):
+        self.path = path
+        self.pid_width = pid_width
+        self.top_k = top_k
+        self.record = record_struct(pid_width)
+        self.file = None
+        self.offset = 0            # byte offset of the next record
+        self.index = []            # (time, offset) of each checkpoint
+        self.since_checkpoint = 0
+        self.last_dispatch = -1
+
+    def _open(self, engine):
+        self.file = open(self.path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.pid_width, self.top_k,
+                                    engine.quantum, engine.algorithm.encode("utf-8")[:32],
+                                    *engine.policy.vector))
+        self.offset = HEADER.size
+
+    def _write(self, kind, time, pid="", ref="", fields=(0,) * 7, score=0.0):
+        width = self.pid_width
+        self.file.write(self.record.pack(kind, time, encode_pid(pid, width), encode_pid(ref, width), *fields, score))
+        self.offset += self.record.size
+        self.since_checkpoint += 1
+
+    def checkpoint(self, engine, time):
+        """Store the counters and every ready and running process"""
+        running = engine.current_process
+        self.index.append((time, self.offset))
+        self._write(CHECKPOINT, time, fields=(
+            engine.completed_count, engine.total_waiting, engine.total_turnaround,
+            len(engine.ready), self.last_dispatch, engine.remaining_burst, running is not None,
+        ))
+        for p in engine.ready:
+            self._write(READY, time, p.pid, fields=_state_fields(p))
+        if running is not None:
+            self._write(RUNNING, time, running.pid, fields=_state_fields(running))
+        self.since_checkpoint = 0
+
+    def decided(self, engine, event):
+        """Arrivals and the dispatch of a decide() event, before it executes"""
+        time = event['time']
+        if self.file is None:
+            self._open(engine)
+        for p in event['arrived']:
+            self._write(ARRIVE, time, p.pid, fields=_arrival_fields(p))
+
+        p = event['dispatched']
+        if p is not None:
+            record = event['record']
+            self.last_dispatch = self.offset
+            self._write(DISPATCH, time, p.pid, record['traditional'], _state_fields(p), record['attention_score'])
+            scores = event['scores']
+            candidates = engine.ready.smallest(self.top_k, 'attention')
+            # The base algorithm's pick is always stored, for the comparison panel
+            traditional = event['traditional']
+            if traditional is not p and traditional not in candidates:
+                candidates.append(traditional)
+            for q in candidates:
+                self._write(CANDIDATE, time, q.pid, fields=_state_fields(q), score=scores.score(q))
+
+        # Checkpoints hold the state right after a decision, so the first
+        # one (at time 0) also covers every seek. Spacing them by a multiple
+        # of the queue length keeps them a bounded share of the file.
+        if not self.index or self.since_checkpoint >= max(CHECKPOINT_EVENTS, CHECKPOINT_RATIO * len(engine.ready)):
+            self.checkpoint(engine, time)
+
+    def executed(self, engine, event):
+        """The slice an execute() ran, and the arrivals, preemption or completion it caused"""
+        time = event['time']
+        last = time + event['span'] - 1
+        p = event['running']
+        if p is not None:
+            # The slice runs up to last_executed
+            self._write(RUN, time, p.pid, fields=_state_fields(p))
+        for q in event['arrived']:
+            if q.arrival > time:
+                # Admitted at the end of a slice (Round Robin expiry or a preemption check)
+                self._write(ARRIVE, last, q.pid, fields=_arrival_fields(q))
+        if event['preempted'] is not None:
+            self._write(PREEMPT, last, event['preempted'].pid, fields=_state_fields(event['preempted']))
+        if event['finished'] is not None:
+            self._write(FINISH, last, event['finished'].pid, fields=_state_fields(event['finished']))
+        if engine.finished:
+            self.close()
+
+    def close(self):
+        """Write the checkpoint index and close the file"""
+        if self.file is None:
+            return
+        index_offset = self.offset
+        for time, offset in self.index:
+            self.file.write(INDEX_ENTRY.pack(time, offset))
+        self.file.write(TRAILER.pack(INDEX_MAGIC, index_offset, len(self.index)))
+        self.file.close()
+        self.file = None
+
+
+# -----------------------------
+# Replay
+# -----------------------------
+class TraceReplay:
+    """Random access to a recorded run.
+
+    Opening a trace makes one pass over its records to collect the Gantt
+    segments and arrival times; snapshot(t) then only reads the checkpoint
+    before t and the records between it and t.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        data = self.data
+
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path}: not a scheduler trace")
+        magic, version, self.pid_width, self.top_k, self.quantum, algorithm, *weights = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a scheduler trace")
+        self.algorithm = decode_pid(algorithm)
+        self.policy = ScoringPolicy("recorded", *weights)
+        self.record = record_struct(self.pid_width)
+        size = self.record.size
+
+        # The index trailer is missing if the run never finished
+        index = None
+        end = HEADER.size + (len(data) - HEADER.size) // size * size
+        if len(data) >= HEADER.size + TRAILER.size:
+            index_magic, index_offset, count = TRAILER.unpack_from(data, len(data) - TRAILER.size)
+            if index_magic == INDEX_MAGIC:
+                end = index_offset
+                index = [INDEX_ENTRY.unpack_from(data, index_offset + i * INDEX_ENTRY.size) for i in range(count)]
+        self.end = end
+
+        self.gantt = []            # merged [pid, start, end] segments, as the engine builds them
+        self.arrivals = []         # (arrival, offset) of every ARRIVE record, in arrival order
+        scanned_index = []
+        self.final_time = 0
+        for offset in range(HEADER.size, end, size):
+            if data[offset] not in (RUN, ARRIVE, CHECKPOINT):
+                continue
+            kind, time, pid, _, fields, _ = self._read(offset)
+            if kind == RUN:
+                run_end = fields[6] + 1
+                if self.gantt and self.gantt[-1][0] == pid:
+                    self.gantt[-1][2] = run_end
+                else:
+                    self.gantt.append([pid, time, run_end])
+                self.final_time = max(self.final_time, run_end - 1)
+            elif kind == ARRIVE:
+                self.arrivals.append((fields[0], offset))
+            elif kind == CHECKPOINT:
+                scanned_index.append((time, offset))
+        if end > HEADER.size:
+            self.final_time = max(self.final_time, self._read(end - size)[1])
+        self.index = scanned_index if index is None else index
+        self.index_times = [time for time, _ in self.index]
+        self.gantt_starts = [start for _, start, _ in self.gantt]
+        self.arrival_times = [time for time, _ in self.arrivals]
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def _read(self, offset):
+        kind, time, pid, ref, *rest = self.record.unpack_from(self.data, offset)
+        return kind, time, decode_pid(pid), decode_pid(ref), tuple(rest[:7]), rest[7]
+
+    def gantt_at(self, t):
+        """Gantt segments up to the end of time unit t"""
+        count = bisect.bisect_right(self.gantt_starts, t)
+        segments = [list(segment) for segment in self.gantt[:count]]
+        if segments:
+            segments[-1][2] = min(segments[-1][2], t + 1)
+        return segments
+
+    def decision_at(self, offset):
+        """The dispatch recorded at offset, shaped like a SimulationWorker decision"""
+        kind, time, pid, traditional_pid, fields, attention_score = self._read(offset)
+        selected = _process_state(pid, fields)
+        candidates = []
+        offset += self.record.size
+        while offset < self.end:
+            kind, _, cpid, _, cfields, _ = self._read(offset)
+            if kind != CANDIDATE:
+                break
+            candidates.append(_process_state(cpid, cfields))
+            offset += self.record.size
+        candidates.append(selected)
+        # The traditional pick is stored among the candidates
+        traditional = [q for q in candidates if q.pid == traditional_pid]
+        comparison = None
+        if traditional:
+            comparison = compare_choices(self.algorithm, self.policy, time, selected, traditional[0],
+                                         attention_score)
+        return {
+            'time': time,
+            'candidates': tuple(candidates),
+            'running': selected,
+            'dispatched': True,
+            'comparison': comparison,
+            'scores': score_batch(candidates, time, self.policy),
+        }
+
+    def snapshot(self, t, ready_window=(0, WAITING_PREVIEW), waiting_window=(0, WAITING_PREVIEW)):
+        """Scheduler state at the end of time unit t, in the same shape as
+        the SimulationWorker snapshots the GUI renders. The windows are the
+        (offset, count) rows of the ready queue (by attention) and of the
+        upcoming arrivals to include."""
+        t = max(0, min(t, self.final_time))
+        size = self.record.size
+        i = bisect.bisect_right(self.index_times, t) - 1
+        if i < 0:
+            raise ValueError(f"{self.path}: no checkpoint before time {t}")
+        offset = self.index[i][1]
+
+        _, _, _, _, counters, _ = self._read(offset)
+        completed, total_waiting, total_turnaround, ready_count, last_dispatch, _, has_running = counters
+        ready = {}
+        offset += size
+        for _ in range(ready_count):
+            _, _, pid, _, fields, _ = self._read(offset)
+            ready[pid] = fields
+            offset += size
+        running = None
+        if has_running:
+            _, _, pid, _, fields, _ = self._read(offset)
+            running = (pid, fields)
+            offset += size
+
+        # Apply the records up to t; a slice still running at t is cut short
+        while offset < self.end:
+            kind, time, pid, _, fields, _ = self._read(offset)
+            if time > t:
+                break
+            if kind == ARRIVE:
+                ready[pid] = fields
+            elif kind == DISPATCH:
+                ready.pop(pid, None)
+                running = (pid, fields)
+                last_dispatch = offset
+            elif kind == RUN:
+                arrival, burst, priority, remaining, start, executed, last = fields
+                unrun = max(last - t, 0)
+                running = (pid, (arrival, burst, priority, remaining + unrun, start, executed - unrun, last - unrun))
+            elif kind == PREEMPT:
+                ready[pid] = fields
+                running = None
+            elif kind == FINISH:
+                turnaround = time + 1 - fields[0]
+                completed += 1
+                total_waiting += turnaround - fields[1]
+                total_turnaround += turnaround
+                running = None
+            offset += size
+
+        # Event-driven runs admit processes that arrive mid-slice only at the
+        # next decision; they are recorded there but were already queued at t
+        while offset < self.end:
+            kind, _, pid, _, fields, _ = self._read(offset)
+            if kind in (RUN, DISPATCH):
+                break
+            if kind == ARRIVE and fields[0] <= t:
+                ready[pid] = fields
+            offset += size
+
+        ready_offset, ready_rows = ready_window
+        ready_states = sorted((_process_state(pid, fields) for pid, fields in ready.items()),
+                              key=attention_key(self.algorithm, self.policy))
+        ready_states = tuple(ready_states[ready_offset:ready_offset + ready_rows])
+        waiting_offset, waiting_rows = waiting_window
+        first = bisect.bisect_right(self.arrival_times, t)
+        waiting = []
+        for _, arrival_offset in self.arrivals[first + waiting_offset:first + waiting_offset + waiting_rows]:
+            _, _, pid, _, fields, _ = self._read(arrival_offset)
+            waiting.append(_process_state(pid, fields))
+        return {
+            'time': t,
+            'decision': self.decision_at(last_dispatch) if last_dispatch >= 0 else None,
+            'running': _process_state(*running) if running else None,
+            'ready': ready_states,
+            'ready_scores': score_batch(ready_states, t, self.policy),
+            'ready_count': len(ready),
+            'ready_offset': ready_offset,
+            'waiting': tuple(waiting),
+            'waiting_count': len(self.arrivals) - first,
+            'waiting_offset': waiting_offset,
+            'completed': completed,
+            'gantt_start': 0,
+            'gantt_tail': tuple(tuple(segment) for segment in self.gantt_at(t)),
+            'finished': t >= self.final_time,
+            'avg_waiting': total_waiting / completed if completed else None,
+            'avg_turnaround': total_turnaround / completed if completed else None,
+        }
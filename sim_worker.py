@@ -0,0 +1,180 @@
+"""Background simulation thread.
+
+Runs a SchedulerEngine off the Tk main loop and publishes one immutable
+snapshot per frame. Snapshots go through a single-slot deque: the worker
+appends, the UI pops whatever is newest when it polls, and older frames the
+UI never got to are simply dropped. The engine's own objects never cross
+threads; processes are copied into ProcessState tuples and scores into a
+frozen AttentionBatch.
+"""
+
+import threading
+from collections import deque
+from time import perf_counter
+
+from attention import score_batch
+
+# Simulation speed: 1x renders one time unit every BASE_TICK_MS; faster speeds
+# simulate several ticks per frame and render at most once every FRAME_MS
+BASE_TICK_MS = 600
+FRAME_MS = 33
+MAX_SPEED_BUDGET = 0.025  # seconds of simulation per frame at "Max"
+QUEUE_ROWS = 20  # queue panel rows published until the UI asks for a window
+DECISION_CANDIDATES = 8  # best-scored ready processes copied into each decision
+SPEEDS = {"1x": 1, "2x": 2, "5x": 5, "10x": 10, "100x": 100, "1000x": 1000, "Max": None}
+
+
+def frame_timing(multiplier):
+    """Delay before the next frame (ms) and ticks to simulate in this one (None = max speed)"""
+    if multiplier is None:
+        return FRAME_MS, None
+    tick_ms = BASE_TICK_MS / multiplier
+    delay = max(FRAME_MS, tick_ms)
+    return round(delay), max(1, round(delay / tick_ms))
+
+
+class SimulationWorker(threading.Thread):
+    def __init__(self, engine, multiplier=1):
+        super().__init__(daemon=True)
+        self.engine = engine
+        # Written by the UI thread; single attribute stores are atomic
+        self.multiplier = multiplier
+        self.consumed_segments = 0
+        self.snapshots = deque(maxlen=1)
+        self.resumed = threading.Event()
+        self.resumed.set()
+        self.stopped = threading.Event()
+        # (offset, rows) of each queue panel, written by the UI thread
+        self.ready_window = (0, QUEUE_ROWS)
+        self.waiting_window = (0, QUEUE_ROWS)
+        # Held while the engine advances, so the UI can read the queues in between
+        self.lock = threading.Lock()
+        self.current_time = 0
+
+    def pause(self):
+        self.resumed.clear()
+
+    def resume(self):
+        self.resumed.set()
+
+    def stop(self):
+        self.stopped.set()
+        self.resumed.set()
+
+    def latest(self):
+        """Newest unread snapshot, or None"""
+        try:
+            return self.snapshots.pop()
+        except IndexError:
+            return None
+
+    def run(self):
+        # cProfile only follows the thread that enables it
+        profiler = self.engine.profiler
+        if profiler is not None:
+            profiler.enable()
+        try:
+            self.run_frames()
+        finally:
+            if profiler is not None:
+                profiler.disable()
+
+    def run_frames(self):
+        engine = self.engine
+        while not engine.finished:
+            self.resumed.wait()
+            if self.stopped.is_set():
+                return
+            started = perf_counter()
+            delay, ticks = frame_timing(self.multiplier)
+            with self.lock:
+                snapshot = self.simulate_frame(ticks)
+            self.snapshots.append(snapshot)
+            if engine.finished:
+                return
+            remaining = delay / 1000 - (perf_counter() - started)
+            if remaining > 0 and self.stopped.wait(remaining):
+                return
+
+    def simulate_frame(self, ticks):
+        """Advance the engine by one frame and return its snapshot"""
+        engine = self.engine
+
+        # Simulate all but the last tick of this frame without snapshotting
+        event = None
+        if ticks is None:
+            deadline = perf_counter() + MAX_SPEED_BUDGET
+            while not engine.finished and perf_counter() < deadline:
+                event = engine.advance()
+        else:
+            target = engine.time + ticks - 1
+            while not engine.finished and engine.time < target:
+                event = engine.advance(target - engine.time)
+
+        # The last tick is captured before it executes, as the attention
+        # layer saw it, and again afterwards
+        decision = None
+        if not engine.finished:
+            event = engine.decide()
+            # Only the best few candidates are drawn, so only they are copied
+            top = engine.ready.smallest(DECISION_CANDIDATES, 'attention')
+            if event['running']:
+                top.append(event['running'])
+            candidates = tuple(p.state() for p in top)
+            decision = {
+                'time': event['time'],
+                'candidates': candidates,
+                'candidate_count': len(engine.ready) + (1 if event['running'] else 0),
+                'running': candidates[-1] if event['running'] else None,
+                'dispatched': event['dispatched'] is not None,
+                # The record of the last dispatch; records are never modified once made
+                'comparison': engine.comparison,
+                'scores': score_batch(candidates, event['time'], engine.policy),
+            }
+            engine.execute(event)
+
+        return self.snapshot(event, decision)
+
+    def queues(self, current_time):
+        """The visible rows of the ready queue (by attention) and of the upcoming arrivals.
+
+        Rows come off the attention heap and the sorted arrivals, so the cost
+        depends on the window, not on the length of either queue.
+        """
+        engine = self.engine
+        ready_offset, ready_rows = self.ready_window
+        ready = tuple(p.state() for p in engine.ready.smallest(ready_offset + ready_rows, 'attention')[ready_offset:])
+        waiting_offset, waiting_rows = self.waiting_window
+        return {
+            'ready': ready,
+            'ready_scores': score_batch(ready, current_time, engine.policy),
+            'ready_count': len(engine.ready),
+            'ready_offset': ready_offset,
+            'waiting': tuple(p.state() for p in engine.waiting_window(waiting_offset, waiting_rows)),
+            'waiting_count': engine.waiting_count(),
+            'waiting_offset': waiting_offset,
+            'completed': engine.completed_count,
+        }
+
+    def queue_snapshot(self):
+        """queues() at the last snapshot's time, for the UI thread (e.g. after a scroll)"""
+        with self.lock:
+            return self.queues(self.current_time)
+
+    def snapshot(self, event, decision):
+        engine = self.engine
+        current_time = event['time'] + event['span'] - 1
+        self.current_time = current_time
+        start = max(self.consumed_segments - 1, 0)
+        snapshot = {
+            'time': current_time,
+            'decision': decision,
+            'running': event['running'].state() if event['running'] else None,
+            'gantt_start': start,
+            'gantt_tail': tuple(tuple(segment) for segment in engine.gantt[start:]),
+            'finished': engine.finished,
+            'avg_waiting': engine.total_waiting / engine.completed_count if engine.completed_count else None,
+            'avg_turnaround': engine.total_turnaround / engine.completed_count if engine.completed_count else None,
+        }
+        snapshot.update(self.queues(current_time))
+        return snapshot
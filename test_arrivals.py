@@ -0,0 +1,61 @@
+"""Arrival cursor: admission order and the not-yet-arrived window."""
+
+import random
+
+import pytest
+
+import scheduler
+from process import Process
+from scheduler import SchedulerEngine
+
+
+def specs(seed=0, n=50):
+    rng = random.Random(seed)
+    return [(f"p{i}", rng.randint(0, 60), rng.randint(1, 4), rng.randint(0, 3)) for i in range(n)]
+
+
+def admissions(engine):
+    """time -> PIDs admitted at that time"""
+    admitted = {}
+    while not engine.finished:
+        event = engine.step()
+        if event['arrived']:
+            admitted[event['time']] = [p.pid for p in event['arrived']]
+    return admitted
+
+
+def expected_admissions(workload):
+    admitted = {}
+    for pid, arrival, _, _ in sorted(workload, key=lambda s: s[1]):
+        admitted.setdefault(arrival, []).append(pid)
+    return admitted
+
+
+def test_unsorted_input_is_admitted_in_arrival_order():
+    workload = specs()
+    engine = SchedulerEngine("FCFS", [Process(*s) for s in workload])
+    assert admissions(engine) == expected_admissions(workload)
+
+
+@pytest.mark.parametrize("chunk", [1, 3, 1000])
+def test_streamed_input_is_admitted_the_same_way(monkeypatch, chunk):
+    monkeypatch.setattr(scheduler, "STREAM_CHUNK", chunk)
+    workload = sorted(specs(1), key=lambda s: s[1])
+    engine = SchedulerEngine("SJF", iter([Process(*s) for s in workload]))
+    assert admissions(engine) == expected_admissions(workload)
+
+
+def test_waiting_window_tracks_the_cursor():
+    workload = specs(2)
+    engine = SchedulerEngine("FCFS", [Process(*s) for s in workload])
+    order = [s[0] for s in sorted(workload, key=lambda s: s[1])]
+    arrivals = {s[0]: s[1] for s in workload}
+    while not engine.finished:
+        t = engine.step()['time']
+        pending = [pid for pid in order if arrivals[pid] > t]
+        assert engine.waiting_count() == len(pending)
+        assert [p.pid for p in engine.waiting] == pending
+        assert [p.pid for p in engine.waiting_window(2, 5)] == pending[2:7]
+        assert engine.has_waiting() == bool(pending)
+        if pending:
+            assert engine.next_arrival_time() == arrivals[pending[0]]
@@ -0,0 +1,154 @@
+"""Attention scoring: policies, and batch and cached scores against per-process scores."""
+
+import random
+
+import pytest
+
+import attention
+from attention import DEFAULT_POLICY, FEATURE_NAMES, POLICIES, AttentionCache, ScoringPolicy, get_policy, score_batch
+from process import Process
+from scheduler import ALGORITHMS, SchedulerEngine, simulate
+from workload import synthetic_workload
+
+
+def ready_queue(seed=0, n=60):
+    rng = random.Random(seed)
+    procs = []
+    for i in range(n):
+        p = Process(f"p{i}", rng.randint(0, 20), rng.randint(1, 9), rng.randint(0, 4))
+        p.remaining = rng.randint(1, p.burst)
+        p.executed_slices = p.burst - p.remaining
+        p.last_executed = rng.choice([-1, p.arrival + rng.randint(0, 5)])
+        procs.append(p)
+    # Exact copies give tied scores
+    procs += [Process(f"t{i}", 3, 4, 1) for i in range(5)]
+    return procs
+
+
+@pytest.fixture(params=["numpy", "lists"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        if attention.load_numpy() is None:
+            pytest.skip("NumPy is not installed")
+    else:
+        monkeypatch.setattr(attention, "np", None)
+        monkeypatch.setattr(attention, "_numpy_loaded", True)
+    return request.param
+
+
+@pytest.mark.parametrize("policy", list(POLICIES.values()), ids=list(POLICIES))
+def test_batch_matches_per_process_scores(backend, policy):
+    procs = ready_queue()
+    batch = score_batch(procs, 30, policy)
+    assert len(batch) == len(procs) and procs[0] in batch
+    for p in procs:
+        assert batch.score(p) == policy.score(p, 30)
+        assert batch.components(p) == pytest.approx(policy.components(p, 30))
+    assert batch.as_dict() == {p.pid: policy.score(p, 30) for p in procs}
+
+
+def test_ranked_and_top_keep_ties_in_batch_order(backend):
+    procs = ready_queue(1)
+    batch = score_batch(procs, 25)
+    expected = sorted(procs, key=lambda p: DEFAULT_POLICY.score(p, 25), reverse=True)
+    assert batch.ranked() == expected
+    for k in (0, 1, 5, 30, len(procs), len(procs) + 3):
+        assert batch.top(k) == expected[:k]
+
+
+def test_sweep_scores_every_policy(backend):
+    procs = ready_queue(2)
+    batch = score_batch(procs, 40)
+    policies = list(POLICIES.values())
+    rows = batch.sweep(policies)
+    assert len(rows) == len(policies)
+    for policy, row in zip(policies, rows):
+        assert [float(score) for score in row] == [policy.score(p, 40) for p in procs]
+
+
+def test_empty_batch(backend):
+    batch = score_batch([], 0)
+    assert len(batch) == 0 and batch.ranked() == [] and batch.top(3) == []
+    assert set(batch.features) == set(FEATURE_NAMES)
+
+
+def test_cache_follows_time_and_invalidation():
+    procs = ready_queue(3)
+    policy = POLICIES["fair"]
+    cache = AttentionCache(policy)
+    for t in (30, 31, 31, 45):
+        assert [cache.score(p, t) for p in procs] == [policy.score(p, t) for p in procs]
+    p = procs[0]
+    p.remaining = max(1, p.remaining - 1)
+    p.executed_slices += 1
+    p.last_executed = 45
+    cache.invalidate(p)
+    assert cache.score(p, 46) == policy.score(p, 46)
+    view = cache.scores(procs, 46)
+    assert len(view) == len(procs) and p in view
+    assert view.as_dict() == {q.pid: policy.score(q, 46) for q in procs}
+    assert view.top(4) == sorted(procs, key=lambda q: policy.score(q, 46), reverse=True)[:4]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_engine_cache_stays_exact_through_a_run(algorithm):
+    engine = SchedulerEngine(algorithm, list(synthetic_workload("bursty", 40, 8)), 2, policy="short-jobs")
+    while not engine.finished:
+        event = engine.decide()
+        t = event['time']
+        for p in list(engine.ready) + ([event['running']] if event['running'] else []):
+            assert engine.attention.score(p, t) == engine.policy.score(p, t)
+        engine.execute(event)
+
+
+def original_score(p, t):
+    """The attention score as first written, before policies existed"""
+    recency = t - (p.arrival if p.last_executed == -1 else p.last_executed)
+    return 0.4 * recency + 0.3 * (1 / p.remaining) + 0.2 * (1 / (1 + p.executed_slices)) + 0.1 * (1 / (1 + p.priority))
+
+
+def test_default_policy_keeps_the_original_score():
+    for p in ready_queue(4):
+        assert DEFAULT_POLICY.score(p, 33) == original_score(p, 33)
+        assert p.attention_score(33) == p.attention_score(33, 12) == original_score(p, 33)
+
+
+def test_process_methods_take_policy_by_keyword():
+    p = ready_queue(5)[0]
+    policy = POLICIES["short-jobs"]
+    assert p.attention_score(33, policy=policy) == policy.score(p, 33)
+    assert p.attention_offset(policy=policy) == policy.offset(p)
+    assert p.get_attention_components(33, policy=policy) == policy.components(p, 33)
+    with pytest.raises(TypeError):
+        p.attention_score(33, 12, policy)
+
+
+@pytest.mark.parametrize("policy", list(POLICIES.values()) + [ScoringPolicy("zeros", 0.5, 0, 0.5, 0)],
+                         ids=list(POLICIES) + ["zeros"])
+def test_offset_and_terms_agree_with_score(policy):
+    w = policy.weights['recency']
+    for p in ready_queue(6):
+        for t in (25, 90):
+            assert policy.score(p, t) == pytest.approx(w * t + policy.offset(p))
+            reference = p.arrival if p.last_executed == -1 else p.last_executed
+            assert policy.from_terms(reference, policy.static_terms(p), t) == policy.score(p, t)
+            components = policy.components(p, t)
+            assert sum(components[f"{name}_weighted"] for name in FEATURE_NAMES) == pytest.approx(policy.score(p, t))
+
+
+def test_get_policy():
+    assert get_policy("fair") is POLICIES["fair"]
+    assert get_policy(DEFAULT_POLICY) is DEFAULT_POLICY
+    assert get_policy("1, 0, 0.5, 0").vector == (1.0, 0.0, 0.5, 0.0)
+    for spec in ("nope", "1,2,3", "a,b,c,d"):
+        with pytest.raises(ValueError):
+            get_policy(spec)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_scaling_the_weights_changes_no_decision(algorithm):
+    procs = lambda: list(synthetic_workload("uniform", 40, 9))
+    base = simulate(algorithm, procs(), policy="0.3,0.5,0.15,0.05")
+    scaled = simulate(algorithm, procs(), policy="0.6,1.0,0.3,0.1")
+    assert base['gantt'] == scaled['gantt']
+    assert [r['selected'] for r in base['selection_history']] == [r['selected'] for r in scaled['selection_history']]
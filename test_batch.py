@@ -0,0 +1,57 @@
+"""Batch experiment runner rows and error handling."""
+
+import pytest
+
+from batch import RESULT_FIELDS, experiment_grid, main, run_experiment
+
+WORKLOAD = "pid,arrival,burst,priority\nA,0,3,1\nB,1,2,0\n"
+
+
+@pytest.fixture
+def good(tmp_path):
+    path = tmp_path / "good.csv"
+    path.write_text(WORKLOAD)
+    return str(path)
+
+
+def test_grid_only_varies_quantum_for_round_robin():
+    tasks = experiment_grid(["w.csv"], ["FCFS", "Round Robin"], quanta=(1, 4))
+    assert tasks == [("w.csv", "FCFS", 1), ("w.csv", "Round Robin", 1), ("w.csv", "Round Robin", 4)]
+
+
+def test_result_row(good):
+    row = run_experiment((good, "FCFS", 2))
+    assert set(row) == set(RESULT_FIELDS)
+    assert row["error"] == ""
+    assert (row["processes"], row["makespan"], row["quantum"]) == (2, 5, "")
+
+
+@pytest.mark.parametrize("contents, quantum", [
+    (None, 2),                                              # missing file
+    ("pid,arrival,burst,priority\nA,x,3,1\n", 2),           # unparsable value
+    (WORKLOAD, 0),                                          # rejected by the engine
+])
+def test_failed_task_gives_error_row(tmp_path, contents, quantum):
+    path = tmp_path / "w.csv"
+    if contents is not None:
+        path.write_text(contents)
+    row = run_experiment((str(path), "Round Robin", quantum))
+    assert row["error"]
+    assert "makespan" not in row
+
+
+def test_bad_file_does_not_fail_the_batch(good, tmp_path, capsys):
+    out = tmp_path / "results.csv"
+    with pytest.raises(SystemExit) as exit_info:
+        main([good, str(tmp_path / "missing.csv"), "--algorithms", "FCFS", "--workers", "1",
+              "--output", str(out)])
+    assert exit_info.value.code == 1
+    lines = out.read_text().splitlines()
+    assert len(lines) == 3 and lines[1].endswith(",")
+    assert "missing.csv" in capsys.readouterr().err
+
+
+def test_quantum_below_one_is_a_usage_error(good):
+    with pytest.raises(SystemExit) as exit_info:
+        main([good, "--quantum", "0"])
+    assert exit_info.value.code == 2
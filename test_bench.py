@@ -0,0 +1,26 @@
+"""Benchmark case bookkeeping."""
+
+from bench import benchmark_cases, compare
+
+
+def row(seconds, event_driven=True, status="ok"):
+    return {"benchmark": "engine", "workload": "uniform", "processes": 100, "algorithm": "FCFS",
+            "event_driven": event_driven, "status": status, "seconds": seconds}
+
+
+def test_cases_only_vary_the_algorithm_for_the_engine():
+    cases = benchmark_cases(["engine", "score_batch"], ["uniform"], [10], ["FCFS", "SJF"], False, 5)
+    assert cases == [("engine", "uniform", 10, "FCFS", False, 5), ("engine", "uniform", 10, "SJF", False, 5),
+                     ("score_batch", "uniform", 10, "", False, 5)]
+
+
+def test_compare_reports_slower_cases():
+    assert compare([row(1.5)], [row(1.0)]) == [(row(1.5), 1.0, 1.5)]
+    assert compare([row(1.1)], [row(1.0)]) == []
+    assert compare([row(5.0, status="timeout")], [row(1.0)]) == []
+
+
+def test_compare_keeps_stepped_and_event_driven_runs_apart():
+    baseline = [row(10.0, event_driven=False), row(1.0, event_driven=True)]
+    assert compare([row(2.0, event_driven=True)], baseline) == [(row(2.0, event_driven=True), 1.0, 2.0)]
+    assert compare([row(2.0, event_driven=False)], baseline) == []
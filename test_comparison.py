@@ -0,0 +1,52 @@
+"""Per-decision comparison records against the ready queue they were made from."""
+
+import pytest
+
+from comparison import COMPONENT_KEYS, describe_reason
+from ready_queue import TRADITIONAL_INDEX
+from scheduler import ALGORITHMS, SchedulerEngine
+from workload import synthetic_workload
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_records_match_a_scan_of_the_ready_queue(algorithm):
+    engine = SchedulerEngine(algorithm, list(synthetic_workload("equal_priority", 40, 6)), 2,
+                             selection_history=[])
+    policy = engine.policy
+    criterion = TRADITIONAL_INDEX.get(algorithm, 'fifo')
+    decisions = 0
+    while not engine.finished:
+        t = engine.time
+        before = list(engine.ready) if engine.current_process is None else []
+        event = engine.decide()
+        if event['dispatched'] is not None:
+            decisions += 1
+            # decide() admits arrivals first; they join the back of the queue
+            queue = before + [p for p in event['arrived'] if p not in before]
+            record = event['record']
+            assert record is engine.comparison is engine.selection_history[-1]
+
+            if criterion == 'fifo':
+                traditional = queue[0]
+            else:
+                traditional = min(queue, key=lambda p: getattr(p, criterion))
+            assert record['traditional'] == traditional.pid
+            assert record['reason'] == (criterion, getattr(traditional, criterion) if criterion != 'fifo' else 0)
+
+            scores = {p.pid: policy.score(p, t) for p in queue}
+            assert record['attention_score'] == scores[record['selected']] == max(scores.values())
+            assert record['override'] == (record['selected'] != record['traditional'])
+            assert record['components'] == policy.components(event['dispatched'], t)
+            assert set(record['components']) == set(COMPONENT_KEYS)
+        engine.execute(event)
+
+    history = engine.selection_history
+    assert engine.decisions == decisions == len(history)
+    assert engine.overrides == sum(record['override'] for record in history)
+
+
+def test_describe_reason():
+    assert describe_reason(('fifo', 0)) == "first in queue"
+    assert describe_reason(('arrival', 3)) == "earliest arrival time (3)"
+    assert describe_reason(('remaining', 2)) == "shortest remaining time (2)"
+    assert describe_reason(('priority', 0)) == "highest priority (0)"
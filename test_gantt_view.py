@@ -0,0 +1,55 @@
+"""Interval index behind the level-of-detail Gantt view."""
+
+import random
+
+from gantt_view import SegmentIndex
+
+
+def segments(seed=0, n=200):
+    rng = random.Random(seed)
+    history, t = [], 0
+    for i in range(n):
+        t += rng.randint(0, 3)
+        duration = rng.randint(1, 5)
+        history.append([f"p{i % 7}", t, t + duration])
+        t += duration
+    return history
+
+
+def brute_span(history, t0, t1):
+    return [i for i, (_, start, end) in enumerate(history) if start < t1 and end > t0]
+
+
+def brute_busy(history, t0, t1):
+    return sum(max(0, min(end, t1) - max(start, t0)) for _, start, end in history)
+
+
+def test_span_and_busy_match_a_scan():
+    history = segments()
+    index = SegmentIndex()
+    index.sync(history)
+    assert len(index) == len(history)
+    rng = random.Random(1)
+    end = history[-1][2]
+    for _ in range(500):
+        t0 = rng.randint(-5, end + 5)
+        t1 = t0 + rng.randint(1, 60)
+        lo, hi = index.span(t0, t1)
+        assert list(range(lo, hi)) == brute_span(history, t0, t1)
+        assert index.busy(t0, t1) == brute_busy(history, t0, t1)
+
+
+def test_sync_follows_a_growing_last_segment():
+    history = segments(2, 50)
+    index = SegmentIndex()
+    for n in range(1, len(history) + 1):
+        grown = [list(s) for s in history[:n]]
+        final_end = grown[-1][2]
+        grown[-1][2] = grown[-1][1] + 1  # the running segment starts short
+        index.sync(grown)
+        grown[-1][2] = final_end
+        index.sync(grown)
+        assert index.ends == [s[2] for s in grown]
+        assert index.busy(0, final_end) == brute_busy(grown, 0, final_end)
+    durations = [end - start for _, start, end in history[:-1]]
+    assert index.min_duration == min(durations)
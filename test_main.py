@@ -0,0 +1,81 @@
+"""Headless command-line entry point."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from main import main
+from scheduler import simulate
+from workload import load_workload
+
+WORKLOAD = "pid,arrival,burst,priority\nA,0,5,2\nB,1,3,0\nC,2,1,1\nD,9,2,0\n"
+
+
+@pytest.fixture
+def workload(tmp_path):
+    path = tmp_path / "w.csv"
+    path.write_text(WORKLOAD)
+    return str(path)
+
+
+def test_importing_main_does_not_load_tk():
+    code = "import sys, main; sys.exit('tkinter' in sys.modules or 'priorities' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+def test_summary(workload, capsys):
+    assert main(["simulate", "--algo", "SJF", "--input", workload]) == 0
+    out = capsys.readouterr().out
+    expected = simulate("SJF", load_workload(workload))
+    assert "Algorithm:       SJF" in out
+    assert f"Makespan:        {expected['makespan']}" in out
+    assert f"Avg waiting:     {expected['avg_waiting']:.2f}" in out
+
+
+@pytest.mark.parametrize("extra", [
+    [], ["--tick"], ["--stream"], ["--cpus", "2"], ["--quantum", "3", "--policy", "fair"],
+])
+def test_json_matches_the_library(workload, tmp_path, extra):
+    out = tmp_path / "out.json"
+    args = ["simulate", "--algo", "Round Robin", "--input", workload, "--format", "json", "--output", str(out)]
+    assert main(args + extra) == 0
+    result = json.loads(out.read_text())
+    quantum = 3 if "--quantum" in extra else 2
+    policy = "fair" if "--policy" in extra else None
+    cpus = 2 if "--cpus" in extra else 1
+    expected = simulate("Round Robin", load_workload(workload), quantum, policy=policy, cpus=cpus)
+    assert result['makespan'] == expected['makespan']
+    assert result['avg_waiting'] == expected['avg_waiting']
+    assert result['decisions'] == expected['decisions']
+    assert 'selection_history' not in result
+
+
+def test_history_is_included_on_request(workload, capsys):
+    assert main(["simulate", "--algo", "FCFS", "--input", workload, "--format", "json", "--history"]) == 0
+    result = json.loads(capsys.readouterr().out)
+    assert [record['selected'] for record in result['selection_history']] == ["A", "B", "C", "D"]
+
+
+def test_errors_are_reported_without_a_traceback(tmp_path, capsys):
+    assert main(["simulate", "--algo", "FCFS", "--input", str(tmp_path / "missing.csv")]) == 1
+    assert capsys.readouterr().err.startswith("error: ")
+    bad = tmp_path / "bad.jsonl"
+    bad.write_text('{"pid": "A", "arrival": 0.5, "burst": 1, "priority": 0}\n')
+    assert main(["simulate", "--algo", "FCFS", "--input", str(bad)]) == 1
+    assert "bad.jsonl:1" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("option", ["--quantum", "--cpus"])
+def test_counts_below_one_are_usage_errors(workload, option):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["simulate", "--algo", "FCFS", "--input", workload, option, "0"])
+    assert exit_info.value.code == 2
+
+
+def test_tools_are_dispatched(workload, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["batch", workload, "--quantum", "0"])
+    assert exit_info.value.code == 2
+    assert "--quantum" in capsys.readouterr().err
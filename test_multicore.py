@@ -0,0 +1,91 @@
+"""Multi-CPU engine invariants."""
+
+from collections import defaultdict
+
+import pytest
+
+from multicore import MultiCoreEngine
+from scheduler import SchedulerEngine
+from workload import synthetic_workload
+
+ALGORITHMS = ["FCFS", "SJF", "Priority", "Round Robin"]
+N = 40
+LAYOUTS = [(2, False, True), (3, True, True), (4, True, False)]  # cpus, per-CPU queues, work stealing
+
+
+def procs(kind="bursty"):
+    return list(synthetic_workload(kind, N, 5))
+
+
+def run(algorithm, layout, kind="bursty", event_driven=True):
+    cpus, per_cpu_queues, work_stealing = layout
+    return MultiCoreEngine(algorithm, procs(kind), cpus, 2, per_cpu_queues, work_stealing).run(event_driven)
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_no_process_runs_twice_at_once_and_work_is_conserved(algorithm, layout):
+    result = run(algorithm, layout)
+    bursts = {p.pid: p for p in procs()}
+    assert result['processes'] == N and len(result['lanes']) == layout[0]
+
+    by_pid = defaultdict(list)
+    for lane in result['lanes']:
+        for (_, _, end), (_, start, _) in zip(lane, lane[1:]):
+            assert end <= start  # one process at a time per CPU
+        for pid, start, end in lane:
+            assert start < end
+            by_pid[pid].append((start, end))
+
+    for pid, segments in by_pid.items():
+        segments.sort()
+        for (_, end), (start, _) in zip(segments, segments[1:]):
+            assert end <= start  # never on two CPUs at once
+        p = bursts[pid]
+        metrics = result['metrics'][pid]
+        assert sum(end - start for start, end in segments) == p.burst
+        assert segments[0][0] >= p.arrival and segments[0][0] == metrics['start']
+        assert segments[-1][1] == metrics['finish']
+        assert metrics['waiting_time'] == metrics['finish'] - p.arrival - p.burst
+
+    busy = [sum(end - start for _, start, end in lane) for lane in result['lanes']]
+    assert sum(busy) == sum(p.burst for p in bursts.values())
+    assert result['utilization'] == [b / result['makespan'] for b in busy]
+    assert result['makespan'] == max(end for _, _, end in result['gantt'])
+
+
+@pytest.mark.parametrize("layout", LAYOUTS[:2])
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_no_cpu_idles_while_work_waits(algorithm, layout):
+    result = run(algorithm, layout)
+    busy = defaultdict(int)
+    for _, start, end in result['gantt']:
+        for t in range(start, end):
+            busy[t] += 1
+    for t in range(result['makespan']):
+        waiting = sum(1 for m in result['metrics'].values() if m['arrival'] <= t < m['finish'])
+        assert busy[t] == min(layout[0], waiting), t
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_event_driven_matches_stepping(algorithm, layout):
+    stepped = run(algorithm, layout, "uniform", event_driven=False)
+    jumped = run(algorithm, layout, "uniform", event_driven=True)
+    for key in ('lanes', 'metrics', 'makespan', 'decisions', 'overrides', 'steals'):
+        assert stepped[key] == jumped[key], key
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_one_cpu_matches_the_single_cpu_engine(algorithm):
+    multi = MultiCoreEngine(algorithm, procs(), cpus=1).run()
+    single = SchedulerEngine(algorithm, procs()).run()
+    assert multi['gantt'] == single['gantt']
+    assert multi['metrics'] == single['metrics']
+
+
+def test_rejected_configurations():
+    with pytest.raises(ValueError):
+        MultiCoreEngine("FCFS", procs(), cpus=0)
+    with pytest.raises(ValueError):
+        MultiCoreEngine("SRTF", procs(), cpus=2)
@@ -0,0 +1,95 @@
+"""Preemptive algorithms and attention preemption."""
+
+import random
+
+import pytest
+
+from process import Process
+from scheduler import SchedulerEngine, simulate
+
+
+def workload(seed, n=30, span=40):
+    rng = random.Random(seed)
+    return [(str(i), rng.randint(0, span), rng.randint(1, 12), rng.randint(0, 6)) for i in range(n)]
+
+
+def reference_finishes(specs, key):
+    """Finish times under textbook preemptive scheduling by key (smallest first).
+
+    Ties go to the longest-queued process; a preempted process queues up
+    behind the processes that arrived with the preemption.
+    """
+    procs = sorted((Process(*s) for s in specs), key=lambda p: p.arrival)
+    queue, finish, running, t, i = [], {}, None, 0, 0
+    while len(finish) < len(procs):
+        while i < len(procs) and procs[i].arrival <= t:
+            queue.append(procs[i])
+            i += 1
+        if running is None and queue:
+            running = min(queue, key=key)
+            queue.remove(running)
+        if running is None:
+            t += 1
+            continue
+        running.remaining -= 1
+        t += 1
+        if running.remaining == 0:
+            finish[running.pid] = t
+            running = None
+            continue
+        arrived = []
+        while i < len(procs) and procs[i].arrival <= t:
+            arrived.append(procs[i])
+            i += 1
+        queue += arrived
+        if arrived and min(map(key, queue)) < key(running):
+            queue.append(running)
+            running = None
+    return finish
+
+
+@pytest.mark.parametrize("algorithm, policy, key", [
+    ("SRTF", "0,1,0,0", lambda p: p.remaining),
+    ("Preemptive Priority", "0,0,0,1", lambda p: p.priority),
+])
+@pytest.mark.parametrize("seed", range(10))
+def test_matches_textbook_scheduling_when_attention_agrees(algorithm, policy, key, seed):
+    specs = workload(seed)
+    result = simulate(algorithm, [Process(*s) for s in specs], policy=policy)
+    assert {pid: m['finish'] for pid, m in result['metrics'].items()} == reference_finishes(specs, key)
+    assert result['overrides'] == 0
+
+
+@pytest.mark.parametrize("algorithm, threshold", [
+    ("SRTF", None), ("Preemptive Priority", None), ("SRTF", 0.05), ("FCFS", 0.05), ("Priority", 0.0),
+])
+@pytest.mark.parametrize("event_driven", [False, True])
+def test_every_preemption_hands_the_cpu_to_another_process(algorithm, threshold, event_driven):
+    engine = SchedulerEngine(algorithm, [Process(*s) for s in workload(1, 60, 80)], 2,
+                             selection_history=[], preempt_threshold=threshold)
+    preempted, count = None, 0
+    while not engine.finished:
+        event = engine.decide()
+        if preempted is not None:
+            assert event['dispatched'] is not None and event['dispatched'] is not preempted
+        preempted = None
+        engine.execute(event, engine.next_event_span(event) if event_driven else 1)
+        if event['preempted'] is not None:
+            preempted = event['preempted']
+            count += 1
+    assert engine.preemptions == count
+    assert engine.completed_count == 60
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.1, 1.0])
+def test_attention_preemption_is_the_same_event_driven(threshold):
+    specs = workload(2, 50, 60)
+    runs = [SchedulerEngine("SJF", [Process(*s) for s in specs], 2, selection_history=[],
+                            preempt_threshold=threshold).run(event_driven) for event_driven in (False, True)]
+    for key in ('gantt', 'metrics', 'preemptions', 'overrides'):
+        assert runs[0][key] == runs[1][key]
+    assert list(runs[0]['selection_history']) == list(runs[1]['selection_history'])
+
+
+def test_no_preemption_without_a_preemptive_setting():
+    assert simulate("SJF", [Process(*s) for s in workload(3)])['preemptions'] == 0
@@ -0,0 +1,47 @@
+"""Process records and the columnar process table."""
+
+import pytest
+
+from process import Process, ProcessState, ProcessTable
+from scheduler import simulate
+
+
+def test_process_has_no_instance_dict():
+    p = Process("A", 0, 3, 1)
+    with pytest.raises(AttributeError):
+        p.colour = "red"
+
+
+def test_state_is_an_immutable_copy():
+    p = Process("A", 2, 3, 1)
+    state = p.state()
+    assert isinstance(state, ProcessState)
+    assert (state.pid, state.arrival, state.burst, state.remaining, state.last_executed) == ("A", 2, 3, 3, -1)
+    p.remaining = 1
+    assert state.remaining == 3
+    with pytest.raises(AttributeError):
+        state.remaining = 0
+
+
+def test_table_round_trips_the_static_fields():
+    procs = [Process("A", 0, 3, 1), Process("B", 4, 1, 0), Process("C", 2, 7, 5)]
+    table = ProcessTable(procs)
+    assert len(table) == 3 and table
+    assert [(p.pid, p.arrival, p.burst, p.priority) for p in table] == [
+        (p.pid, p.arrival, p.burst, p.priority) for p in procs
+    ]
+    table.add("D", 1, 2, 3)
+    assert table[3].pid == "D" and table[-1].burst == 2
+    table.clear()
+    assert len(table) == 0 and not table and table.snapshot() == []
+
+
+def test_snapshots_are_fresh_for_every_run():
+    table = ProcessTable([Process("A", 0, 3, 1), Process("B", 1, 2, 0), Process("C", 2, 1, 2)])
+    first = table.snapshot()
+    result = simulate("SJF", first)
+    assert all(p.remaining == 0 for p in first)
+    second = table.snapshot()
+    assert all(p.remaining == p.burst and p.start is None and p.last_executed == -1 for p in second)
+    assert not set(map(id, first)) & set(map(id, second))
+    assert simulate("SJF", second)['gantt'] == result['gantt']
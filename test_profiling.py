@@ -0,0 +1,50 @@
+"""Per-phase hot-path profiler."""
+
+import pytest
+
+from profiling import PHASES, PhaseProfiler
+
+
+def test_totals_counts_and_means():
+    profiler = PhaseProfiler()
+    profiler.add("scoring", 0.25)
+    profiler.add("scoring", 0.75)
+    profiler.add("admission", 0.5)
+    report = profiler.report()
+    assert set(report) == set(PHASES)
+    assert report["scoring"] == {"total": 1.0, "count": 2, "mean": 0.5}
+    assert report["admission"] == {"total": 0.5, "count": 1, "mean": 0.5}
+    assert report["draw_gantt_chart"] == {"total": 0.0, "count": 0, "mean": 0.0}
+
+
+def test_lap_records_the_elapsed_time():
+    profiler = PhaseProfiler()
+    started = profiler.lap("candidates", 0.0)
+    assert profiler.counts["candidates"] == 1
+    assert profiler.totals["candidates"] == pytest.approx(started)
+    assert profiler.lap("candidates", started) >= started
+    assert profiler.counts["candidates"] == 2
+
+
+def test_breakdown_only_lists_timed_phases():
+    profiler = PhaseProfiler()
+    assert profiler.breakdown() == ""
+    profiler.add("scoring", 0.01)
+    assert profiler.breakdown().startswith("score ") and profiler.breakdown().endswith(" ms")
+    assert "gantt" not in profiler.breakdown()
+
+
+def test_dump_writes_folded_stacks(tmp_path):
+    profiler = PhaseProfiler(cprofile=True)
+    profiler.enable()
+    sum(range(1000))
+    profiler.disable()
+    profiler.add("scoring", 0.002)
+    profiler.add("draw_gantt_chart", 0.003)
+    path = str(tmp_path / "run.prof")
+    profiler.dump(path)
+    assert (tmp_path / "run.prof").stat().st_size > 0
+    assert (tmp_path / "run.prof.folded").read_text().splitlines() == [
+        "run;engine;scoring 2000",
+        "run;render;draw_gantt_chart 3000",
+    ]
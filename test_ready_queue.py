@@ -0,0 +1,136 @@
+"""Heap-indexed ready queue against brute-force sorting."""
+
+import random
+
+import pytest
+
+from process import Process
+from ready_queue import INDEX_KEYS, ReadyQueue, attention_key, attention_tie_key
+
+
+class Item:
+    """Queue entry with a hand-made (lead, rest) key and tie key"""
+
+    def __init__(self, pid, lead, rest, tie):
+        self.pid = pid
+        self.lead = lead
+        self.rest = rest
+        self.tie = tie
+
+
+def key(item):
+    return (item.lead, item.rest)
+
+
+def tie(item):
+    return item.tie
+
+
+class Model:
+    """The queue as a plain FIFO list"""
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.items = []
+
+    def by(self, name):
+        return [p for _, p in sorted(enumerate(self.items), key=lambda ip: (self.keys[name](ip[1]), ip[0]))]
+
+    def near_top(self, name, ties, tolerance=1e-9):
+        if not self.items:
+            return []
+        keys = self.keys[name]
+        lead = min(keys(p)[0] for p in self.items)
+        limit = lead + tolerance * (1 + abs(lead))
+        best = {}
+        for seq, p in enumerate(self.items):
+            value = keys(p)
+            if value[0] <= limit:
+                group = (value[0], ties(p))
+                if group not in best or (value[1:], seq) < best[group][0]:
+                    best[group] = ((value[1:], seq), p)
+        return [p for _, p in sorted(best.values(), key=lambda entry: entry[0])]
+
+
+def check(queue, model, name, ties):
+    # smallest() first, before peek() has had a chance to clean the root
+    for k in (1, 3, len(model.items) + 1):
+        assert queue.smallest(k, name) == model.by(name)[:k]
+        heap = queue.heaps[name]
+        # ... and it leaves no stale entry there for the next walk to step over
+        assert not heap or queue._stamp.get(heap[0][1]) == heap[0][2]
+    assert list(queue) == model.items
+    assert queue.ordered(name) == model.by(name)
+    assert queue.near_top(name) == model.near_top(name, ties)
+    assert queue.peek(name) is (model.by(name) or [None])[0]
+    assert queue.peek() is (model.items or [None])[0]
+
+
+def churn(queue, model, make, rng, steps, check_every=1, name=None, ties=None):
+    for step in range(steps):
+        roll = rng.random()
+        if model.items and roll < 0.3:
+            p = rng.choice(model.items)
+            queue.remove(p)
+            model.items.remove(p)
+        elif model.items and roll < 0.5:
+            # Pop the best one (leaving a stale root), sometimes requeueing it
+            p = queue.pop(name)
+            assert p is model.by(name)[0]
+            model.items.remove(p)
+            if rng.random() < 0.5:
+                queue.push(p)
+                model.items.append(p)
+        else:
+            p = make(step)
+            queue.push(p)
+            model.items.append(p)
+        assert len(queue) == len(model.items)
+        if step % check_every == 0:
+            check(queue, model, name, ties)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_grouped_index_matches_brute_force(seed):
+    rng = random.Random(seed)
+    leads = [1.0, 1.0 + 1e-12, 1.0 + 2e-12, 2.0, 3.0]
+
+    def make(i):
+        return Item(f"p{i}", rng.choice(leads), rng.randint(0, 2), rng.randint(0, 2))
+
+    queue = ReadyQueue({'attention': key}, {'attention': tie})
+    model = Model({'attention': key, 'fifo': lambda p: 0})
+    churn(queue, model, make, rng, 400, name='attention', ties=tie)
+
+
+@pytest.mark.parametrize("algorithm", ["FCFS", "SJF", "Priority", "Round Robin"])
+def test_attention_and_traditional_indexes_match_brute_force(algorithm):
+    rng = random.Random(algorithm)
+    attention = attention_key(algorithm)
+    ties = attention_tie_key()
+
+    def make(i):
+        p = Process(f"p{i}", rng.randint(0, 5), rng.randint(1, 4), rng.randint(0, 2))
+        p.remaining = rng.randint(1, p.burst)
+        p.executed_slices = p.burst - p.remaining
+        p.last_executed = rng.choice([-1, p.arrival + 1])
+        return p
+
+    queue = ReadyQueue({'attention': attention, **INDEX_KEYS}, {'attention': ties})
+    model = Model({'attention': attention, 'fifo': lambda p: 0, **INDEX_KEYS})
+    churn(queue, model, make, rng, 300, name='attention', ties=ties)
+    for name in INDEX_KEYS:
+        assert queue.ordered(name) == model.by(name)
+        assert queue.smallest(4, name) == model.by(name)[:4]
+
+
+def test_stale_entries_are_compacted():
+    queue = ReadyQueue({'attention': key}, {'attention': tie})
+    items = [Item(str(i), float(i % 7), 0, 0) for i in range(500)]
+    queue.extend(items)
+    for p in items[:490]:
+        queue.remove(p)
+    queue.push(Item("new", 0.0, 0, 1))
+    assert all(len(heap) <= 2 * len(queue) + 64 for heap in queue.heaps.values())
+    assert [p.pid for p in queue.near_top('attention')] == ["490", "new"]
+    assert [p.pid for p in queue.smallest(3, 'attention')] == ["490", "497", "new"]
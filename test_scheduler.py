@@ -0,0 +1,49 @@
+"""Equivalence checks for the headless scheduling engine."""
+
+import csv
+
+import pytest
+
+from scheduler import ALGORITHMS, SchedulerEngine
+from workload import FIELDS, SYNTHETIC_KINDS, load_workload, stream_workload, synthetic_workload
+
+SEED = 7
+N = 60
+
+
+def run(algorithm, procs, event_driven=True, quantum=2):
+    return SchedulerEngine(algorithm, procs, quantum).run(event_driven)
+
+
+def same_run(a, b):
+    for key in ('gantt', 'metrics', 'makespan', 'avg_waiting', 'avg_turnaround',
+                'decisions', 'overrides', 'preemptions'):
+        assert a[key] == b[key], key
+    assert list(a['selection_history']) == list(b['selection_history'])
+
+
+@pytest.mark.parametrize("kind", SYNTHETIC_KINDS)
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_event_driven_matches_stepping(algorithm, kind):
+    stepped = run(algorithm, list(synthetic_workload(kind, N, SEED)), event_driven=False)
+    jumped = run(algorithm, list(synthetic_workload(kind, N, SEED)), event_driven=True)
+    same_run(stepped, jumped)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_streamed_input_matches_list(algorithm, tmp_path):
+    path = str(tmp_path / "workload.csv")
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        for p in synthetic_workload("bursty", N, SEED):
+            writer.writerow([p.pid, p.arrival, p.burst, p.priority])
+
+    listed = run(algorithm, load_workload(path))
+    same_run(listed, run(algorithm, stream_workload(path)))
+    same_run(listed, run(algorithm, synthetic_workload("bursty", N, SEED), event_driven=False))
+
+
+def test_quantum_below_one_is_rejected():
+    with pytest.raises(ValueError):
+        SchedulerEngine("Round Robin", list(synthetic_workload("uniform", 5)), quantum=0)
@@ -0,0 +1,77 @@
+"""Bounded selection log: ring buffer, spill file and PID fields."""
+
+import gc
+import os
+
+import pytest
+
+from scheduler import SchedulerEngine
+from selection_log import PID_WIDTH, SelectionLog, decode_pid, encode_pid, read_log
+from workload import WorkloadError, load_workload, synthetic_workload
+
+N = 40
+
+
+def history(algorithm, log):
+    return SchedulerEngine(algorithm, list(synthetic_workload("uniform", N, 3)), 2,
+                           selection_history=log).run()['selection_history']
+
+
+def same_decisions(logged, full, top_k):
+    assert len(logged) == len(full)
+    for got, want in zip(logged, full):
+        for key in ('time', 'selected', 'attention_score', 'traditional', 'override', 'reason', 'components'):
+            assert got[key] == want[key], key
+        best = sorted(want['candidates'].values(), reverse=True)[:top_k]
+        assert sorted(got['candidates'].values(), reverse=True) == best
+        assert all(want['candidates'][pid] == score for pid, score in got['candidates'].items())
+
+
+@pytest.mark.parametrize("algorithm", ["FCFS", "Round Robin"])
+def test_spilled_log_round_trips(algorithm, tmp_path):
+    full = history(algorithm, [])
+    path = str(tmp_path / "spill.log")
+    log = history(algorithm, SelectionLog(capacity=7, top_k=3, spill_path=path))
+    assert log.spilled == len(full) - 7 and log.dropped == 0
+    assert len(log) == log.total == len(full)
+    same_decisions(list(log), full, 3)
+    same_decisions(log.recent(7), full[-7:], 3)
+    log.close()
+    same_decisions(list(read_log(path)), full[:-7], 3)
+
+
+def test_temporary_spill_file_is_removed():
+    log = history("SJF", SelectionLog(capacity=5, top_k=2))
+    path = log.spill_path
+    assert os.path.exists(path) and len(list(log)) == len(log) == log.total
+    log.close()
+    del log
+    gc.collect()
+    assert not os.path.exists(path)
+
+
+def test_without_spilling_the_oldest_rows_are_dropped():
+    full = history("SJF", [])
+    log = history("SJF", SelectionLog(capacity=5, top_k=2, spill=False))
+    assert log.spill_path is None
+    assert (len(log), log.dropped, log.total) == (5, len(full) - 5, len(full))
+    same_decisions(list(log), full[-5:], 2)
+
+
+def test_clear_forgets_everything(tmp_path):
+    log = history("FCFS", SelectionLog(capacity=4, spill_path=str(tmp_path / "spill.log")))
+    log.clear()
+    assert len(log) == log.total == log.overrides == 0
+    assert list(log) == []
+
+
+def test_pid_fields_are_never_truncated(tmp_path):
+    pid = "é" * (PID_WIDTH // 2)
+    assert decode_pid(encode_pid(pid, PID_WIDTH)) == pid
+    with pytest.raises(ValueError):
+        encode_pid(pid + "x", PID_WIDTH)
+
+    path = tmp_path / "w.csv"
+    path.write_text(f"pid,arrival,burst,priority\n{'p' * PID_WIDTH}1,0,1,1\n{'p' * PID_WIDTH}2,0,1,1\n")
+    with pytest.raises(WorkloadError, match=f"longer than {PID_WIDTH} bytes"):
+        load_workload(str(path))
@@ -0,0 +1,103 @@
+"""Binary traces: replayed state against a stepped engine."""
+
+import pytest
+
+import sim_trace
+from process import Process
+from scheduler import ALGORITHMS, SchedulerEngine
+from sim_trace import TraceReplay, TraceWriter
+from workload import synthetic_workload
+
+N = 25
+
+
+def specs(kind, seed=4):
+    return [(p.pid, p.arrival, p.burst, p.priority) for p in synthetic_workload(kind, N, seed)]
+
+
+def key(state):
+    return (state.pid, state.arrival, state.burst, state.priority, state.remaining, state.start,
+            state.executed_slices, state.last_executed)
+
+
+def stepped_states(algorithm, workload, quantum):
+    """t -> state at the end of time unit t, from unit-tick stepping"""
+    engine = SchedulerEngine(algorithm, [Process(*s) for s in workload], quantum)
+    states = {}
+    while not engine.finished:
+        t = engine.step()['time']
+        running = engine.current_process
+        states[t] = {
+            'ready': sorted(key(p.state()) for p in engine.ready),
+            'running': key(running.state()) if running else None,
+            'completed': engine.completed_count,
+            'gantt': [list(segment) for segment in engine.gantt],
+            'total_waiting': engine.total_waiting,
+        }
+    return states, engine.time
+
+
+@pytest.fixture
+def record(tmp_path, monkeypatch):
+    def record(algorithm, workload, quantum, event_driven, checkpoint_events):
+        monkeypatch.setattr(sim_trace, "CHECKPOINT_EVENTS", checkpoint_events)
+        path = str(tmp_path / f"{algorithm}.trace")
+        result = SchedulerEngine(algorithm, [Process(*s) for s in workload], quantum,
+                                 trace=TraceWriter(path)).run(event_driven)
+        return path, result
+    return record
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("event_driven, checkpoint_events", [(True, 3), (False, 1024)])
+def test_seek_matches_stepped_engine(record, algorithm, event_driven, checkpoint_events):
+    workload = specs("bursty")
+    path, result = record(algorithm, workload, 3, event_driven, checkpoint_events)
+    states, end = stepped_states(algorithm, workload, 3)
+    replay = TraceReplay(path)
+    try:
+        assert replay.algorithm == algorithm and replay.quantum == 3
+        assert replay.gantt == [list(segment) for segment in result['gantt']]
+        assert replay.final_time == end
+        # Seek backwards as well as forwards
+        for t in sorted(states, reverse=True):
+            want = states[t]
+            got = replay.snapshot(t)
+            assert sorted(key(p) for p in got['ready']) == want['ready'], t
+            assert (key(got['running']) if got['running'] else None) == want['running'], t
+            assert got['completed'] == want['completed']
+            assert [list(segment) for segment in got['gantt_tail']] == want['gantt']
+            if want['completed']:
+                assert got['avg_waiting'] * want['completed'] == pytest.approx(want['total_waiting'])
+            decision = got['decision']
+            if decision is not None:
+                assert decision['running'].pid in [entry['selected'] for entry in result['selection_history']
+                                                   if entry['time'] == decision['time']]
+    finally:
+        replay.close()
+
+
+def test_unfinished_trace_still_replays(record, tmp_path):
+    path, _ = record("Round Robin", specs("uniform"), 2, True, 4)
+    full = TraceReplay(path)
+    with open(path, "rb") as f:
+        data = f.read()
+    cut = str(tmp_path / "cut.trace")
+    with open(cut, "wb") as f:
+        f.write(data[:len(data) // 2 + 7])  # no index, and a partial last record
+    partial = TraceReplay(cut)
+    try:
+        t = partial.final_time // 2
+        a, b = full.snapshot(t), partial.snapshot(t)
+        for field in ('ready', 'running', 'completed', 'gantt_tail'):
+            assert a[field] == b[field]
+    finally:
+        full.close()
+        partial.close()
+
+
+def test_not_a_trace(tmp_path):
+    path = tmp_path / "junk.trace"
+    path.write_bytes(b"\0" * 200)
+    with pytest.raises(ValueError):
+        TraceReplay(str(path))
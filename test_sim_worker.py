@@ -0,0 +1,48 @@
+"""Background simulation thread: snapshots, pausing and stopping."""
+
+import time
+
+import pytest
+
+from scheduler import SchedulerEngine, simulate
+from sim_worker import SimulationWorker, frame_timing
+from workload import synthetic_workload
+
+N = 30
+
+
+def engine():
+    return SchedulerEngine("Round Robin", list(synthetic_workload("bursty", N, 2)), 2)
+
+
+def test_frame_timing():
+    assert frame_timing(1) == (600, 1)
+    assert frame_timing(100) == (33, 6)
+    assert frame_timing(None)[1] is None
+
+
+def test_max_speed_run_matches_headless_run():
+    worker = SimulationWorker(engine(), multiplier=None)
+    worker.start()
+    worker.join(30)
+    assert not worker.is_alive()
+    last = worker.latest()
+    expected = simulate("Round Robin", list(synthetic_workload("bursty", N, 2)))
+    assert last['finished'] and last['time'] == expected['makespan'] - 1
+    assert [tuple(s) for s in worker.engine.gantt] == expected['gantt']
+    assert last['avg_waiting'] == pytest.approx(expected['avg_waiting'])
+
+
+@pytest.mark.parametrize("paused", [False, True])
+def test_stop_ends_the_thread_promptly(paused):
+    worker = SimulationWorker(engine(), multiplier=1)
+    worker.start()
+    time.sleep(0.05)
+    if paused:
+        worker.pause()
+    started = time.perf_counter()
+    worker.stop()
+    worker.join(5)
+    assert not worker.is_alive()
+    assert time.perf_counter() - started < 1
+    assert not worker.engine.finished
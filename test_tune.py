@@ -0,0 +1,80 @@
+"""Attention weight tuner: search points, Pareto front and failed trials."""
+
+from math import comb
+
+import pytest
+
+from attention import FEATURE_NAMES
+from tune import OBJECTIVES, Tuner, coordinate_descent, grid_points, main, pareto_front
+
+WORKLOAD = "pid,arrival,burst,priority\nA,0,3,1\nB,1,2,0\nC,1,1,2\n"
+
+
+@pytest.mark.parametrize("steps", [1, 2, 4])
+def test_grid_points_cover_the_simplex(steps):
+    points = list(grid_points(steps))
+    n = len(FEATURE_NAMES)
+    assert len(points) == len(set(points)) == comb(steps + n - 1, n - 1)
+    for point in points:
+        assert len(point) == n
+        assert sum(point) == pytest.approx(1)
+        assert all((w * steps) == pytest.approx(round(w * steps)) for w in point)
+
+
+def row(waiting, turnaround, overrides):
+    return dict(zip(OBJECTIVES, (waiting, turnaround, overrides)))
+
+
+def dominates(a, b):
+    return all(a[o] <= b[o] for o in OBJECTIVES) and any(a[o] < b[o] for o in OBJECTIVES)
+
+
+def test_pareto_front_matches_pairwise_dominance():
+    rows = [row(w, t, o) for w in (1, 2, 3) for t in (3, 1, 2) for o in (0.5, 0.1)]
+    rows += [row(1, 1, 0.1), row(0.5, 4, 0.9)]
+    front = pareto_front(rows)
+    expected = [r for r in rows if not any(dominates(other, r) for other in rows)]
+    assert sorted(map(id, front)) == sorted(map(id, expected))
+    assert [r["avg_waiting"] for r in front] == sorted(r["avg_waiting"] for r in front)
+
+
+def test_pareto_front_keeps_duplicates():
+    rows = [row(1, 1, 0), row(1, 1, 0), row(2, 2, 1)]
+    assert pareto_front(rows) == rows[:2]
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    good = tmp_path / "good.csv"
+    good.write_text(WORKLOAD)
+    bad = tmp_path / "bad.csv"
+    bad.write_text("pid,arrival,burst,priority\nA,0,x,1\n")
+    return str(good), str(bad), str(tmp_path / "missing.csv")
+
+
+def test_failed_trials_skip_the_point_and_keep_progress(corpus, tmp_path):
+    good, bad, missing = corpus
+    cache = str(tmp_path / "cache.json")
+    tuner = Tuner([good], ["FCFS", "SJF"], max_workers=1, cache_path=cache)
+    assert len(tuner.evaluate([(1, 1, 1, 1), (1, 0, 0, 0)])) == 2
+
+    tuner = Tuner([good, bad, missing], ["FCFS"], max_workers=1, cache_path=cache)
+    assert tuner.evaluate([(1, 1, 1, 1)]) == []
+    assert set(tuner.errors) == {(bad, "FCFS"), (missing, "FCFS")}
+    assert len(Tuner([good], ["FCFS", "SJF"], cache_path=cache).cache) == 4
+    assert coordinate_descent(tuner) is None
+
+
+def test_failed_trials_are_reported(corpus, capsys):
+    good, bad, _ = corpus
+    with pytest.raises(SystemExit) as exit_info:
+        main([good, bad, "--algorithms", "FCFS", "--method", "grid", "--steps", "1", "--workers", "1"])
+    assert exit_info.value.code == 1
+    assert "bad.csv (FCFS)" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("option", ["--quantum", "--steps", "--workers"])
+def test_counts_below_one_are_usage_errors(corpus, option):
+    with pytest.raises(SystemExit) as exit_info:
+        main([corpus[0], option, "0"])
+    assert exit_info.value.code == 2
@@ -0,0 +1,51 @@
+"""Workload file parsing and validation."""
+
+import json
+
+import pytest
+
+from workload import WorkloadError, load_workload, parse_process, stream_workload
+
+
+def write_jsonl(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return str(path)
+
+
+def test_integer_strings_and_ints_are_accepted():
+    p = parse_process(" A ", " 3", 2, "0")
+    assert (p.pid, p.arrival, p.burst, p.priority) == ("A", 3, 2, 0)
+
+
+@pytest.mark.parametrize("arrival, burst, priority", [
+    (0.7, 2, 1), (0, 2.9, 1), (0, 2, 1.0), ("0.5", 2, 1), (True, 2, 1), (0, 0, 1), (-1, 2, 1),
+])
+def test_invalid_fields_are_rejected(arrival, burst, priority):
+    with pytest.raises(ValueError):
+        parse_process("A", arrival, burst, priority)
+
+
+def test_jsonl_floats_are_not_truncated(tmp_path):
+    path = write_jsonl(tmp_path / "w.jsonl", [
+        {"pid": "A", "arrival": 0, "burst": 3, "priority": 1},
+        {"pid": "B", "arrival": 0.7, "burst": 2.9, "priority": 0},
+    ])
+    with pytest.raises(WorkloadError, match=r"w.jsonl:2: invalid values for PID 'B'"):
+        load_workload(path)
+
+
+def test_csv_and_jsonl_load_the_same_processes(tmp_path):
+    records = [{"pid": "A", "arrival": 0, "burst": 3, "priority": 1},
+               {"pid": "B", "arrival": 2, "burst": 1, "priority": 0}]
+    csv_path = tmp_path / "w.csv"
+    csv_path.write_text("pid,arrival,burst,priority\nA,0,3,1\nB,2,1,0\n")
+    fields = lambda procs: [(p.pid, p.arrival, p.burst, p.priority) for p in procs]
+    assert fields(load_workload(str(csv_path))) == fields(load_workload(write_jsonl(tmp_path / "w.jsonl", records)))
+
+
+def test_streaming_requires_arrival_order(tmp_path):
+    path = tmp_path / "w.csv"
+    path.write_text("pid,arrival,burst,priority\nA,5,3,1\nB,2,1,0\n")
+    with pytest.raises(WorkloadError, match="before the previous process"):
+        list(stream_workload(str(path)))
+    assert [p.pid for p in load_workload(str(path))] == ["A", "B"]
@@ -0,0 +1,280 @@
+"""Attention weight tuner.
+
+Searches the attention weights (recency, burst, fairness, priority) for a
+workload corpus by grid, random or coordinate-descent search. Scaling every
+weight by the same factor never changes a decision, so candidates are
+points on the simplex (weights summing to 1). Each candidate runs every
+workload under every base algorithm headlessly, in parallel. Results are
+cached per (weights, workload hash, algorithm, quantum), optionally in a
+JSON file, so a rerun or a refined search only simulates new points. The
+output is every candidate with its averages, flagged when it is on the
+Pareto front of average waiting, average turnaround and override rate.
+"""
+
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from attention import DEFAULT_POLICY, FEATURE_NAMES, ScoringPolicy
+from main import positive_int
+from scheduler import ALGORITHMS, simulate
+from workload import load_workload
+
+METHODS = ["grid", "random", "coordinate"]
+OBJECTIVES = ["avg_waiting", "avg_turnaround", "override_rate"]
+RESULT_FIELDS = FEATURE_NAMES + OBJECTIVES + ["pareto"]
+PRECISION = 4  # decimals weights are rounded to, so equal points share a cache entry
+
+
+def normalize(weights):
+    """Scale weights to sum to 1 (the same decisions), rounded to PRECISION"""
+    total = sum(weights)
+    if total <= 0:
+        raise ValueError("at least one weight must be positive")
+    return tuple(round(w / total, PRECISION) for w in weights)
+
+
+def workload_hash(path):
+    """Content hash of a workload file, so a renamed file still hits the cache"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def _digest(path):
+    # An unreadable file gets no digest; its trials then fail and report why
+    try:
+        return workload_hash(path)
+    except OSError:
+        return None
+
+
+def cache_key(weights, digest, algorithm, quantum):
+    return f"{','.join(map(repr, weights))}|{digest}|{algorithm}|{quantum}"
+
+
+# -----------------------------
+# Evaluation
+# -----------------------------
+def run_trial(task):
+    """Simulate one (weights, workload, algorithm, quantum) task.
+
+    A workload that cannot be read or parsed, or settings the engine
+    rejects, give {"error": message} instead of raising.
+    """
+    weights, path, algorithm, quantum = task
+    try:
+        result = simulate(algorithm, load_workload(path), quantum, keep_details=False,
+                          policy=ScoringPolicy("tuned", *weights))
+    except (OSError, ValueError) as e:  # WorkloadError is a ValueError
+        return {"error": str(e)}
+    return {
+        "avg_waiting": result['avg_waiting'],
+        "avg_turnaround": result['avg_turnaround'],
+        "decisions": result['decisions'],
+        "overrides": result['overrides'],
+    }
+
+
+class Tuner:
+    def __init__(self, paths, algorithms=ALGORITHMS, quantum=2, max_workers=None, cache_path=None):
+        self.paths = list(paths)
+        self.digests = [_digest(path) for path in self.paths]
+        self.algorithms = list(algorithms)
+        self.quantum = quantum
+        self.max_workers = max_workers
+        self.cache_path = cache_path
+        self.cache = {}
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path) as f:
+                self.cache = json.load(f)
+        self.evaluated = {}  # weights -> summary row, in evaluation order
+        self.errors = {}     # (workload, algorithm) -> why its trials failed
+
+    def _tasks(self, weights):
+        for path, digest in zip(self.paths, self.digests):
+            for algorithm in self.algorithms:
+                yield cache_key(weights, digest, algorithm, self.quantum), (weights, path, algorithm, self.quantum)
+
+    def evaluate(self, candidates):
+        """Summary rows for candidates, simulating only the uncached trials in parallel.
+
+        Failed trials are recorded in errors rather than cached, and a
+        candidate with a failed trial gets no row.
+        """
+        candidates = list(dict.fromkeys(normalize(w) for w in candidates))
+        pending = {}
+        for weights in candidates:
+            for key, task in self._tasks(weights):
+                if key not in self.cache and task[1:3] not in self.errors:
+                    pending[key] = task
+        if pending:
+            workers = self.max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(pending) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                for key, trial in zip(pending, pool.map(run_trial, pending.values(), chunksize=chunksize)):
+                    if "error" in trial:
+                        _, path, algorithm, _ = pending[key]
+                        self.errors[path, algorithm] = trial["error"]
+                    else:
+                        self.cache[key] = trial
+            self.save()
+        rows = (self.summarize(weights) for weights in candidates)
+        return [row for row in rows if row is not None]
+
+    def summarize(self, weights):
+        """Corpus averages for one point: each workload and algorithm counts equally.
+
+        None when any of the point's trials failed.
+        """
+        trials = [self.cache.get(key) for key, _ in self._tasks(weights)]
+        if None in trials:
+            return None
+        decisions = sum(t["decisions"] for t in trials)
+        row = dict(zip(FEATURE_NAMES, weights))
+        row["avg_waiting"] = sum(t["avg_waiting"] for t in trials) / len(trials)
+        row["avg_turnaround"] = sum(t["avg_turnaround"] for t in trials) / len(trials)
+        row["override_rate"] = sum(t["overrides"] for t in trials) / decisions if decisions else 0.0
+        self.evaluated[weights] = row
+        return row
+
+    def save(self):
+        if self.cache_path:
+            with open(self.cache_path, "w") as f:
+                json.dump(self.cache, f)
+
+    def rows(self):
+        """Every evaluated point, flagged with its Pareto membership"""
+        rows = list(self.evaluated.values())
+        front = {id(row) for row in pareto_front(rows)}
+        for row in rows:
+            row["pareto"] = id(row) in front
+        return rows
+
+
+# -----------------------------
+# Search
+# -----------------------------
+def grid_points(steps):
+    """Every point of the simplex whose weights are multiples of 1/steps"""
+    n = len(FEATURE_NAMES)
+    for cut in itertools.combinations(range(steps + n - 1), n - 1):
+        bounds = (-1,) + cut + (steps + n - 1,)
+        yield tuple((bounds[i + 1] - bounds[i] - 1) / steps for i in range(n))
+
+
+def random_points(samples, seed=0):
+    """Uniform samples from the simplex"""
+    rng = random.Random(seed)
+    for _ in range(samples):
+        yield tuple(rng.expovariate(1.0) for _ in FEATURE_NAMES)
+
+
+def grid_search(tuner, steps=4):
+    return tuner.evaluate(p for p in grid_points(steps) if any(p))
+
+
+def random_search(tuner, samples=64, seed=0):
+    return tuner.evaluate(random_points(samples, seed))
+
+
+def coordinate_descent(tuner, objective="avg_waiting", start=DEFAULT_POLICY.vector, step=0.2,
+                       min_step=0.0125, max_rounds=50):
+    """Move one weight at a time, up or down by step, toward a lower objective.
+
+    All moves of a round are evaluated together, so they run in parallel. The
+    step halves whenever no move improves on the current point. None when
+    the start point cannot be evaluated.
+    """
+    evaluated = tuner.evaluate([start])
+    if not evaluated:
+        return None
+    best = evaluated[0]
+    for _ in range(max_rounds):
+        if step < min_step:
+            break
+        current = [best[name] for name in FEATURE_NAMES]
+        moves = []
+        for i in range(len(current)):
+            for delta in (step, -step):
+                moved = list(current)
+                moved[i] = max(0.0, moved[i] + delta)
+                if any(moved):
+                    moves.append(moved)
+        candidate = min(tuner.evaluate(moves), key=lambda row: row[objective], default=None)
+        if candidate is not None and candidate[objective] < best[objective]:
+            best = candidate
+        else:
+            step /= 2
+    return best
+
+
+def pareto_front(rows, objectives=OBJECTIVES):
+    """Rows not dominated on objectives (all minimized), in order of the first objective"""
+    front = []
+    for row in sorted(rows, key=lambda r: tuple(r[o] for o in objectives)):
+        if not any(all(other[o] <= row[o] for o in objectives) and any(other[o] < row[o] for o in objectives)
+                   for other in front):
+            front.append(row)
+    return front
+
+
+def write_results(rows, out):
+    writer = csv.DictWriter(out, fieldnames=RESULT_FIELDS)
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tune the attention weights on a workload corpus")
+    parser.add_argument("workloads", nargs="+", help="CSV or JSONL workload files")
+    parser.add_argument("--method", default="coordinate", choices=METHODS)
+    parser.add_argument("--algorithms", nargs="+", default=ALGORITHMS, choices=ALGORITHMS)
+    parser.add_argument("--quantum", type=positive_int, default=2, help="Round Robin quantum")
+    parser.add_argument("--steps", type=positive_int, default=4, help="grid divisions per weight")
+    parser.add_argument("--samples", type=int, default=64, help="random search points")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--objective", default="avg_waiting", choices=OBJECTIVES,
+                        help="metric coordinate descent minimizes")
+    parser.add_argument("--workers", type=positive_int, default=None)
+    parser.add_argument("--cache", help="JSON file of earlier trial results, reused and extended")
+    parser.add_argument("--output", help="results CSV (default: stdout)")
+    parser.add_argument("--front-only", action="store_true", help="only write the Pareto front")
+    args = parser.parse_args(argv)
+
+    tuner = Tuner(args.workloads, args.algorithms, args.quantum, args.workers, args.cache)
+    if args.method == "grid":
+        grid_search(tuner, args.steps)
+    elif args.method == "random":
+        random_search(tuner, args.samples, args.seed)
+    else:
+        best = coordinate_descent(tuner, args.objective)
+        if best is not None:
+            print(f"best {args.objective}: {best[args.objective]:.3f} at "
+                  + ", ".join(f"{name}={best[name]}" for name in FEATURE_NAMES), file=sys.stderr)
+
+    rows = tuner.rows()
+    if args.front_only:
+        rows = [row for row in rows if row["pareto"]]
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            write_results(rows, f)
+    else:
+        write_results(rows, sys.stdout)
+
+    for (path, algorithm), error in tuner.errors.items():
+        print(f"{path} ({algorithm}): {error}", file=sys.stderr)
+    if tuner.errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Workload files.
+
+A workload is a list of (pid, arrival, burst, priority) records stored as CSV
+(with a header row) or JSON Lines (one object per line). Records are read
+one at a time, so a trace can be fed to the engine as it is simulated
+without ever holding the whole file in memory. Synthetic workloads for
+benchmarks are generated the same way.
+"""
+
+import csv
+import json
+import os
+import random
+
+from process import Process
+from selection_log import PID_WIDTH
+
+FIELDS = ["pid", "arrival", "burst", "priority"]
+
+
+class WorkloadError(ValueError):
+    pass
+
+
+def _integer(value):
+    # Only ints and integer strings; int() would silently truncate a JSON float
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    raise ValueError(f"{value!r} is not an integer")
+
+
+def parse_process(pid, arrival, burst, priority):
+    """Build a Process from raw field values.
+
+    Same rules as the Add Processes dialog: integer fields, non-negative
+    arrival and priority, positive burst, and a PID that fits the PID_WIDTH
+    bytes the selection log and traces store. Raises ValueError otherwise.
+    """
+    pid = str(pid).strip()
+    if len(pid.encode("utf-8")) > PID_WIDTH:
+        raise ValueError(f"PID is longer than {PID_WIDTH} bytes")
+    arr = _integer(arrival)
+    bur = _integer(burst)
+    pri = _integer(priority)
+    if arr < 0 or bur <= 0 or pri < 0:
+        raise ValueError("arrival and priority must be non-negative and burst positive")
+    return Process(pid, arr, bur, pri)
+
+
+def iter_records(path):
+    """(line number, record dict) pairs from a CSV or JSONL workload file"""
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, newline="") as f:
+        if ext in (".jsonl", ".json", ".ndjson"):
+            for line_no, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        raise WorkloadError(f"{path}:{line_no}: invalid JSON ({e.msg})")
+                    if not isinstance(record, dict):
+                        raise WorkloadError(f"{path}:{line_no}: expected a JSON object")
+                    yield line_no, record
+        else:
+            reader = csv.DictReader(f)
+            for record in reader:
+                yield reader.line_num, record
+
+
+def stream_workload(path, require_sorted=True):
+    """Validated processes from a workload file, yielded one at a time.
+
+    With require_sorted the file must list processes in non-decreasing
+    arrival order, which is what lets the engine consume it lazily. Only the
+    set of PIDs seen so far is kept, to reject duplicates.
+    """
+    seen_pids = set()
+    last_arrival = None
+
+    for line_no, record in iter_records(path):
+        values = [record.get(field) for field in FIELDS]
+        if any(value is None or str(value).strip() == "" for value in values):
+            raise WorkloadError(
+                f"{path}:{line_no}: each process must have PID, Arrival Time, Burst Time, and Priority filled"
+            )
+
+        pid = str(values[0]).strip()
+        if pid in seen_pids:
+            raise WorkloadError(f"{path}:{line_no}: duplicate PID '{pid}'")
+
+        try:
+            p = parse_process(*values)
+        except ValueError as e:
+            detail = f" ({e})" if str(e) else ""
+            raise WorkloadError(f"{path}:{line_no}: invalid values for PID '{pid}'{detail}")
+
+        if require_sorted and last_arrival is not None and p.arrival < last_arrival:
+            raise WorkloadError(
+                f"{path}:{line_no}: PID '{pid}' arrives at {p.arrival}, before the previous process ({last_arrival})"
+            )
+
+        seen_pids.add(pid)
+        last_arrival = p.arrival
+        yield p
+
+
+def load_workload(path):
+    """All processes described by a workload file, in any arrival order"""
+    return list(stream_workload(path, require_sorted=False))
+
+
+# -----------------------------
+# Synthetic workloads
+# -----------------------------
+SYNTHETIC_KINDS = ["uniform", "bursty", "heavy_tailed", "equal_priority"]
+SYNTHETIC_LOAD = 0.9  # mean burst / mean inter-arrival gap
+
+
+def synthetic_workload(kind, n, seed=0):
+    """n generated processes in arrival order, as a lazy iterator.
+
+    uniform:        bursts 1-10, priorities 0-9, evenly spread arrivals
+    bursty:         the same processes arriving in clumps with idle gaps
+    heavy_tailed:   Pareto-distributed bursts (a few very long jobs)
+    equal_priority: every process shares one priority, stressing ties
+    """
+    if kind not in SYNTHETIC_KINDS:
+        raise ValueError(f"unknown workload kind '{kind}'")
+    rng = random.Random(seed)
+    clock = 0.0
+    clump = 0
+    for i in range(n):
+        if kind == "heavy_tailed":
+            burst = min(int(rng.paretovariate(1.5)), 1000)
+            mean_burst = 3.0
+        else:
+            burst = rng.randint(1, 10)
+            mean_burst = 5.5
+        priority = 0 if kind == "equal_priority" else rng.randint(0, 9)
+
+        if kind == "bursty":
+            # Clumps of ~20 processes share an arrival time
+            if clump == 0:
+                clump = rng.randint(1, 40)
+                clock += rng.expovariate(SYNTHETIC_LOAD / (mean_burst * 20))
+            clump -= 1
+        else:
+            clock += rng.expovariate(SYNTHETIC_LOAD / mean_burst)
+        yield Process(str(i), int(clock), burst, priority)